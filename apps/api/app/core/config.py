@@ -38,6 +38,7 @@ class Settings(BaseSettings):
     minio_apps_bucket: str = "apps"
     minio_trash_bucket: str = "trash"
     minio_teachers_bucket: str = "teachers"
+    minio_upload_concurrency: int = 8  # parallel object uploads per save
     trash_retention_days: int = 7
 
     # Teacher storage configuration
@@ -73,6 +74,16 @@ class Settings(BaseSettings):
     tts_timeout_seconds: int = 30
     tts_max_retries: int = 3
     tts_batch_concurrency: int = 5
+    tts_retry_initial_backoff_seconds: float = 1.0  # first retry delay
+    tts_retry_max_backoff_seconds: float = 16.0  # cap for exponential backoff
+    tts_retry_backoff_multiplier: float = 2.0  # growth factor per attempt
+    tts_retry_jitter: bool = True  # randomize delays so retries do not align
+    tts_warmup_on_startup: bool = False  # pre-connect TTS providers at app startup
+    tts_cache_size: int = 0  # opt-in LRU of whole audio responses per process
+    tts_circuit_breaker_threshold: int = 5  # failed calls before skipping (0 disables)
+    tts_circuit_breaker_cooldown_seconds: float = 30.0  # skip time before a probe
+    azure_tts_credits_per_period: int = 0  # Azure characters per period (0 disables)
+    azure_tts_period_seconds: float = 60.0  # window for azure_tts_credits_per_period
 
     # Queue Configuration (Redis/arq)
     redis_url: str = "redis://localhost:6379"
@@ -105,12 +116,30 @@ class Settings(BaseSettings):
     topic_analysis_max_grammar_points: int = 10  # max grammar points per module
     topic_analysis_temperature: float = 0.3  # LLM temperature for analysis
     topic_analysis_max_text_length: int = 8000  # max chars to send to LLM
+    topic_analysis_cache_modules: bool = False  # cache fetched module JSON in memory
+    topic_analysis_cache_max_entries: int = 256  # max module JSON files to cache
+    topic_analysis_cache_ttl_seconds: int = 60  # seconds before a cached module expires
 
     # Vocabulary Extraction Configuration
     vocabulary_max_words_per_module: int = 200  # max vocabulary words per module
     vocabulary_min_word_length: int = 3  # min word length to include
     vocabulary_temperature: float = 0.3  # LLM temperature for extraction
     vocabulary_max_text_length: int = 8000  # max chars to send to LLM
+    vocabulary_cache_size: int = 0  # cached LLM responses (0 disables)
+    vocabulary_concurrency: int = 5  # concurrent module LLM calls per book
+
+    # Unified Analysis Configuration
+    unified_analysis_concurrency: int = 5  # concurrent Phase 2 LLM calls per book
+    unified_analysis_cache_size: int = 0  # cached Phase 1/2 LLM results (0 disables)
+    unified_analysis_state_dir: str = ""  # resumable chunked state dir (empty disables)
+    unified_analysis_state_max_age_hours: int = 48  # prune abandoned resume state
+    unified_analysis_phase1_model: str = ""  # module detection model (empty = default)
+    unified_analysis_phase2_model: str = ""  # vocabulary model (empty = default)
+    unified_analysis_min_module_chars: int = 500  # skip Phase 2 for shorter modules
+    unified_analysis_pretty_json: bool = False  # indent stored result JSON
+    unified_analysis_module_bundle: bool = True  # also store modules as one tar
+    unified_analysis_vocab_id_format: str = "string"  # "string", "int" or "none"
+    unified_analysis_write_vocabulary: bool = True  # aggregate vocabulary.json
 
     # Audio Generation Configuration
     audio_generation_concurrency: int = 5  # concurrent TTS requests for batch
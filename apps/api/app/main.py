@@ -23,6 +23,8 @@ from app.routers import (
     webhooks,
 )
 from app.services import ensure_buckets, get_minio_client
+from app.services.llm import close_llm_service
+from app.services.tts import close_tts_service, get_tts_service
 from app.monitoring import MetricsMiddleware, router as monitoring_router
 from app.db import SessionLocal
 from app.repositories.user import UserRepository
@@ -97,7 +99,11 @@ def ensure_default_admin() -> None:
 async def lifespan(app: FastAPI):
     await wait_for_minio()
     ensure_default_admin()
+    if settings.tts_warmup_on_startup:
+        await get_tts_service().warmup()
     yield
+    await close_tts_service()
+    await close_llm_service()
 
 
 app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
@@ -15,12 +15,17 @@ from app.services.llm.base import (
 )
 from app.services.llm.deepseek import DeepSeekProvider
 from app.services.llm.gemini import GeminiProvider
-from app.services.llm.service import LLMService, get_llm_service
+from app.services.llm.service import (
+    LLMService,
+    close_llm_service,
+    get_llm_service,
+)
 
 __all__ = [
     # Service
     "LLMService",
     "get_llm_service",
+    "close_llm_service",
     # Providers
     "LLMProvider",
     "LLMProviderType",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -107,6 +108,7 @@ class LLMRequest:
     temperature: float = 0.7
     top_p: float | None = None
     stop: list[str] | None = None
+    json_mode: bool = False  # Constrain the response to a JSON object
 
     @classmethod
     def from_prompt(
@@ -173,6 +175,25 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def stream_complete(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Generate a completion and yield text chunks as they arrive.
+
+        The default implementation yields the whole completion as a single
+        chunk; providers with a streaming API override it.
+
+        Args:
+            request: The LLM request containing messages and parameters.
+
+        Yields:
+            Generated text chunks.
+
+        Raises:
+            LLMProviderError: If the request fails.
+        """
+        response = await self.complete(request)
+        yield response.content
+
     @abstractmethod
     async def chat(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
         """
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -44,6 +47,7 @@ class DeepSeekProvider(LLMProvider):
         default_model: str | None = None,
         timeout: float = 60.0,
         max_retries: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """
         Initialize DeepSeek provider.
@@ -53,11 +57,44 @@ class DeepSeekProvider(LLMProvider):
             default_model: Default model to use if not specified in requests.
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for transient errors.
+            client: Shared HTTP client; one is created lazily if not given.
         """
         self.api_key = api_key
         self.default_model = default_model or self.DEFAULT_MODEL
         self.timeout = timeout
         self.max_retries = max_retries
+        self._client = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client shared by all requests.
+
+        Reusing one client keeps connections to DeepSeek alive between
+        requests instead of paying a TLS handshake per completion. HTTP/2
+        lets concurrent requests share a single connection as multiplexed
+        streams.
+
+        Returns:
+            Shared HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+
+        A client passed in by the caller is left for the caller to close.
+        """
+        if self._client is not None and self._owns_client:
+            client, self._client = self._client, None
+            await asyncio.shield(client.aclose())
 
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -70,6 +107,66 @@ class DeepSeekProvider(LLMProvider):
         """Convert LLMMessage objects to API format."""
         return [{"role": msg.role, "content": msg.content} for msg in messages]
 
+    def _raise_for_status(self, response: httpx.Response, model: str) -> None:
+        """
+        Raise the matching LLM error for a failed API response.
+
+        Args:
+            response: HTTP response; its body must already be read.
+            model: Model the request was sent to.
+
+        Raises:
+            LLMProviderError: If the response status indicates an error.
+        """
+        if response.status_code == 401:
+            raise LLMAuthError(
+                provider=self.provider_name,
+                details={"status_code": 401, "response": response.text},
+            )
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise LLMRateLimitError(
+                provider=self.provider_name,
+                retry_after=float(retry_after) if retry_after else None,
+                details={"response": response.text},
+            )
+
+        if response.status_code == 404:
+            raise LLMModelNotFoundError(
+                provider=self.provider_name,
+                model=model,
+                details={"response": response.text},
+            )
+
+        if response.status_code >= 400:
+            raise LLMProviderError(
+                message=f"API error: {response.status_code}",
+                provider=self.provider_name,
+                details={
+                    "status_code": response.status_code,
+                    "response": response.text,
+                },
+            )
+
+    def _build_payload(self, request: LLMRequest, model: str) -> dict[str, Any]:
+        """Build the chat completions payload for a request."""
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": self._convert_messages(request.messages),
+            "temperature": request.temperature,
+        }
+
+        if request.max_tokens:
+            payload["max_tokens"] = request.max_tokens
+        if request.top_p is not None:
+            payload["top_p"] = request.top_p
+        if request.stop:
+            payload["stop"] = request.stop
+        if request.json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return payload
+
     async def _make_request(
         self,
         endpoint: str,
@@ -90,57 +187,27 @@ class DeepSeekProvider(LLMProvider):
         """
         url = f"{self.BASE_URL}/{endpoint}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                )
-
-                if response.status_code == 401:
-                    raise LLMAuthError(
-                        provider=self.provider_name,
-                        details={"status_code": 401, "response": response.text},
-                    )
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    raise LLMRateLimitError(
-                        provider=self.provider_name,
-                        retry_after=float(retry_after) if retry_after else None,
-                        details={"response": response.text},
-                    )
-
-                if response.status_code == 404:
-                    raise LLMModelNotFoundError(
-                        provider=self.provider_name,
-                        model=payload.get("model", "unknown"),
-                        details={"response": response.text},
-                    )
-
-                if response.status_code >= 400:
-                    raise LLMProviderError(
-                        message=f"API error: {response.status_code}",
-                        provider=self.provider_name,
-                        details={
-                            "status_code": response.status_code,
-                            "response": response.text,
-                        },
-                    )
-
-                return response.json()
-
-            except httpx.ConnectError as e:
-                raise LLMConnectionError(
-                    provider=self.provider_name,
-                    details={"error": str(e)},
-                ) from e
-            except httpx.TimeoutException as e:
-                raise LLMConnectionError(
-                    provider=self.provider_name,
-                    details={"error": f"Request timeout: {e}"},
-                ) from e
+        client = self._get_client()
+        try:
+            response = await client.post(
+                url,
+                json=payload,
+                headers=self._get_headers(),
+            )
+
+            self._raise_for_status(response, payload.get("model", "unknown"))
+            return response.json()
+
+        except httpx.ConnectError as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
+        except httpx.TimeoutException as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
 
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """
@@ -153,19 +220,7 @@ class DeepSeekProvider(LLMProvider):
             LLMResponse with the generated content and usage stats.
         """
         model = request.model or self.default_model
-
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": self._convert_messages(request.messages),
-            "temperature": request.temperature,
-        }
-
-        if request.max_tokens:
-            payload["max_tokens"] = request.max_tokens
-        if request.top_p is not None:
-            payload["top_p"] = request.top_p
-        if request.stop:
-            payload["stop"] = request.stop
+        payload = self._build_payload(request, model)
 
         logger.debug(f"[DeepSeek] Sending request to model {model}")
 
@@ -200,6 +255,74 @@ class DeepSeekProvider(LLMProvider):
             raw_response=response_data,
         )
 
+    async def stream_complete(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Generate a completion and yield text chunks as they arrive.
+
+        Args:
+            request: The LLM request containing messages and parameters.
+
+        Yields:
+            Generated text chunks.
+
+        Raises:
+            LLMProviderError: If the request fails.
+        """
+        model = request.model or self.default_model
+        payload = self._build_payload(request, model)
+        payload["stream"] = True
+        url = f"{self.BASE_URL}/chat/completions"
+
+        logger.debug(f"[DeepSeek] Streaming request to model {model}")
+
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST", url, json=payload, headers=self._get_headers()
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response, model)
+
+                # Server-sent events: "data: {chunk}" lines, ending in [DONE]
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data:
+                        continue  # Keep-alive
+                    if data == "[DONE]":
+                        break
+                    try:
+                        choices = json.loads(data).get("choices") or []
+                        delta = (choices[0].get("delta") or {}) if choices else {}
+                        text = delta.get("content")
+                    except (
+                        json.JSONDecodeError,
+                        AttributeError,
+                        IndexError,
+                        KeyError,
+                        TypeError,
+                    ) as e:
+                        raise LLMProviderError(
+                            message=f"Malformed stream chunk: {e}",
+                            provider=self.provider_name,
+                            details={"chunk": data[:200]},
+                        ) from e
+                    if text:
+                        yield text
+
+        except httpx.ConnectError as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
+        except httpx.TimeoutException as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
+
     async def chat(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
         """
         Convenience method for chat completions.
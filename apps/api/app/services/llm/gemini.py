@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -52,6 +55,7 @@ class GeminiProvider(LLMProvider):
         vision_model: str | None = None,
         timeout: float = 60.0,
         max_retries: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """
         Initialize Gemini provider.
@@ -62,12 +66,45 @@ class GeminiProvider(LLMProvider):
             vision_model: Model to use for vision requests.
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for transient errors.
+            client: Shared HTTP client; one is created lazily if not given.
         """
         self.api_key = api_key
         self.default_model = default_model or self.DEFAULT_MODEL
         self.vision_model = vision_model or self.DEFAULT_VISION_MODEL
         self.timeout = timeout
         self.max_retries = max_retries
+        self._client = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client shared by all requests.
+
+        Reusing one client keeps connections to Gemini alive between
+        requests instead of paying a TLS handshake per completion. HTTP/2
+        lets concurrent requests share a single connection as multiplexed
+        streams.
+
+        Returns:
+            Shared HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+
+        A client passed in by the caller is left for the caller to close.
+        """
+        if self._client is not None and self._owns_client:
+            client, self._client = self._client, None
+            await asyncio.shield(client.aclose())
 
     def _convert_messages_to_contents(
         self, messages: list[LLMMessage]
@@ -122,90 +159,57 @@ class GeminiProvider(LLMProvider):
         # Default to JPEG
         return "image/jpeg"
 
-    async def _make_request(
-        self,
-        model: str,
-        payload: dict[str, Any],
-    ) -> dict[str, Any]:
+    def _raise_for_status(self, response: httpx.Response, model: str) -> None:
         """
-        Make an API request to Gemini.
+        Raise the matching LLM error for a failed API response.
 
         Args:
-            model: Model name to use.
-            payload: Request payload.
-
-        Returns:
-            API response as dictionary.
+            response: HTTP response; its body must already be read.
+            model: Model the request was sent to.
 
         Raises:
-            LLMProviderError: If request fails.
+            LLMProviderError: If the response status indicates an error.
         """
-        url = f"{self.BASE_URL}/models/{model}:generateContent?key={self.api_key}"
+        if response.status_code == 401 or response.status_code == 403:
+            raise LLMAuthError(
+                provider=self.provider_name,
+                details={
+                    "status_code": response.status_code,
+                    "response": response.text,
+                },
+            )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-
-                if response.status_code == 401 or response.status_code == 403:
-                    raise LLMAuthError(
-                        provider=self.provider_name,
-                        details={
-                            "status_code": response.status_code,
-                            "response": response.text,
-                        },
-                    )
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    raise LLMRateLimitError(
-                        provider=self.provider_name,
-                        retry_after=float(retry_after) if retry_after else None,
-                        details={"response": response.text},
-                    )
-
-                if response.status_code == 404:
-                    raise LLMModelNotFoundError(
-                        provider=self.provider_name,
-                        model=model,
-                        details={"response": response.text},
-                    )
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise LLMRateLimitError(
+                provider=self.provider_name,
+                retry_after=float(retry_after) if retry_after else None,
+                details={"response": response.text},
+            )
 
-                if response.status_code >= 400:
-                    raise LLMProviderError(
-                        message=f"API error: {response.status_code}",
-                        provider=self.provider_name,
-                        details={
-                            "status_code": response.status_code,
-                            "response": response.text,
-                        },
-                    )
-
-                return response.json()
-
-            except httpx.ConnectError as e:
-                raise LLMConnectionError(
-                    provider=self.provider_name,
-                    details={"error": str(e)},
-                ) from e
-            except httpx.TimeoutException as e:
-                raise LLMConnectionError(
-                    provider=self.provider_name,
-                    details={"error": f"Request timeout: {e}"},
-                ) from e
+        if response.status_code == 404:
+            raise LLMModelNotFoundError(
+                provider=self.provider_name,
+                model=model,
+                details={"response": response.text},
+            )
 
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """
-        Generate a completion for the given request.
+        if response.status_code >= 400:
+            raise LLMProviderError(
+                message=f"API error: {response.status_code}",
+                provider=self.provider_name,
+                details={
+                    "status_code": response.status_code,
+                    "response": response.text,
+                },
+            )
 
-        Args:
-            request: The LLM request containing messages and parameters.
+    def _build_payload(self, request: LLMRequest) -> tuple[str, dict[str, Any]]:
+        """
+        Build the generateContent payload for a request.
 
         Returns:
-            LLMResponse with the generated content and usage stats.
+            Tuple of (model name, payload).
         """
         # Check if any message has images - use vision model if so
         has_images = any(msg.images for msg in request.messages)
@@ -230,8 +234,65 @@ class GeminiProvider(LLMProvider):
             payload["generationConfig"]["topP"] = request.top_p
         if request.stop:
             payload["generationConfig"]["stopSequences"] = request.stop
+        if request.json_mode:
+            payload["generationConfig"]["responseMimeType"] = "application/json"
         if system_instruction:
             payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+        return model, payload
+
+    async def _make_request(
+        self,
+        model: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Make an API request to Gemini.
+
+        Args:
+            model: Model name to use.
+            payload: Request payload.
+
+        Returns:
+            API response as dictionary.
+
+        Raises:
+            LLMProviderError: If request fails.
+        """
+        url = f"{self.BASE_URL}/models/{model}:generateContent?key={self.api_key}"
+
+        client = self._get_client()
+        try:
+            response = await client.post(
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            )
+
+            self._raise_for_status(response, model)
+            return response.json()
+
+        except httpx.ConnectError as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
+        except httpx.TimeoutException as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate a completion for the given request.
+
+        Args:
+            request: The LLM request containing messages and parameters.
+
+        Returns:
+            LLMResponse with the generated content and usage stats.
+        """
+        model, payload = self._build_payload(request)
 
         logger.debug(f"[Gemini] Sending request to model {model}")
 
@@ -275,6 +336,78 @@ class GeminiProvider(LLMProvider):
             raw_response=response_data,
         )
 
+    async def stream_complete(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Generate a completion and yield text chunks as they arrive.
+
+        Args:
+            request: The LLM request containing messages and parameters.
+
+        Yields:
+            Generated text chunks.
+
+        Raises:
+            LLMProviderError: If the request fails.
+        """
+        model, payload = self._build_payload(request)
+        url = (
+            f"{self.BASE_URL}/models/{model}:streamGenerateContent"
+            f"?alt=sse&key={self.api_key}"
+        )
+
+        logger.debug(f"[Gemini] Streaming request to model {model}")
+
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST",
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response, model)
+
+                # Server-sent events: one partial response per "data:" line
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data:
+                        continue  # Keep-alive
+                    try:
+                        candidates = json.loads(data).get("candidates") or []
+                        if not candidates:
+                            continue
+                        parts = candidates[0].get("content", {}).get("parts", [])
+                        text = "".join(part.get("text", "") for part in parts)
+                    except (
+                        json.JSONDecodeError,
+                        AttributeError,
+                        IndexError,
+                        KeyError,
+                        TypeError,
+                    ) as e:
+                        raise LLMProviderError(
+                            message=f"Malformed stream chunk: {e}",
+                            provider=self.provider_name,
+                            details={"chunk": data[:200]},
+                        ) from e
+                    if text:
+                        yield text
+
+        except httpx.ConnectError as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
+        except httpx.TimeoutException as e:
+            raise LLMConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
+
     async def chat(self, messages: list[LLMMessage], **kwargs: Any) -> LLMResponse:
         """
         Convenience method for chat completions.
@@ -4,8 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
+import httpx
+
 from app.core.config import get_settings
 from app.services.llm.base import (
     LLMMessage,
@@ -24,6 +28,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Exponential backoff between retries, in seconds
+BACKOFF_TIMES = (1, 2, 4, 8, 16)
+
 
 class LLMService:
     """
@@ -54,6 +61,39 @@ class LLMService:
         self._primary_provider = primary_provider
         self._fallback_provider = fallback_provider
         self._providers: dict[str, LLMProvider] = {}
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client shared by all providers.
+
+        Returns:
+            Shared HTTP/2 client with a bounded keep-alive connection pool.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    float(self.settings.llm_timeout_seconds), connect=10.0
+                ),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60,
+                ),
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close provider resources and the shared HTTP client."""
+        for provider in self._providers.values():
+            if isinstance(provider, (DeepSeekProvider, GeminiProvider)):
+                await provider.aclose()
+        self._providers.clear()
+
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            await asyncio.shield(client.aclose())
 
     def _create_provider(self, provider_type: str) -> LLMProvider | None:
         """
@@ -74,6 +114,7 @@ class LLMService:
                 default_model=self.settings.llm_default_model,
                 timeout=float(self.settings.llm_timeout_seconds),
                 max_retries=self.settings.llm_max_retries,
+                client=self._get_http_client(),
             )
         elif provider_type == LLMProviderType.GEMINI.value:
             if not self.settings.gemini_api_key:
@@ -83,6 +124,7 @@ class LLMService:
                 api_key=self.settings.gemini_api_key,
                 timeout=float(self.settings.llm_timeout_seconds),
                 max_retries=self.settings.llm_max_retries,
+                client=self._get_http_client(),
             )
         else:
             logger.error(f"[LLMService] Unknown provider type: {provider_type}")
@@ -142,7 +184,6 @@ class LLMService:
             max_retries if max_retries is not None else self.settings.llm_max_retries
         )
         last_error: Exception | None = None
-        backoff_times = [1, 2, 4, 8, 16]  # Exponential backoff in seconds
 
         for attempt in range(retries + 1):
             try:
@@ -151,7 +192,7 @@ class LLMService:
                 last_error = e
                 # Use retry-after if provided, otherwise use exponential backoff
                 wait_time = (
-                    e.retry_after or backoff_times[min(attempt, len(backoff_times) - 1)]
+                    e.retry_after or BACKOFF_TIMES[min(attempt, len(BACKOFF_TIMES) - 1)]
                 )
                 logger.warning(
                     f"[LLMService] Rate limit hit on {provider.provider_name}, "
@@ -167,7 +208,7 @@ class LLMService:
                 )
                 if attempt < retries:
                     await asyncio.sleep(
-                        backoff_times[min(attempt, len(backoff_times) - 1)]
+                        BACKOFF_TIMES[min(attempt, len(BACKOFF_TIMES) - 1)]
                     )
 
         # If we get here, all retries failed
@@ -176,6 +217,43 @@ class LLMService:
             provider=provider.provider_name,
         )
 
+    async def _stream_with_retry(
+        self, provider: LLMProvider, request: LLMRequest
+    ) -> AsyncIterator[str]:
+        """
+        Stream from a provider, retrying failures that happen before any text.
+
+        Args:
+            provider: Provider to use.
+            request: LLM request.
+
+        Yields:
+            Generated text chunks.
+
+        Raises:
+            LLMProviderError: If retries are exhausted or the stream fails
+                after text was already yielded.
+        """
+        retries = self.settings.llm_max_retries
+        for attempt in range(retries + 1):
+            started = False
+            try:
+                async for chunk in provider.stream_complete(request):
+                    started = True
+                    yield chunk
+                return
+            except LLMProviderError as e:
+                if started or attempt == retries:
+                    raise
+                wait_time = BACKOFF_TIMES[min(attempt, len(BACKOFF_TIMES) - 1)]
+                if isinstance(e, LLMRateLimitError) and e.retry_after:
+                    wait_time = e.retry_after
+                logger.warning(
+                    f"[LLMService] Stream from {provider.provider_name} failed before "
+                    f"any text: {e} (attempt {attempt + 1}/{retries + 1})"
+                )
+                await asyncio.sleep(wait_time)
+
     async def complete(
         self,
         request: LLMRequest,
@@ -219,12 +297,15 @@ class LLMService:
                 if not use_fallback:
                     raise
 
-        # Try fallback provider
+        # Try fallback provider; a model override names a primary provider
+        # model, so the fallback uses its own default
         if use_fallback:
             fallback = self.fallback_provider
             if fallback and (
                 not primary or fallback.provider_name != primary.provider_name
             ):
+                if primary and request.model:
+                    request = replace(request, model=None)
                 try:
                     logger.info(
                         f"[LLMService] Falling back to: {fallback.provider_name}"
@@ -326,10 +407,82 @@ class LLMService:
             system_prompt=system_prompt,
             max_tokens=kwargs.get("max_tokens", self.settings.llm_max_tokens),
             temperature=kwargs.get("temperature", 0.7),
+            model=kwargs.get("model"),
+            json_mode=kwargs.get("json_mode", False),
         )
         response = await self.complete(request)
         return response.content
 
+    async def stream_completion(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_fallback: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        Single-turn completion that yields text chunks as they are generated.
+
+        Each provider is retried, and the fallback provider tried, only
+        while no text has been yielded; once chunks have been sent they
+        cannot be taken back, so later failures are raised to the caller.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: Optional system prompt.
+            use_fallback: Whether to use fallback provider on failure.
+            **kwargs: Additional parameters.
+
+        Yields:
+            Generated text chunks.
+
+        Raises:
+            LLMProviderError: If all providers fail.
+            ValueError: If no providers are configured.
+        """
+        request = LLMRequest.from_prompt(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=kwargs.get("max_tokens", self.settings.llm_max_tokens),
+            temperature=kwargs.get("temperature", 0.7),
+            model=kwargs.get("model"),
+            json_mode=kwargs.get("json_mode", False),
+        )
+
+        providers = []
+        primary = self.primary_provider
+        if primary:
+            providers.append(primary)
+        if use_fallback:
+            fallback = self.fallback_provider
+            if fallback and (
+                not primary or fallback.provider_name != primary.provider_name
+            ):
+                providers.append(fallback)
+
+        if not providers:
+            raise ValueError(
+                "No LLM providers available. Configure DCS_DEEPSEEK_API_KEY or DCS_GEMINI_API_KEY."
+            )
+
+        for index, provider in enumerate(providers):
+            started = False
+            try:
+                logger.info(
+                    f"[LLMService] Streaming with provider: {provider.provider_name}"
+                )
+                async for chunk in self._stream_with_retry(provider, request):
+                    started = True
+                    yield chunk
+                return
+            except LLMProviderError as e:
+                if started or index == len(providers) - 1:
+                    raise
+                logger.error(
+                    f"[LLMService] Streaming provider {provider.provider_name} "
+                    f"failed: {e}"
+                )
+
 
 # Singleton instance for convenience
 _llm_service: LLMService | None = None
@@ -341,3 +494,12 @@ def get_llm_service() -> LLMService:
     if _llm_service is None:
         _llm_service = LLMService()
     return _llm_service
+
+
+async def close_llm_service() -> None:
+    """Close the global LLM service and its shared connections."""
+    global _llm_service
+
+    if _llm_service:
+        await _llm_service.aclose()
+        _llm_service = None
@@ -1,5 +1,6 @@
 """Worker task definitions for arq."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -716,8 +717,8 @@ async def _run_unified_analysis(
     # Report progress at 70%
     await progress.report_progress("unified_analysis", 70)
 
-    # Save results
-    saved = unified_storage.save_all(result)
+    # Save results off the event loop; the MinIO client is blocking
+    saved = await asyncio.to_thread(unified_storage.save_all, result)
 
     # Report final progress
     await progress.report_progress("unified_analysis", 100)
@@ -740,6 +741,7 @@ async def _run_unified_analysis(
         "processing_time_seconds": result.processing_time_seconds,
         "saved_modules": saved.get("module_count", 0),
         "saved_vocabulary": saved.get("vocabulary_count", 0),
+        "failed_uploads": saved.get("failed", []),
     }
 
 
@@ -847,8 +849,8 @@ async def _run_chunked_analysis(
     # Report progress at 90%
     await progress.report_progress("chunked_analysis", 90)
 
-    # Save results
-    saved = unified_storage.save_all(result)
+    # Save results off the event loop; the MinIO client is blocking
+    saved = await asyncio.to_thread(unified_storage.save_all, result)
 
     # Report final progress
     await progress.report_progress("chunked_analysis", 100)
@@ -871,6 +873,7 @@ async def _run_chunked_analysis(
         "processing_time_seconds": result.processing_time_seconds,
         "saved_modules": saved.get("module_count", 0),
         "saved_vocabulary": saved.get("vocabulary_count", 0),
+        "failed_uploads": saved.get("failed", []),
     }
 
 
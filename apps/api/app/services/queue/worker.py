@@ -17,6 +17,8 @@ from app.services.queue.tasks import (
     on_job_start,
     on_job_end,
 )
+from app.services.llm import close_llm_service
+from app.services.tts import close_tts_service
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +110,8 @@ async def shutdown(ctx: dict[str, Any]) -> None:
         ctx: arq context
     """
     logger.info("Worker shutting down")
+    await close_tts_service()
+    await close_llm_service()
 
 
 def signal_handler(signum: int, frame: Any) -> None:
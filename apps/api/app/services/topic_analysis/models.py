@@ -246,8 +246,8 @@ class BookAnalysisResult:
             )
             self.difficulty_range = unique_difficulties
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON storage."""
+    def to_metadata_dict(self) -> dict[str, Any]:
+        """Convert to metadata dictionary without per-module results."""
         return {
             "book_id": self.book_id,
             "publisher_id": self.publisher_id,
@@ -260,5 +260,10 @@ class BookAnalysisResult:
             "total_topics": self.total_topics,
             "total_grammar_points": self.total_grammar_points,
             "analyzed_at": self.analyzed_at.isoformat(),
-            "modules": [r.to_dict() for r in self.module_results],
         }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON storage."""
+        data = self.to_metadata_dict()
+        data["modules"] = [r.to_dict() for r in self.module_results]
+        return data
@@ -54,14 +54,7 @@ class TopicAnalysisService:
             llm_service: LLM service for AI analysis.
         """
         self.settings = settings or get_settings()
-        self._llm_service = llm_service
-
-    @property
-    def llm_service(self) -> LLMService:
-        """Get or create LLM service instance."""
-        if self._llm_service is None:
-            self._llm_service = get_llm_service()
-        return self._llm_service
+        self.llm_service: LLMService = llm_service or get_llm_service()
 
     def _parse_json_response(
         self, response: str, module_id: int, book_id: str
@@ -191,28 +184,29 @@ class TopicAnalysisService:
                 error_message="Insufficient text for analysis",
             )
 
-        max_text = self.settings.topic_analysis_max_text_length
-        max_topics = self.settings.topic_analysis_max_topics
-        max_grammar = self.settings.topic_analysis_max_grammar_points
-        temperature = self.settings.topic_analysis_temperature
+        settings = self.settings
+        max_text = settings.topic_analysis_max_text_length
+        max_topics = settings.topic_analysis_max_topics
+        max_grammar = settings.topic_analysis_max_grammar_points
+        temperature = settings.topic_analysis_temperature
+
+        llm_service = self.llm_service
+        primary_provider = llm_service.primary_provider
+        provider_name = (
+            primary_provider.provider_name if primary_provider else "unknown"
+        )
 
         # Try main prompt first
         prompt = build_topic_extraction_prompt(module_text, max_length=max_text)
-        provider_name = ""
         tokens_used = 0
 
         try:
-            response = await self.llm_service.simple_completion(
+            response = await llm_service.simple_completion(
                 prompt=prompt,
                 system_prompt=SYSTEM_PROMPT,
                 temperature=temperature,
                 max_tokens=1024,
             )
-            provider_name = (
-                self.llm_service.primary_provider.provider_name
-                if self.llm_service.primary_provider
-                else "unknown"
-            )
 
             # Parse response
             parsed = self._parse_json_response(response, module_id, book_id)
@@ -246,7 +240,7 @@ class TopicAnalysisService:
                 simple_prompt = build_simple_topic_prompt(
                     module_text, max_length=max_text // 2
                 )
-                response = await self.llm_service.simple_completion(
+                response = await llm_service.simple_completion(
                     prompt=simple_prompt,
                     system_prompt=SYSTEM_PROMPT,
                     temperature=temperature,
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import json
 import logging
+import time
+from collections import OrderedDict
 from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
+from minio import Minio
 from minio.error import S3Error
 
 from app.core.config import get_settings
@@ -46,6 +49,42 @@ class TopicStorage:
             settings: Application settings.
         """
         self.settings = settings or get_settings()
+        self._client: Minio | None = None
+        # (bucket, path) -> (stored_at, module dict), least recently used first
+        self._module_cache: OrderedDict[
+            tuple[str, str], tuple[float, dict[str, Any]]
+        ] = OrderedDict()
+
+    @property
+    def client(self) -> Minio:
+        """Get or create the MinIO client, reused so its connection pool persists."""
+        if self._client is None:
+            self._client = get_minio_client(self.settings)
+        return self._client
+
+    def _get_cached_module(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        """Return a copy of a cached module, or None if missing or expired."""
+        entry = self._module_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, data = entry
+        if (
+            time.monotonic() - stored_at
+            > self.settings.topic_analysis_cache_ttl_seconds
+        ):
+            del self._module_cache[key]
+            return None
+
+        self._module_cache.move_to_end(key)
+        return dict(data)
+
+    def _cache_module(self, key: tuple[str, str], data: dict[str, Any]) -> None:
+        """Store a module in the cache, evicting the least recently used."""
+        self._module_cache[key] = (time.monotonic(), data)
+        self._module_cache.move_to_end(key)
+        while len(self._module_cache) > self.settings.topic_analysis_cache_max_entries:
+            self._module_cache.popitem(last=False)
 
     def _build_modules_path(
         self,
@@ -102,17 +141,26 @@ class TopicStorage:
         Returns:
             Module dictionary or None if not found.
         """
-        client = get_minio_client(self.settings)
+        client = self.client
         bucket = self.settings.minio_publishers_bucket
 
         path = self._build_module_path(publisher_id, book_id, book_name, module_id)
 
+        use_cache = self.settings.topic_analysis_cache_modules
+        if use_cache:
+            cached = self._get_cached_module((bucket, path))
+            if cached is not None:
+                return cached
+
         try:
             response = client.get_object(bucket, path)
             data = response.read()
             response.close()
             response.release_conn()
-            return json.loads(data.decode("utf-8"))
+            module = json.loads(data.decode("utf-8"))
+            if use_cache:
+                self._cache_module((bucket, path), dict(module))
+            return module
         except S3Error as e:
             if e.code == "NoSuchKey":
                 return None
@@ -135,7 +183,7 @@ class TopicStorage:
         Returns:
             List of module dictionaries.
         """
-        client = get_minio_client(self.settings)
+        client = self.client
         bucket = self.settings.minio_publishers_bucket
 
         prefix = self._build_modules_path(publisher_id, book_id, book_name) + "/"
@@ -185,7 +233,7 @@ class TopicStorage:
         Returns:
             Path to updated module file, or None if module not found.
         """
-        client = get_minio_client(self.settings)
+        client = self.client
         bucket = self.settings.minio_publishers_bucket
 
         path = self._build_module_path(
@@ -227,8 +275,11 @@ class TopicStorage:
                 content_type="application/json; charset=utf-8",
             )
             logger.debug("Updated module with topics: %s", path)
+            if self.settings.topic_analysis_cache_modules:
+                self._cache_module((bucket, path), existing)
             return path
         except S3Error as e:
+            self._module_cache.pop((bucket, path), None)
             logger.error("Failed to update module %s: %s", path, e)
             raise
 
@@ -306,7 +357,7 @@ class TopicStorage:
         Returns:
             Path to saved metadata file.
         """
-        client = get_minio_client(self.settings)
+        client = self.client
         bucket = self.settings.minio_publishers_bucket
 
         path = self._build_metadata_path(
@@ -315,9 +366,8 @@ class TopicStorage:
             book_result.book_name,
         )
 
-        metadata = book_result.to_dict()
-        # Remove full module data from metadata (it's in individual files)
-        del metadata["modules"]
+        # Full module data lives in the individual module files
+        metadata = book_result.to_metadata_dict()
 
         json_str = json.dumps(metadata, indent=2, ensure_ascii=False)
         json_bytes = json_str.encode("utf-8")
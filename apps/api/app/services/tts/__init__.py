@@ -19,12 +19,13 @@ from app.services.tts.base import (
 )
 from app.services.tts.azure import AzureTTSProvider
 from app.services.tts.edge import EdgeTTSProvider
-from app.services.tts.service import TTSService, get_tts_service
+from app.services.tts.service import TTSService, close_tts_service, get_tts_service
 
 __all__ = [
     # Service
     "TTSService",
     "get_tts_service",
+    "close_tts_service",
     # Providers
     "TTSProvider",
     "TTSProviderType",
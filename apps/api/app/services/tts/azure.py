@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import random
+import time
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -18,10 +22,58 @@ from app.services.tts.base import (
     TTSRequest,
     TTSResponse,
 )
+from app.services.tts.concurrency import BackpressureController, run_batch
 
 logger = logging.getLogger(__name__)
 
 
+# Translation table escaping XML special characters in a single pass
+_XML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
+_XML_UNSAFE = frozenset("&<>\"'")
+
+# Azure output format per requested audio format; unknown formats use mp3
+_AZURE_FORMATS: dict[str, str] = {
+    "mp3": "audio-24khz-48kbitrate-mono-mp3",
+    "wav": "riff-24khz-16bit-mono-pcm",
+    "ogg": "ogg-24khz-16bit-mono-opus",
+}
+
+# Read size used when streaming audio back to the caller
+STREAM_CHUNK_SIZE = 65536
+
+# Azure access tokens are valid for 10 minutes; refresh them a little early
+TOKEN_TTL_SECONDS = 9 * 60
+TOKEN_REFRESH_MARGIN_SECONDS = 30
+
+# Retry tuning for throttled (429) and server error (5xx) responses
+RETRY_BACKOFF_BASE_SECONDS = 0.1
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+@functools.lru_cache(maxsize=128)
+def _ssml_wrap(voice: str, rate_percent: int) -> tuple[str, str]:
+    """
+    Build the SSML markup surrounding the text for a voice and rate.
+
+    Args:
+        voice: Voice ID.
+        rate_percent: Speech rate as a percentage.
+
+    Returns:
+        Tuple of (prefix, suffix) to place around the escaped text.
+    """
+    prefix = (
+        "<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' "
+        "xml:lang='en-US'>\n"
+        f"    <voice name='{voice}'>\n"
+        f"        <prosody rate='{rate_percent}%'>"
+    )
+    suffix = "</prosody>\n    </voice>\n</speak>"
+    return prefix, suffix
+
+
 class AzureTTSProvider(TTSProvider):
     """Azure Cognitive Services TTS provider using REST API."""
 
@@ -33,6 +85,7 @@ class AzureTTSProvider(TTSProvider):
         region: str = "eastus",
         timeout: float = 30.0,
         max_retries: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """
         Initialize Azure TTS provider.
@@ -42,12 +95,18 @@ class AzureTTSProvider(TTSProvider):
             region: Azure region (e.g., "eastus", "westeurope", "turkeycentral").
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for transient errors.
+            client: Shared HTTP client owned by the caller. If not provided,
+                the provider creates and closes its own.
         """
         self.api_key = api_key
         self.region = region
         self.timeout = timeout
         self.max_retries = max_retries
         self._token: str | None = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
         self._token_endpoint = (
             f"https://{region}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
         )
@@ -55,6 +114,44 @@ class AzureTTSProvider(TTSProvider):
             f"https://{region}.tts.speech.microsoft.com/cognitiveservices/v1"
         )
 
+    async def __aenter__(self) -> AzureTTSProvider:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client shared by all requests.
+
+        Reusing one client keeps connections to Azure alive between
+        requests instead of paying a TCP/TLS handshake per synthesis.
+        HTTP/2 lets concurrent batch requests share a single connection
+        as multiplexed streams.
+
+        Returns:
+            Shared HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client and its pooled connections.
+
+        The close is shielded so that cancellation during shutdown does not
+        abandon it halfway and leak open connections. A client passed in by
+        the caller is left for the caller to close.
+        """
+        if self._client is not None and self._owns_client:
+            client, self._client = self._client, None
+            await asyncio.shield(client.aclose())
+
     def _get_ssml(self, text: str, voice: str, speed: float) -> str:
         """
         Generate SSML for the TTS request.
@@ -70,24 +167,64 @@ class AzureTTSProvider(TTSProvider):
         # Convert speed to percentage (1.0 = 100%, 1.5 = 150%)
         rate_percent = int(speed * 100)
 
-        # Escape special XML characters
+        # Escape special XML characters; most text has none and is used as-is
         escaped_text = (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
+            text if _XML_UNSAFE.isdisjoint(text) else text.translate(_XML_ESCAPE)
         )
 
-        return f"""<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' xml:lang='en-US'>
-    <voice name='{voice}'>
-        <prosody rate='{rate_percent}%'>{escaped_text}</prosody>
-    </voice>
-</speak>"""
+        prefix, suffix = _ssml_wrap(voice, rate_percent)
+        return f"{prefix}{escaped_text}{suffix}"
+
+    def _has_valid_token(self) -> bool:
+        """Check whether the cached token is still safely within its lifetime."""
+        return self._token is not None and (
+            time.monotonic() < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+        )
 
     async def _get_token(self, client: httpx.AsyncClient) -> str:
         """
-        Get or refresh the access token.
+        Get the cached access token, refreshing it when near expiry.
+
+        Concurrent callers share a single refresh request.
+
+        Args:
+            client: HTTP client to use.
+
+        Returns:
+            Access token string.
+
+        Raises:
+            TTSAuthError: If authentication fails.
+        """
+        if self._has_valid_token():
+            return self._token
+
+        async with self._token_lock:
+            if self._has_valid_token():
+                return self._token
+
+            token = await self._request_token(client)
+            self._token = token
+            self._token_expires_at = time.monotonic() + TOKEN_TTL_SECONDS
+            return token
+
+    def _invalidate_token(self, token: str) -> None:
+        """
+        Drop the cached token if it is the one that was rejected.
+
+        A concurrent request may already have refreshed it, in which case
+        the newer token is kept.
+
+        Args:
+            token: Token that the service rejected.
+        """
+        if self._token == token:
+            self._token = None
+            self._token_expires_at = 0.0
+
+    async def _request_token(self, client: httpx.AsyncClient) -> str:
+        """
+        Request a new access token from the Azure token endpoint.
 
         Args:
             client: HTTP client to use.
@@ -131,6 +268,115 @@ class AzureTTSProvider(TTSProvider):
                 details={"error": str(e)},
             ) from e
 
+    def _get_headers(self, token: str, audio_format: str) -> dict[str, str]:
+        """
+        Build the headers for a synthesis request.
+
+        Args:
+            token: Access token.
+            audio_format: Requested audio format (mp3, wav or ogg).
+
+        Returns:
+            Request headers.
+        """
+        output_format = _AZURE_FORMATS.get(audio_format.lower(), _AZURE_FORMATS["mp3"])
+
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/ssml+xml",
+            "X-Microsoft-OutputFormat": output_format,
+            "User-Agent": "DreamCentralStorage-TTS",
+        }
+
+    async def _post_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        headers: dict[str, str],
+        content: str,
+    ) -> httpx.Response:
+        """
+        POST a synthesis request, retrying throttled and server errors.
+
+        429 responses wait for Retry-After (capped) and 5xx responses back
+        off exponentially with jitter. The last response is returned once
+        retries are exhausted so the caller can raise the matching error.
+
+        Args:
+            client: HTTP client to use.
+            headers: Request headers.
+            content: SSML request body.
+
+        Returns:
+            The final HTTP response.
+        """
+        for attempt in range(self.max_retries + 1):
+            response = await client.post(
+                self._tts_endpoint,
+                headers=headers,
+                content=content,
+            )
+            if attempt == self.max_retries:
+                break
+
+            backoff = 2**attempt * RETRY_BACKOFF_BASE_SECONDS + random.uniform(
+                0, RETRY_BACKOFF_BASE_SECONDS
+            )
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                delay = (
+                    min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+                    if retry_after
+                    else backoff
+                )
+            elif response.status_code >= 500:
+                delay = backoff
+            else:
+                break
+
+            logger.warning(
+                f"[AzureTTS] Request returned {response.status_code}, retrying in "
+                f"{delay:.2f}s (attempt {attempt + 1}/{self.max_retries + 1})"
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """
+        Map an unsuccessful synthesis response to a provider error.
+
+        Args:
+            response: Response whose body has been read.
+
+        Raises:
+            TTSAuthError: On 401.
+            TTSRateLimitError: On 429.
+            TTSProviderError: On any other non-200 status.
+        """
+        if response.status_code == 401:
+            raise TTSAuthError(
+                provider=self.provider_name,
+                details={"status_code": 401},
+            )
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise TTSRateLimitError(
+                provider=self.provider_name,
+                retry_after=float(retry_after) if retry_after else None,
+                details={"response": response.text},
+            )
+
+        if response.status_code != 200:
+            raise TTSProviderError(
+                message=f"Azure TTS request failed: {response.status_code}",
+                provider=self.provider_name,
+                details={
+                    "status_code": response.status_code,
+                    "response": response.text,
+                },
+            )
+
     async def synthesize(self, request: TTSRequest) -> TTSResponse:
         """
         Synthesize speech from text using Azure TTS.
@@ -149,85 +395,129 @@ class AzureTTSProvider(TTSProvider):
         voice = self.get_voice(request.language, request.voice)
         ssml = self._get_ssml(request.text, voice, request.speed)
 
-        # Determine output format
-        output_format = "audio-24khz-48kbitrate-mono-mp3"
-        if request.audio_format.lower() == "wav":
-            output_format = "riff-24khz-16bit-mono-pcm"
-
         logger.debug(
             f"[AzureTTS] Synthesizing {len(request.text)} chars with voice {voice}"
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            # Get access token
-            token = await self._get_token(client)
+        client = self._get_client()
 
-            try:
-                response = await client.post(
-                    self._tts_endpoint,
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Content-Type": "application/ssml+xml",
-                        "X-Microsoft-OutputFormat": output_format,
-                        "User-Agent": "DreamCentralStorage-TTS",
-                    },
+        # Get access token
+        token = await self._get_token(client)
+
+        try:
+            response = await self._post_with_retry(
+                client,
+                headers=self._get_headers(token, request.audio_format),
+                content=ssml,
+            )
+            if response.status_code == 401:
+                # Cached token was revoked or expired early: refresh and retry once
+                logger.info("[AzureTTS] Token rejected, refreshing and retrying")
+                self._invalidate_token(token)
+                token = await self._get_token(client)
+                response = await self._post_with_retry(
+                    client,
+                    headers=self._get_headers(token, request.audio_format),
                     content=ssml,
                 )
+            self._raise_for_status(response)
 
-                if response.status_code == 401:
-                    raise TTSAuthError(
-                        provider=self.provider_name,
-                        details={"status_code": 401},
-                    )
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    raise TTSRateLimitError(
-                        provider=self.provider_name,
-                        retry_after=float(retry_after) if retry_after else None,
-                        details={"response": response.text},
-                    )
-
-                if response.status_code != 200:
-                    raise TTSProviderError(
-                        message=f"Azure TTS request failed: {response.status_code}",
-                        provider=self.provider_name,
-                        details={
-                            "status_code": response.status_code,
-                            "response": response.text,
-                        },
-                    )
-
-                audio_data = response.content
-
-                if not audio_data:
-                    raise TTSProviderError(
-                        message="No audio data received from Azure TTS",
-                        provider=self.provider_name,
-                    )
-
-                logger.info(
-                    f"[AzureTTS] Synthesized {len(request.text)} chars, "
-                    f"audio size: {len(audio_data)} bytes"
-                )
+            audio_data = response.content
+            logger.debug(
+                f"[AzureTTS] Response: {len(audio_data)} bytes over "
+                f"{response.http_version}"
+            )
 
-                return TTSResponse(
-                    audio_data=audio_data,
-                    voice_used=voice,
+            if not audio_data:
+                raise TTSProviderError(
+                    message="No audio data received from Azure TTS",
                     provider=self.provider_name,
-                    character_count=len(request.text),
                 )
 
-            except httpx.TimeoutException as e:
-                raise TTSConnectionError(
-                    provider=self.provider_name,
-                    details={"error": f"Request timeout: {e}"},
-                ) from e
-            except httpx.RequestError as e:
-                raise TTSConnectionError(
-                    provider=self.provider_name,
-                    details={"error": str(e)},
-                ) from e
+            logger.info(
+                f"[AzureTTS] Synthesized {len(request.text)} chars, "
+                f"audio size: {len(audio_data)} bytes"
+            )
+
+            return TTSResponse(
+                audio_data=audio_data,
+                voice_used=voice,
+                provider=self.provider_name,
+                character_count=len(request.text),
+            )
+
+        except httpx.TimeoutException as e:
+            raise TTSConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
+        except httpx.RequestError as e:
+            raise TTSConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield audio chunks as Azure sends them.
+
+        Args:
+            request: The TTS request containing text and parameters.
+
+        Yields:
+            Audio data chunks.
+
+        Raises:
+            TTSProviderError: If the request fails.
+            TTSAuthError: If authentication fails.
+            TTSConnectionError: If connection fails.
+        """
+        voice = self.get_voice(request.language, request.voice)
+        ssml = self._get_ssml(request.text, voice, request.speed)
+
+        logger.debug(
+            f"[AzureTTS] Streaming {len(request.text)} chars with voice {voice}"
+        )
+
+        client = self._get_client()
+        token = await self._get_token(client)
+
+        try:
+            for attempt in range(2):
+                async with client.stream(
+                    "POST",
+                    self._tts_endpoint,
+                    headers=self._get_headers(token, request.audio_format),
+                    content=ssml,
+                ) as response:
+                    if response.status_code == 401:
+                        self._invalidate_token(token)
+                        if attempt == 0:
+                            # No audio has been yielded yet, so the request can
+                            # be retried once with a fresh token
+                            logger.info(
+                                "[AzureTTS] Token rejected, refreshing and retrying"
+                            )
+                            token = await self._get_token(client)
+                            continue
+                    if response.status_code != 200:
+                        await response.aread()
+                        self._raise_for_status(response)
+
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        yield chunk
+                    return
+
+        except httpx.TimeoutException as e:
+            raise TTSConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {e}"},
+            ) from e
+        except httpx.RequestError as e:
+            raise TTSConnectionError(
+                provider=self.provider_name,
+                details={"error": str(e)},
+            ) from e
 
     async def synthesize_batch(
         self, items: list[TTSBatchItem], concurrency: int = 5
@@ -235,6 +525,11 @@ class AzureTTSProvider(TTSProvider):
         """
         Synthesize speech for multiple items concurrently.
 
+        Each item is sent as its own request over the shared HTTP/2
+        connection. Items are not merged into one multi-voice SSML document:
+        the REST endpoint returns a single audio stream with no boundary
+        markers, so the merged audio could not be split back per item.
+
         Args:
             items: List of batch items to synthesize.
             concurrency: Maximum concurrent requests.
@@ -242,38 +537,18 @@ class AzureTTSProvider(TTSProvider):
         Returns:
             TTSBatchResult with results and errors.
         """
-        results: list[TTSResponse | None] = [None] * len(items)
-        errors: list[tuple[int, str]] = []
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def process_item(index: int, item: TTSBatchItem) -> None:
-            async with semaphore:
-                try:
-                    request = TTSRequest(
-                        text=item.text,
-                        voice=item.voice,
-                        language=item.language,
-                    )
-                    response = await self.synthesize(request)
-                    results[index] = response
-                except Exception as e:
-                    errors.append((index, str(e)))
-                    logger.warning(f"[AzureTTS] Batch item {index} failed: {e}")
-
-        # Process all items concurrently with semaphore limiting
-        tasks = [process_item(i, item) for i, item in enumerate(items)]
-        await asyncio.gather(*tasks)
-
-        success_count = sum(1 for r in results if r is not None)
-        failure_count = len(errors)
 
-        logger.info(
-            f"[AzureTTS] Batch complete: {success_count} succeeded, {failure_count} failed"
+        async def synthesize_item(item: TTSBatchItem) -> TTSResponse:
+            return await self.synthesize(
+                TTSRequest(text=item.text, voice=item.voice, language=item.language)
+            )
+
+        result = await run_batch(
+            items, synthesize_item, BackpressureController(concurrency), "[AzureTTS]"
         )
 
-        return TTSBatchResult(
-            results=results,
-            errors=errors,
-            success_count=success_count,
-            failure_count=failure_count,
+        logger.info(
+            f"[AzureTTS] Batch complete: {result.success_count} succeeded, "
+            f"{result.failure_count} failed"
         )
+        return result
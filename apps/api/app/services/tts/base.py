@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -37,6 +38,16 @@ ALTERNATIVE_VOICES: dict[str, list[str]] = {
     "tr": ["tr-TR-AhmetNeural"],
 }
 
+# Last-resort voice when nothing in VOICE_MAPPING matches
+DEFAULT_VOICE = "en-US-JennyNeural"
+
+# Single-lookup view of VOICE_MAPPING keyed by (language, provider)
+_FLAT_VOICES: dict[tuple[str, str], str] = {
+    (language, provider): voice
+    for language, voices in VOICE_MAPPING.items()
+    for provider, voice in voices.items()
+}
+
 
 def get_default_voice(language: str, provider: str) -> str:
     """
@@ -49,8 +60,13 @@ def get_default_voice(language: str, provider: str) -> str:
     Returns:
         Voice ID string (e.g., "en-US-JennyNeural")
     """
+    voice = _FLAT_VOICES.get((language, provider))
+    if voice is not None:
+        return voice
+
+    # Unknown language or provider: fall back to English, then the Edge voice
     lang_voices = VOICE_MAPPING.get(language, VOICE_MAPPING.get("en", {}))
-    return lang_voices.get(provider, lang_voices.get("edge", "en-US-JennyNeural"))
+    return lang_voices.get(provider, lang_voices.get("edge", DEFAULT_VOICE))
 
 
 # =============================================================================
@@ -120,7 +136,7 @@ class TTSVoiceNotFoundError(TTSProviderError):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSVoice:
     """Represents a TTS voice."""
 
@@ -129,7 +145,7 @@ class TTSVoice:
     provider: str  # e.g., "edge" or "azure"
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSRequest:
     """Request to a TTS provider."""
 
@@ -142,11 +158,11 @@ class TTSRequest:
     def __post_init__(self) -> None:
         if not self.text:
             raise ValueError("Text cannot be empty")
-        if self.speed < 0.5 or self.speed > 2.0:
+        if not 0.5 <= self.speed <= 2.0:
             raise ValueError(f"Speed must be between 0.5 and 2.0, got {self.speed}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSResponse:
     """Response from a TTS provider."""
 
@@ -157,7 +173,7 @@ class TTSResponse:
     character_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSBatchItem:
     """A single item in a batch TTS request."""
 
@@ -167,7 +183,7 @@ class TTSBatchItem:
     id: str | None = None  # Optional identifier for tracking
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSBatchResult:
     """Result of a batch TTS operation."""
 
@@ -230,6 +246,22 @@ class TTSProvider(ABC):
         """
         ...
 
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield audio chunks as they become available.
+
+        Providers that can stream override this; the default yields the
+        fully synthesized audio as a single chunk.
+
+        Args:
+            request: The TTS request containing text and parameters.
+
+        Yields:
+            Audio data chunks.
+        """
+        response = await self.synthesize(request)
+        yield response.audio_data
+
     def get_voice(self, language: str, voice_override: str | None = None) -> str:
         """
         Get the voice to use for a request.
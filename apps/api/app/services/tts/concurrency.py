@@ -0,0 +1,210 @@
+"""Adaptive concurrency control for TTS batch synthesis."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from app.services.tts.base import TTSBatchResult, TTSRateLimitError, TTSResponse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackpressureController:
+    """
+    Concurrency limiter whose limit can be resized at runtime.
+
+    Unlike ``asyncio.Semaphore``, the limit can shrink when a provider
+    starts rate limiting and grow back once a cooling period has passed
+    without further rate limits.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        cooldown_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Upper bound for concurrent operations.
+            min_concurrency: Lower bound the limit never shrinks below.
+            cooldown_seconds: Time after the last shrink before growing again.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.cooldown_seconds = cooldown_seconds
+        self.limit = self.max_concurrency
+        self.active = 0
+        self._last_shrink = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        """Release a slot, growing the limit if the cooling period has passed."""
+        async with self._condition:
+            self.active -= 1
+            if (
+                self.limit < self.max_concurrency
+                and time.monotonic() - self._last_shrink >= self.cooldown_seconds
+            ):
+                self._grow()
+            else:
+                self._condition.notify(1)
+
+    def shrink(self) -> None:
+        """Reduce the limit by one slot after a rate limit response."""
+        self.limit = max(self.min_concurrency, self.limit - 1)
+        self._last_shrink = time.monotonic()
+
+    async def grow(self) -> None:
+        """Raise the limit by one slot and wake waiting tasks."""
+        async with self._condition:
+            self._grow()
+
+    def _grow(self) -> None:
+        """Raise the limit; the condition lock must be held."""
+        self.limit = min(self.max_concurrency, self.limit + 1)
+        self._condition.notify_all()
+
+    async def __aenter__(self) -> BackpressureController:
+        """Acquire a slot."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the slot."""
+        await self.release()
+
+
+class CreditSemaphore:
+    """
+    Sliding-window limiter for providers billed per character.
+
+    Each request spends credits (characters) that are refunded one period
+    later. Requests wait until enough credits are free, so a throttled
+    provider is never sent more than it allows and 429s are avoided
+    instead of retried. Smaller requests may proceed while a larger one
+    is still waiting for enough credits.
+    """
+
+    def __init__(self, capacity: int, period_seconds: float) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            capacity: Credits available per period.
+            period_seconds: Time after which spent credits are refunded.
+        """
+        self.capacity = capacity
+        self.period_seconds = period_seconds
+        self.used = 0
+        self._spent: deque[tuple[float, int]] = deque()  # (refund time, credits)
+
+    def _refund_expired(self, now: float) -> None:
+        """Return credits whose refund time has passed."""
+        while self._spent and self._spent[0][0] <= now:
+            self.used -= self._spent.popleft()[1]
+
+    async def acquire(self, credits: int) -> None:
+        """
+        Wait until the credits are available and spend them.
+
+        Args:
+            credits: Credits to spend; capped at capacity so that an
+                oversized request can still run on its own.
+        """
+        credits = min(credits, self.capacity)
+        while True:
+            now = time.monotonic()
+            self._refund_expired(now)
+            if self.used + credits <= self.capacity:
+                self.used += credits
+                self._spent.append((now + self.period_seconds, credits))
+                return
+            await asyncio.sleep(self._spent[0][0] - now)
+
+
+# Admission controller of the batch the current task belongs to, so that rate
+# limits seen deep in a retry loop can throttle the whole batch
+current_batch_admission: contextvars.ContextVar[BackpressureController | None] = (
+    contextvars.ContextVar("tts_batch_admission", default=None)
+)
+
+
+async def run_batch(
+    items: Sequence[T],
+    synthesize: Callable[[T], Awaitable[TTSResponse]],
+    controller: BackpressureController,
+    log_prefix: str,
+    shrink_on_rate_limit: bool = True,
+) -> TTSBatchResult:
+    """
+    Synthesize batch items under an adaptive concurrency limit.
+
+    Items are admitted as slots free up, so at most ``controller.limit``
+    tasks exist at a time. Each failure is recorded against its item
+    instead of cancelling the rest of the batch.
+
+    Args:
+        items: Items to synthesize.
+        synthesize: Produces the response for one item.
+        controller: Admission controller of the batch; tasks can reach it
+            through ``current_batch_admission``.
+        log_prefix: Log prefix of the caller, e.g. "[AzureTTS]".
+        shrink_on_rate_limit: Shrink the limit when an item fails with a
+            rate limit. Callers that already shrink on every 429 inside
+            their retry loop turn this off.
+
+    Returns:
+        TTSBatchResult with one result or error per item, in item order.
+    """
+    results: list[TTSResponse | None] = [None] * len(items)
+    errors_by_index: list[str | None] = [None] * len(items)
+
+    async def process_item(index: int, item: T) -> None:
+        current_batch_admission.set(controller)
+        try:
+            results[index] = await synthesize(item)
+        except TTSRateLimitError as e:
+            errors_by_index[index] = str(e)
+            if shrink_on_rate_limit:
+                # Back off: fewer requests in flight until the limit cools down
+                controller.shrink()
+            logger.warning(
+                f"{log_prefix} Batch item {index} rate limited, "
+                f"concurrency limit {controller.limit}"
+            )
+        except Exception as e:
+            errors_by_index[index] = str(e)
+            logger.warning(f"{log_prefix} Batch item {index} failed: {e}")
+        finally:
+            await controller.release()
+
+    async with asyncio.TaskGroup() as task_group:
+        for index, item in enumerate(items):
+            await controller.acquire()
+            task_group.create_task(process_item(index, item))
+
+    return TTSBatchResult(
+        results=results,
+        errors=[
+            (index, message)
+            for index, message in enumerate(errors_by_index)
+            if message is not None
+        ],
+    )
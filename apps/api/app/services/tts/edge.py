@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import logging
+from collections.abc import AsyncIterator
 
 from app.services.tts.base import (
     TTSBatchItem,
@@ -16,6 +16,12 @@ from app.services.tts.base import (
     TTSRequest,
     TTSResponse,
 )
+from app.services.tts.concurrency import BackpressureController, run_batch
+
+try:
+    import edge_tts
+except ImportError:  # pragma: no cover - exercised only when dependency missing
+    edge_tts = None
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +63,19 @@ class EdgeTTSProvider(TTSProvider):
             return f"+{percentage}%"
         return f"{percentage}%"
 
+    def _require_edge_tts(self) -> None:
+        """
+        Ensure the edge-tts package is available.
+
+        Raises:
+            TTSProviderError: If edge-tts is not installed.
+        """
+        if edge_tts is None:
+            raise TTSProviderError(
+                message="edge-tts package not installed. Run: pip install edge-tts",
+                provider=self.provider_name,
+            )
+
     async def synthesize(self, request: TTSRequest) -> TTSResponse:
         """
         Synthesize speech from text using Edge TTS.
@@ -71,14 +90,7 @@ class EdgeTTSProvider(TTSProvider):
             TTSProviderError: If the request fails.
             TTSConnectionError: If connection fails.
         """
-        try:
-            import edge_tts
-        except ImportError as e:
-            raise TTSProviderError(
-                message="edge-tts package not installed. Run: pip install edge-tts",
-                provider=self.provider_name,
-                details={"error": str(e)},
-            ) from e
+        self._require_edge_tts()
 
         voice = self.get_voice(request.language, request.voice)
         rate = self._get_rate_string(request.speed)
@@ -96,12 +108,12 @@ class EdgeTTSProvider(TTSProvider):
             )
 
             # Collect audio data
-            audio_buffer = io.BytesIO()
+            chunks: list[bytes] = []
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    audio_buffer.write(chunk["data"])
+                    chunks.append(chunk["data"])
 
-            audio_data = audio_buffer.getvalue()
+            audio_data = b"".join(chunks)
 
             if not audio_data:
                 raise TTSProviderError(
@@ -121,28 +133,75 @@ class EdgeTTSProvider(TTSProvider):
                 character_count=len(request.text),
             )
 
-        except asyncio.TimeoutError as e:
-            raise TTSConnectionError(
-                provider=self.provider_name,
-                details={"error": f"Request timeout: {e}"},
-            ) from e
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate limit" in error_str or "too many requests" in error_str:
-                raise TTSRateLimitError(
-                    provider=self.provider_name,
-                    details={"error": str(e)},
-                )
-            if "connection" in error_str or "network" in error_str:
-                raise TTSConnectionError(
-                    provider=self.provider_name,
-                    details={"error": str(e)},
-                )
-            raise TTSProviderError(
-                message=f"Edge TTS synthesis failed: {e}",
+            raise self._translate_error(e) from e
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield audio chunks as Edge TTS streams them.
+
+        Args:
+            request: The TTS request containing text and parameters.
+
+        Yields:
+            Audio data chunks.
+
+        Raises:
+            TTSProviderError: If the request fails.
+            TTSConnectionError: If connection fails.
+        """
+        self._require_edge_tts()
+
+        voice = self.get_voice(request.language, request.voice)
+        rate = self._get_rate_string(request.speed)
+
+        logger.debug(
+            f"[EdgeTTS] Streaming {len(request.text)} chars with voice {voice}, rate {rate}"
+        )
+
+        try:
+            communicate = edge_tts.Communicate(
+                text=request.text,
+                voice=voice,
+                rate=rate,
+            )
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    yield chunk["data"]
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    def _translate_error(self, error: Exception) -> TTSProviderError:
+        """
+        Map an Edge TTS failure to the matching provider error.
+
+        Args:
+            error: Exception raised while synthesizing.
+
+        Returns:
+            Provider error to raise in its place.
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            return TTSConnectionError(
+                provider=self.provider_name,
+                details={"error": f"Request timeout: {error}"},
+            )
+        error_str = str(error).lower()
+        if "rate limit" in error_str or "too many requests" in error_str:
+            return TTSRateLimitError(
+                provider=self.provider_name,
+                details={"error": str(error)},
+            )
+        if "connection" in error_str or "network" in error_str:
+            return TTSConnectionError(
                 provider=self.provider_name,
-                details={"error": str(e)},
-            ) from e
+                details={"error": str(error)},
+            )
+        return TTSProviderError(
+            message=f"Edge TTS synthesis failed: {error}",
+            provider=self.provider_name,
+            details={"error": str(error)},
+        )
 
     async def synthesize_batch(
         self, items: list[TTSBatchItem], concurrency: int = 5
@@ -150,6 +209,10 @@ class EdgeTTSProvider(TTSProvider):
         """
         Synthesize speech for multiple items concurrently.
 
+        Each item opens its own websocket: edge-tts creates a fresh session
+        and connection per Communicate.stream() call and has no public way
+        to send several requests over one connection.
+
         Args:
             items: List of batch items to synthesize.
             concurrency: Maximum concurrent requests.
@@ -157,38 +220,18 @@ class EdgeTTSProvider(TTSProvider):
         Returns:
             TTSBatchResult with results and errors.
         """
-        results: list[TTSResponse | None] = [None] * len(items)
-        errors: list[tuple[int, str]] = []
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def process_item(index: int, item: TTSBatchItem) -> None:
-            async with semaphore:
-                try:
-                    request = TTSRequest(
-                        text=item.text,
-                        voice=item.voice,
-                        language=item.language,
-                    )
-                    response = await self.synthesize(request)
-                    results[index] = response
-                except Exception as e:
-                    errors.append((index, str(e)))
-                    logger.warning(f"[EdgeTTS] Batch item {index} failed: {e}")
-
-        # Process all items concurrently with semaphore limiting
-        tasks = [process_item(i, item) for i, item in enumerate(items)]
-        await asyncio.gather(*tasks)
-
-        success_count = sum(1 for r in results if r is not None)
-        failure_count = len(errors)
 
-        logger.info(
-            f"[EdgeTTS] Batch complete: {success_count} succeeded, {failure_count} failed"
+        async def synthesize_item(item: TTSBatchItem) -> TTSResponse:
+            return await self.synthesize(
+                TTSRequest(text=item.text, voice=item.voice, language=item.language)
+            )
+
+        result = await run_batch(
+            items, synthesize_item, BackpressureController(concurrency), "[EdgeTTS]"
         )
 
-        return TTSBatchResult(
-            results=results,
-            errors=errors,
-            success_count=success_count,
-            failure_count=failure_count,
+        logger.info(
+            f"[EdgeTTS] Batch complete: {result.success_count} succeeded, "
+            f"{result.failure_count} failed"
         )
+        return result
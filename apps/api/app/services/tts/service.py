@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import random
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import httpx
+
 from app.core.config import get_settings
 from app.services.tts.azure import AzureTTSProvider
 from app.services.tts.base import (
@@ -18,6 +27,12 @@ from app.services.tts.base import (
     TTSRequest,
     TTSResponse,
 )
+from app.services.tts.concurrency import (
+    BackpressureController,
+    CreditSemaphore,
+    current_batch_admission,
+    run_batch,
+)
 from app.services.tts.edge import EdgeTTSProvider
 
 if TYPE_CHECKING:
@@ -26,6 +41,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _InflightSynthesis:
+    """Lock shared by concurrent requests for the same cache key."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    waiters: int = 0
+
+
+@dataclass(slots=True)
+class _CircuitBreaker:
+    """Consecutive failure state of one provider."""
+
+    failures: int = 0
+    opened_at: float | None = None  # monotonic time the circuit last opened
+
+
 class TTSService:
     """
     TTS Service with automatic fallback between providers.
@@ -35,6 +66,8 @@ class TTSService:
     - Automatic failover on provider errors
     - Configurable retry logic with exponential backoff
     - Batch processing with concurrency control
+    - Optional in-memory LRU cache of synthesized responses
+    - Circuit breaker that skips a failing provider for a cooldown
     """
 
     def __init__(
@@ -55,6 +88,77 @@ class TTSService:
         self._primary_provider = primary_provider
         self._fallback_provider = fallback_provider
         self._providers: dict[str, TTSProvider] = {}
+        self._resolved_providers: tuple[TTSProvider | None, TTSProvider | None] = (
+            None,
+            None,
+        )
+        self._resolved_for: tuple[str, str] | None = None
+        self._cache: OrderedDict[str, TTSResponse] = OrderedDict()
+        self._cache_max = self.settings.tts_cache_size
+        self._inflight: dict[str, _InflightSynthesis] = {}
+        self._breakers: dict[str, _CircuitBreaker] = {}
+        self._http_client: httpx.AsyncClient | None = None
+        self._stream_admission = BackpressureController(
+            self.settings.tts_batch_concurrency
+        )
+        self._azure_credits: CreditSemaphore | None = None
+        if self.settings.azure_tts_credits_per_period > 0:
+            self._azure_credits = CreditSemaphore(
+                self.settings.azure_tts_credits_per_period,
+                self.settings.azure_tts_period_seconds,
+            )
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client shared by HTTP-based providers.
+
+        Returns:
+            Shared HTTP/2 client with a keep-alive connection pool.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=float(self.settings.tts_timeout_seconds),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+            )
+        return self._http_client
+
+    async def warmup(self) -> None:
+        """
+        Create providers and open their connections ahead of the first request.
+
+        Sends a one-character synthesis to each configured provider so the
+        HTTP connection pool and Azure access token are ready. Failures are
+        logged and ignored; the first real request will simply pay the cost.
+        """
+        providers = [self.primary_provider, self.fallback_provider]
+        for provider in {p.provider_name: p for p in providers if p}.values():
+            try:
+                await self._execute_with_retry(
+                    provider, TTSRequest(text="."), max_retries=0
+                )
+                logger.info(
+                    f"[TTSService] Warmed up provider: {provider.provider_name}"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[TTSService] Warmup failed for {provider.provider_name}: {e}"
+                )
+
+    async def aclose(self) -> None:
+        """Close provider resources and the shared HTTP client."""
+        for provider in self._providers.values():
+            if isinstance(provider, AzureTTSProvider):
+                await provider.aclose()
+        self._providers.clear()
+
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            await asyncio.shield(client.aclose())
 
     def _create_provider(self, provider_type: str) -> TTSProvider | None:
         """
@@ -76,11 +180,14 @@ class TTSService:
             if not self.settings.azure_tts_key:
                 logger.warning("[TTSService] Azure TTS API key not configured")
                 return None
+            # _execute_with_retry owns retries, so batch throttling and credit
+            # charging react to the first 429 instead of after inner retries
             return AzureTTSProvider(
                 api_key=self.settings.azure_tts_key,
                 region=self.settings.azure_tts_region,
                 timeout=float(self.settings.tts_timeout_seconds),
-                max_retries=self.settings.tts_max_retries,
+                max_retries=0,
+                client=self._get_http_client(),
             )
         else:
             logger.error(f"[TTSService] Unknown provider type: {provider_type}")
@@ -116,6 +223,99 @@ class TTSService:
             return self._fallback_provider
         return self.get_provider(self.settings.tts_fallback_provider)
 
+    def _resolve_providers(self) -> tuple[TTSProvider | None, TTSProvider | None]:
+        """
+        Resolve the primary and fallback providers once per configuration.
+
+        The pair is memoized and only resolved again when the configured
+        provider names change.
+
+        Returns:
+            Tuple of (primary, fallback). The fallback is None when it is
+            unavailable or the same provider as the primary.
+        """
+        names = (
+            self.settings.tts_primary_provider,
+            self.settings.tts_fallback_provider,
+        )
+        if self._resolved_for != names:
+            primary = self.primary_provider
+            fallback = self.fallback_provider
+            if fallback and primary and fallback.provider_name == primary.provider_name:
+                fallback = None
+            self._resolved_providers = (primary, fallback)
+            self._resolved_for = names
+        return self._resolved_providers
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Compute the exponential backoff delay before the next retry.
+
+        With jitter enabled the delay is drawn from the upper half of the
+        exponential step, so concurrent workers do not retry in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number that just failed.
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(
+            self.settings.tts_retry_max_backoff_seconds,
+            self.settings.tts_retry_initial_backoff_seconds
+            * self.settings.tts_retry_backoff_multiplier**attempt,
+        )
+        if self.settings.tts_retry_jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+    def _circuit_allows(self, provider_name: str) -> bool:
+        """
+        Check whether a provider's circuit lets a request through.
+
+        Once the cooldown has passed, one caller is let through as a probe
+        and the cooldown restarts for everyone else until the probe reports.
+
+        Args:
+            provider_name: Provider to check.
+
+        Returns:
+            False while the circuit is open.
+        """
+        breaker = self._breakers.get(provider_name)
+        if breaker is None or breaker.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - breaker.opened_at < self.settings.tts_circuit_breaker_cooldown_seconds:
+            return False
+        breaker.opened_at = now
+        return True
+
+    def _record_outcome(self, provider_name: str, succeeded: bool) -> None:
+        """
+        Update a provider's circuit after a call has finished retrying.
+
+        Args:
+            provider_name: Provider the call went to.
+            succeeded: Whether the call returned audio.
+        """
+        threshold = self.settings.tts_circuit_breaker_threshold
+        if threshold <= 0:
+            return
+        breaker = self._breakers.setdefault(provider_name, _CircuitBreaker())
+        if succeeded:
+            breaker.failures = 0
+            breaker.opened_at = None
+            return
+        breaker.failures += 1
+        if breaker.failures >= threshold:
+            if breaker.opened_at is None:
+                logger.warning(
+                    f"[TTSService] Circuit opened for {provider_name} after "
+                    f"{breaker.failures} consecutive failures"
+                )
+            breaker.opened_at = time.monotonic()
+
     async def _execute_with_retry(
         self,
         provider: TTSProvider,
@@ -134,22 +334,43 @@ class TTSService:
             TTS response.
 
         Raises:
-            TTSProviderError: If all retries fail.
+            TTSProviderError: If all retries fail or the provider's circuit
+                is open.
         """
+        if not self._circuit_allows(provider.provider_name):
+            raise TTSProviderError(
+                message="Circuit open after repeated failures",
+                provider=provider.provider_name,
+            )
+
         retries = (
             max_retries if max_retries is not None else self.settings.tts_max_retries
         )
         last_error: Exception | None = None
-        backoff_times = [1, 2, 4, 8, 16]  # Exponential backoff in seconds
 
         for attempt in range(retries + 1):
             try:
-                return await provider.synthesize(request)
+                if (
+                    self._azure_credits is not None
+                    and provider.provider_name == TTSProviderType.AZURE.value
+                ):
+                    # Wait for character budget instead of provoking a 429
+                    await self._azure_credits.acquire(len(request.text))
+                response = await provider.synthesize(request)
+                self._record_outcome(provider.provider_name, succeeded=True)
+                return response
             except TTSRateLimitError as e:
                 last_error = e
-                wait_time = (
-                    e.retry_after or backoff_times[min(attempt, len(backoff_times) - 1)]
-                )
+                admission = current_batch_admission.get()
+                if admission is not None:
+                    admission.shrink()
+                if e.retry_after:
+                    # Honor the server hint, spread +/-20% across workers
+                    wait_time = e.retry_after
+                    if self.settings.tts_retry_jitter:
+                        wait_time *= random.uniform(0.8, 1.2)
+                else:
+                    wait_time = self._backoff_delay(attempt)
                 logger.warning(
                     f"[TTSService] Rate limit hit on {provider.provider_name}, "
                     f"waiting {wait_time}s (attempt {attempt + 1}/{retries + 1})"
@@ -163,16 +384,65 @@ class TTSService:
                     f"(attempt {attempt + 1}/{retries + 1})"
                 )
                 if attempt < retries:
-                    await asyncio.sleep(
-                        backoff_times[min(attempt, len(backoff_times) - 1)]
-                    )
+                    await asyncio.sleep(self._backoff_delay(attempt))
 
         # If we get here, all retries failed
+        self._record_outcome(provider.provider_name, succeeded=False)
         raise last_error or TTSProviderError(
             message="All retries exhausted",
             provider=provider.provider_name,
         )
 
+    @staticmethod
+    def _cache_key(request: TTSRequest, force_provider: str | None) -> str:
+        """
+        Build the cache key for a synthesis request.
+
+        Args:
+            request: The TTS request.
+            force_provider: Forced provider, if any.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        # Variants that synthesize identically share an entry: NFC composes
+        # accents and split() collapses runs of whitespace, NBSPs included.
+        # Case and punctuation are kept since they change the prosody.
+        text = unicodedata.normalize("NFC", " ".join(request.text.split()))
+        raw = (
+            f"{text}|{request.voice}|{request.language}|"
+            f"{request.audio_format}|{request.speed}|{force_provider}"
+        )
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _get_cached(self, key: str) -> TTSResponse | None:
+        """
+        Return a cached response and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached response, or None on a miss.
+        """
+        response = self._cache.get(key)
+        if response is not None:
+            self._cache.move_to_end(key)
+        return response
+
+    def _store_cached(self, key: str, response: TTSResponse) -> None:
+        """
+        Cache a response, evicting the least recently used entries.
+
+        Args:
+            key: Cache key.
+            response: Response to cache.
+        """
+        self._cache[key] = response
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
     async def synthesize(
         self,
         request: TTSRequest,
@@ -182,6 +452,60 @@ class TTSService:
         """
         Synthesize speech with automatic fallback.
 
+        Identical requests are served from the in-memory cache, and
+        concurrent identical requests share a single upstream call.
+
+        Args:
+            request: The TTS request.
+            use_fallback: Whether to use fallback provider on failure.
+            force_provider: Force a specific provider (bypass primary/fallback).
+
+        Returns:
+            TTS response.
+
+        Raises:
+            TTSProviderError: If all providers fail.
+            ValueError: If no providers are configured.
+        """
+        if self._cache_max <= 0:
+            return await self._synthesize_uncached(
+                request, use_fallback, force_provider
+            )
+
+        key = self._cache_key(request, force_provider)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = self._inflight[key] = _InflightSynthesis()
+        inflight.waiters += 1
+        try:
+            async with inflight.lock:
+                # Another request may have filled the cache while we waited
+                cached = self._get_cached(key)
+                if cached is not None:
+                    return cached
+                response = await self._synthesize_uncached(
+                    request, use_fallback, force_provider
+                )
+                self._store_cached(key, response)
+                return response
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters:
+                del self._inflight[key]
+
+    async def _synthesize_uncached(
+        self,
+        request: TTSRequest,
+        use_fallback: bool,
+        force_provider: str | None,
+    ) -> TTSResponse:
+        """
+        Synthesize speech with automatic fallback, bypassing the cache.
+
         Args:
             request: The TTS request.
             use_fallback: Whether to use fallback provider on failure.
@@ -203,8 +527,9 @@ class TTSService:
                 )
             return await self._execute_with_retry(provider, request)
 
+        primary, fallback = self._resolve_providers()
+
         # Try primary provider
-        primary = self.primary_provider
         if primary:
             try:
                 logger.info(
@@ -217,25 +542,124 @@ class TTSService:
                     raise
 
         # Try fallback provider
-        if use_fallback:
-            fallback = self.fallback_provider
-            if fallback and (
-                not primary or fallback.provider_name != primary.provider_name
-            ):
-                try:
-                    logger.info(
-                        f"[TTSService] Falling back to: {fallback.provider_name}"
-                    )
-                    return await self._execute_with_retry(fallback, request)
-                except TTSProviderError as e:
-                    logger.error(f"[TTSService] Fallback provider also failed: {e}")
-                    raise
+        if use_fallback and fallback:
+            try:
+                logger.info(f"[TTSService] Falling back to: {fallback.provider_name}")
+                return await self._execute_with_retry(fallback, request)
+            except TTSProviderError as e:
+                logger.error(f"[TTSService] Fallback provider also failed: {e}")
+                raise
 
         raise ValueError(
             "No TTS providers available. Edge TTS should always be available. "
             "Configure DCS_AZURE_TTS_KEY for Azure fallback."
         )
 
+    async def synthesize_stream(
+        self,
+        request: TTSRequest,
+        use_fallback: bool = True,
+        force_provider: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield audio chunks as they arrive.
+
+        Each provider is retried, and the fallback provider tried, only
+        while no audio has been yielded; once chunks have been sent they
+        cannot be taken back, so later failures are raised to the caller.
+        Concurrent streams share tts_batch_concurrency slots, each held
+        until its stream finishes.
+
+        Args:
+            request: The TTS request.
+            use_fallback: Whether to use fallback provider on failure.
+            force_provider: Force a specific provider (bypass primary/fallback).
+
+        Yields:
+            Audio data chunks.
+
+        Raises:
+            TTSProviderError: If all providers fail.
+            ValueError: If no providers are configured.
+        """
+        if force_provider:
+            provider = self.get_provider(force_provider)
+            if not provider:
+                raise ValueError(
+                    f"Provider '{force_provider}' not configured or unavailable"
+                )
+            providers = [provider]
+        else:
+            primary, fallback = self._resolve_providers()
+            providers = [primary] if primary else []
+            if use_fallback and fallback:
+                providers.append(fallback)
+
+        if not providers:
+            raise ValueError(
+                "No TTS providers available. Edge TTS should always be available. "
+                "Configure DCS_AZURE_TTS_KEY for Azure fallback."
+            )
+
+        # The slot is held for the whole stream, not just until the first byte
+        async with self._stream_admission:
+            for index, provider in enumerate(providers):
+                started = False
+                try:
+                    logger.info(
+                        f"[TTSService] Streaming with provider: {provider.provider_name}"
+                    )
+                    async for chunk in self._stream_with_retry(provider, request):
+                        started = True
+                        yield chunk
+                    return
+                except TTSProviderError as e:
+                    if started or index == len(providers) - 1:
+                        raise
+                    logger.error(
+                        f"[TTSService] Streaming provider {provider.provider_name} "
+                        f"failed: {e}"
+                    )
+
+    async def _stream_with_retry(
+        self, provider: TTSProvider, request: TTSRequest
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream from a provider, retrying failures that happen before any audio.
+
+        Args:
+            provider: Provider to use.
+            request: TTS request.
+
+        Yields:
+            Audio data chunks.
+
+        Raises:
+            TTSProviderError: If retries are exhausted or the stream fails
+                after audio was already yielded.
+        """
+        retries = self.settings.tts_max_retries
+        for attempt in range(retries + 1):
+            started = False
+            try:
+                async for chunk in provider.synthesize_stream(request):
+                    started = True
+                    yield chunk
+                return
+            except TTSProviderError as e:
+                if started or attempt == retries:
+                    raise
+                if isinstance(e, TTSRateLimitError):
+                    self._stream_admission.shrink()
+                    wait_time = e.retry_after or self._backoff_delay(attempt)
+                else:
+                    wait_time = self._backoff_delay(attempt)
+                logger.warning(
+                    f"[TTSService] Stream from {provider.provider_name} failed before "
+                    f"first chunk: {e} (attempt {attempt + 1}/{retries + 1})"
+                )
+                await asyncio.sleep(wait_time)
+
     async def synthesize_text(
         self,
         text: str,
@@ -284,42 +708,51 @@ class TTSService:
             TTSBatchResult with results and errors.
         """
         concurrency = concurrency or self.settings.tts_batch_concurrency
-        results: list[TTSResponse | None] = [None] * len(items)
-        errors: list[tuple[int, str]] = []
-        semaphore = asyncio.Semaphore(concurrency)
 
-        async def process_item(index: int, item: TTSBatchItem) -> None:
-            async with semaphore:
-                try:
-                    request = TTSRequest(
-                        text=item.text,
-                        voice=item.voice,
-                        language=item.language,
-                        audio_format=self.settings.tts_audio_format,
-                    )
-                    response = await self.synthesize(request, use_fallback=use_fallback)
-                    results[index] = response
-                except Exception as e:
-                    errors.append((index, str(e)))
-                    logger.warning(f"[TTSService] Batch item {index} failed: {e}")
+        # Identical items are synthesized once and the response shared
+        groups: dict[tuple[str, str | None, str], list[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault((item.text, item.voice, item.language), []).append(index)
 
-        # Process all items concurrently with semaphore limiting
-        tasks = [process_item(i, item) for i, item in enumerate(items)]
-        await asyncio.gather(*tasks)
+        audio_format = self.settings.tts_audio_format
 
-        success_count = sum(1 for r in results if r is not None)
-        failure_count = len(errors)
+        async def synthesize_group(key: tuple[str, str | None, str]) -> TTSResponse:
+            text, voice, language = key
+            request = TTSRequest(
+                text=text,
+                voice=voice,
+                language=language,
+                audio_format=audio_format,
+            )
+            return await self.synthesize(request, use_fallback=use_fallback)
+
+        # _execute_with_retry already shrinks the batch limit on every 429
+        group_result = await run_batch(
+            list(groups),
+            synthesize_group,
+            BackpressureController(concurrency),
+            "[TTSService]",
+            shrink_on_rate_limit=False,
+        )
 
-        logger.info(
-            f"[TTSService] Batch complete: {success_count} succeeded, {failure_count} failed"
+        # Fan each group's outcome out to every item it stands for
+        group_indices = list(groups.values())
+        results: list[TTSResponse | None] = [None] * len(items)
+        for indices, response in zip(group_indices, group_result.results, strict=True):
+            for index in indices:
+                results[index] = response
+        errors = sorted(
+            (index, message)
+            for group, message in group_result.errors
+            for index in group_indices[group]
         )
 
-        return TTSBatchResult(
-            results=results,
-            errors=errors,
-            success_count=success_count,
-            failure_count=failure_count,
+        result = TTSBatchResult(results=results, errors=errors)
+        logger.info(
+            f"[TTSService] Batch complete: {result.success_count} succeeded, "
+            f"{result.failure_count} failed"
         )
+        return result
 
 
 # Singleton instance for convenience
@@ -332,3 +765,12 @@ def get_tts_service() -> TTSService:
     if _tts_service is None:
         _tts_service = TTSService()
     return _tts_service
+
+
+async def close_tts_service() -> None:
+    """Close the global TTS service and its shared connections."""
+    global _tts_service
+
+    if _tts_service:
+        await _tts_service.aclose()
+        _tts_service = None
@@ -6,6 +6,7 @@ from app.services.unified_analysis.service import (
 )
 from app.services.unified_analysis.models import (
     UnifiedAnalysisResult,
+    UnifiedAnalysisStorageError,
     AnalyzedModule,
     VocabularyWord,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "UnifiedAnalysisService",
     "get_unified_analysis_service",
     "UnifiedAnalysisResult",
+    "UnifiedAnalysisStorageError",
     "AnalyzedModule",
     "VocabularyWord",
     "UnifiedAnalysisStorage",
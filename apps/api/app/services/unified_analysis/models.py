@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any
 
+import orjson
 
-@dataclass
+_UTC = timezone.utc
+
+
+@functools.lru_cache(maxsize=64)
+def _isoformat(value: datetime) -> str:
+    """Format a timestamp once; modules of one analysis run share it."""
+    return value.isoformat()
+
+
+class UnifiedAnalysisStorageError(Exception):
+    """Raised when analysis files that readers depend on were not saved."""
+
+    def __init__(self, book_id: str, failed: list[str]) -> None:
+        self.book_id = book_id
+        self.failed = failed
+        super().__init__(f"[{book_id}] Failed to save: {', '.join(failed)}")
+
+
+@dataclass(slots=True)
 class VocabularyWord:
     """A vocabulary word extracted from a module."""
 
@@ -20,7 +41,7 @@ class VocabularyWord:
     phonetic: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzedModule:
     """A module with all analysis results from unified LLM call."""
 
@@ -30,6 +51,7 @@ class AnalyzedModule:
     end_page: int
     pages: list[int] = field(default_factory=list)
     text: str = ""
+    word_count: int = field(init=False)
 
     # Topic analysis results
     topics: list[str] = field(default_factory=list)
@@ -42,18 +64,26 @@ class AnalyzedModule:
     vocabulary: list[VocabularyWord] = field(default_factory=list)
 
     # Metadata
-    extracted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    extracted_at: datetime = field(default_factory=lambda: datetime.now(_UTC))
 
-    @property
-    def word_count(self) -> int:
-        """Get word count from text."""
-        return len(self.text.split()) if self.text else 0
+    def __post_init__(self) -> None:
+        self.word_count = len(self.text.split()) if self.text else 0
 
     @property
     def page_count(self) -> int:
         """Get number of pages."""
         return len(self.pages)
 
+    def to_json(self, pretty: bool = False) -> bytes:
+        """
+        Serialize to UTF-8 JSON without building an intermediate dict.
+
+        orjson walks the dataclass fields directly; the field order matches
+        to_dict(), so the output is identical to dumping to_dict() with
+        ensure_ascii=False (and indent=2 when pretty is set).
+        """
+        return orjson.dumps(self, option=orjson.OPT_INDENT_2 if pretty else None)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -81,13 +111,13 @@ class AnalyzedModule:
                 }
                 for v in self.vocabulary
             ],
-            "extracted_at": self.extracted_at.isoformat()
+            "extracted_at": _isoformat(self.extracted_at)
             if self.extracted_at
             else None,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedAnalysisResult:
     """Complete result from unified AI analysis."""
 
@@ -117,8 +147,8 @@ class UnifiedAnalysisResult:
 
     @property
     def total_vocabulary(self) -> int:
-        """Get total vocabulary word count."""
-        return sum(len(m.vocabulary) for m in self.modules)
+        """Get unique vocabulary word count, matching vocabulary.json."""
+        return len(self.all_vocabulary)
 
     @property
     def total_topics(self) -> int:
@@ -127,11 +157,11 @@ class UnifiedAnalysisResult:
 
     @property
     def all_vocabulary(self) -> list[VocabularyWord]:
-        """Get all vocabulary words from all modules."""
-        vocab = []
-        for module in self.modules:
-            vocab.extend(module.vocabulary)
-        return vocab
+        """Get unique vocabulary words from all modules, first occurrence first."""
+        unique: dict[str, VocabularyWord] = {}
+        for word in chain.from_iterable(m.vocabulary for m in self.modules):
+            unique.setdefault(word.word.casefold(), word)
+        return list(unique.values())
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -155,7 +185,7 @@ class UnifiedAnalysisResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkedProgress:
     """Progress information for chunked analysis."""
 
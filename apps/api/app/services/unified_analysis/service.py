@@ -7,11 +7,26 @@ Supports two approaches:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
 import time
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from difflib import SequenceMatcher
+from datetime import datetime, timezone
+from functools import cached_property
+from itertools import accumulate
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
+import orjson
+
 from app.core.config import get_settings
 from app.services.unified_analysis.models import (
     AnalyzedModule,
@@ -26,6 +41,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Opening ```/```json and closing ``` fences around an LLM response
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?|```$")
+
+# Books longer than this run Phase 1 over overlapping page windows
+PHASE1_WINDOW_THRESHOLD = 200
+PHASE1_WINDOW_PAGES = 120
+PHASE1_WINDOW_OVERLAP = 20
+_DIGITS_RE = re.compile(r"\d+")
+
 
 UNIFIED_ANALYSIS_PROMPT = """Analyze this educational book content and provide a COMPLETE analysis covering ALL pages.
 
@@ -113,7 +137,7 @@ Return ONLY a valid JSON object:
 }}
 
 IMPORTANT:
-- Cover ALL pages from start to end
+- Cover ALL pages from {first_page} to {last_page}
 - Identify ALL units"""
 
 
@@ -157,6 +181,178 @@ Focus on:
 - Provide Turkish translations"""
 
 
+def _estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text without a provider tokenizer.
+
+    ASCII text averages about four characters per token, while CJK and
+    other non-ASCII characters tend to cost about one token each.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def _compact_whitespace(text: str) -> str:
+    """Collapse runs of spaces and drop blank lines, keeping line breaks."""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _drop_running_lines(pages: dict[int, str]) -> dict[int, str]:
+    """
+    Remove lines repeated on most pages, such as running headers and footers.
+
+    A line counts as running when it appears on more than half of the
+    pages (and on at least three). Unit headings and exercise titles occur
+    on a few pages only, so they are kept.
+    """
+    line_pages: Counter[str] = Counter()
+    for text in pages.values():
+        line_pages.update(set(text.splitlines()))
+    threshold = max(3, len(pages) // 2 + 1)
+    running = {line for line, count in line_pages.items() if count >= threshold}
+    if not running:
+        return pages
+    return {
+        page_num: "\n".join(line for line in text.splitlines() if line not in running)
+        for page_num, text in pages.items()
+    }
+
+
+def _page_windows(first_page: int, last_page: int) -> list[tuple[int, int]]:
+    """Split a page range into overlapping Phase 1 windows."""
+    windows = []
+    start = first_page
+    while True:
+        end = start + PHASE1_WINDOW_PAGES - 1
+        windows.append((start, min(end, last_page)))
+        if end >= last_page:
+            return windows
+        start = end - PHASE1_WINDOW_OVERLAP + 1
+
+
+def _same_module(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """Whether two detected modules are the same one seen by adjacent windows."""
+    title_a = str(a.get("title", "")).casefold()
+    title_b = str(b.get("title", "")).casefold()
+    # Unit numbers decide when present: "Unit 10" and "Unit 11" are close as
+    # strings, while "Unit 3" and "Unit 3: Food" are the same module
+    numbers_a = _DIGITS_RE.findall(title_a)
+    numbers_b = _DIGITS_RE.findall(title_b)
+    if numbers_a or numbers_b:
+        return numbers_a == numbers_b
+    return SequenceMatcher(None, title_a, title_b).ratio() > 0.85
+
+
+def _clamp_modules(
+    modules: list[dict[str, Any]], first_page: int, last_page: int
+) -> list[dict[str, Any]]:
+    """
+    Clamp modules detected in one page window to the window's pages.
+
+    A module cut off at the window edge can come back with page numbers
+    beyond the window; modules lying entirely outside it are dropped.
+    """
+    clamped = []
+    for module in modules:
+        start_page = max(module.get("start_page", first_page), first_page)
+        end_page = min(module.get("end_page", last_page), last_page)
+        if start_page > last_page or end_page < first_page:
+            continue
+        clamped.append(
+            {**module, "start_page": start_page, "end_page": max(start_page, end_page)}
+        )
+    return clamped
+
+
+def _merge_window_modules(
+    module_lists: list[list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Merge modules detected in overlapping page windows.
+
+    A module cut off at a window edge shows up in both neighbouring
+    windows with a similar title and overlapping pages; those are merged
+    into the widest page range. Remaining overlaps between different
+    modules are resolved by ending the earlier module where the next starts;
+    a module nested in a different one splits it at its start page and
+    takes over the rest of the earlier module's range.
+    """
+    candidates = sorted(
+        (module for modules in module_lists for module in modules),
+        key=lambda m: (m.get("start_page", 1), -m.get("end_page", 1)),
+    )
+    merged: list[dict[str, Any]] = []
+    for module in candidates:
+        module = dict(module)
+        start_page = module.get("start_page", 1)
+        end_page = module.get("end_page", start_page)
+        if merged:
+            last = merged[-1]
+            overlaps = start_page <= last["end_page"]
+            if overlaps and _same_module(last, module):
+                if end_page - start_page > last["end_page"] - last["start_page"]:
+                    module["start_page"] = last["start_page"]
+                    merged[-1] = module
+                last = merged[-1]
+                last["end_page"] = max(last["end_page"], end_page)
+                continue
+            if overlaps:
+                if start_page <= last["start_page"]:
+                    continue  # Same start as a longer module; nowhere to split
+                end_page = max(end_page, last["end_page"])
+                last["end_page"] = start_page - 1
+        module["start_page"] = start_page
+        module["end_page"] = end_page
+        merged.append(module)
+
+    for number, module in enumerate(merged, start=1):
+        module["module_number"] = number
+    return merged
+
+
+class _PageIndex:
+    """
+    Book pages sorted once, so module page ranges resolve to list slices.
+
+    Each range lookup is two bisects instead of a dict lookup per page,
+    which also handles gaps in the page numbering.
+    """
+
+    def __init__(self, pages: dict[int, str]) -> None:
+        items = sorted(pages.items())
+        self._numbers = [page_num for page_num, _ in items]
+        self._texts = [text for _, text in items]
+
+    @cached_property
+    def _marked(self) -> list[str]:
+        """Page texts prefixed with their page markers."""
+        return [
+            f"--- Page {page_num} ---\n{text}"
+            for page_num, text in zip(self._numbers, self._texts, strict=True)
+        ]
+
+    @cached_property
+    def _char_totals(self) -> list[int]:
+        """Prefix sums of stripped page lengths."""
+        return list(accumulate((len(text.strip()) for text in self._texts), initial=0))
+
+    def _span(self, start_page: int, end_page: int) -> tuple[int, int]:
+        """Return the slice bounds of the pages numbered start_page..end_page."""
+        lo = bisect_left(self._numbers, start_page)
+        return lo, max(lo, bisect_right(self._numbers, end_page))
+
+    def text(self, start_page: int, end_page: int, marked: bool = False) -> str:
+        """Join the text of the pages in range, optionally with page markers."""
+        lo, hi = self._span(start_page, end_page)
+        return "\n\n".join((self._marked if marked else self._texts)[lo:hi])
+
+    def content_chars(self, start_page: int, end_page: int) -> int:
+        """Count the stripped characters of the pages in range."""
+        lo, hi = self._span(start_page, end_page)
+        return self._char_totals[hi] - self._char_totals[lo]
+
+
 class UnifiedAnalysisService:
     """
     Unified AI analysis service that combines segmentation, topic analysis,
@@ -183,6 +379,9 @@ class UnifiedAnalysisService:
         """
         self.settings = settings or get_settings()
         self._llm_service = llm_service
+        # Parsed LLM results keyed by prompt hash, stored as JSON so that
+        # callers never share mutable lists
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
 
     @property
     def llm_service(self) -> LLMService:
@@ -240,9 +439,14 @@ class UnifiedAnalysisService:
         if progress_callback:
             progress_callback(20, 100)
 
-        # Call LLM
+        # Call LLM, streaming so progress moves while the response is generated
         try:
-            response = await self.llm_service.simple_completion(
+            max_tokens = 16000  # Allow large response for comprehensive analysis
+            expected_chars = max_tokens * 4  # roughly 4 characters per token
+            chunks: list[str] = []
+            received_chars = 0
+            reported = 20
+            async for chunk in self.llm_service.stream_completion(
                 prompt=prompt,
                 system_prompt=(
                     "You are an expert educational content analyzer specializing in language learning books. "
@@ -251,14 +455,22 @@ class UnifiedAnalysisService:
                     "Be thorough - extract comprehensive vocabulary for each module."
                 ),
                 temperature=0.3,
-                max_tokens=16000,  # Allow large response for comprehensive analysis
-            )
+                max_tokens=max_tokens,
+                json_mode=True,
+            ):
+                chunks.append(chunk)
+                received_chars += len(chunk)
+                percent = 20 + min(49, 50 * received_chars // expected_chars)
+                if progress_callback and percent > reported:
+                    progress_callback(percent, 100)
+                    reported = percent
+            response = "".join(chunks)
 
             if progress_callback:
                 progress_callback(70, 100)
 
             # Parse response
-            analysis_data = self._parse_response(response)
+            analysis_data = self._parse_json_response(response)
 
             if progress_callback:
                 progress_callback(80, 100)
@@ -304,6 +516,7 @@ class UnifiedAnalysisService:
         progress_callback: Callable[[int, int], None] | None = None,
         detailed_progress_callback: Callable[[ChunkedProgress], None] | None = None,
         max_retries: int = 3,
+        resume: bool = True,
     ) -> UnifiedAnalysisResult:
         """
         Perform chunked analysis on book content using two-phase approach.
@@ -322,6 +535,10 @@ class UnifiedAnalysisService:
             progress_callback: Optional progress callback (current, total).
             detailed_progress_callback: Optional detailed progress callback.
             max_retries: Maximum retries per module for vocabulary extraction.
+            resume: Reuse Phase 1 and per-module results saved by an earlier,
+                interrupted run on the same text (needs
+                unified_analysis_state_dir). When False, saved results are
+                discarded, but this run still saves its own.
 
         Returns:
             UnifiedAnalysisResult with all analysis data.
@@ -352,11 +569,33 @@ class UnifiedAnalysisService:
             )
 
         # ============ Phase 1: Detect Modules ============
-        modules_data = await self._phase1_detect_modules(
-            text_content=text_content,
-            total_pages=total_pages,
-            max_retries=max_retries,
+        # resume only decides whether saved results are read; a fresh run
+        # still saves its progress so that it can be resumed itself
+        state_dir = self._analysis_state_dir(publisher_id, book_id, text_content)
+        if state_dir:
+            self._prune_analysis_state(state_dir)
+            if not resume:
+                shutil.rmtree(state_dir, ignore_errors=True)
+        modules_data = (
+            self._read_state(state_dir / "phase1.json") if state_dir else None
         )
+        if modules_data is not None:
+            logger.info("Resuming chunked analysis for book %s", book_id)
+        else:
+            if total_pages > PHASE1_WINDOW_THRESHOLD:
+                modules_data = await self._phase1_detect_modules_windowed(
+                    pages=pages,
+                    total_pages=total_pages,
+                    max_retries=max_retries,
+                )
+            else:
+                modules_data = await self._phase1_detect_modules(
+                    text_content=text_content,
+                    last_page=total_pages,
+                    max_retries=max_retries,
+                )
+            if state_dir:
+                self._write_state(state_dir / "phase1.json", modules_data)
 
         if progress_callback:
             progress_callback(20, 100)
@@ -374,79 +613,110 @@ class UnifiedAnalysisService:
         )
 
         # ============ Phase 2: Extract Vocabulary Per Module ============
-        modules: list[AnalyzedModule] = []
-        difficulty_levels: set[str] = set()
-        all_vocabulary: list[VocabularyWord] = []
-
-        for i, mod_data in enumerate(detected_modules):
-            module_progress = ChunkedProgress(
-                phase="extracting_vocabulary",
-                current_module=i + 1,
-                total_modules=len(detected_modules),
-                module_title=mod_data.get("title", f"Module {i + 1}"),
-                overall_percent=20 + int((i / len(detected_modules)) * 70),
-            )
-
-            if detailed_progress_callback:
-                detailed_progress_callback(module_progress)
-            if progress_callback:
-                progress_callback(module_progress.overall_percent, 100)
-
+        # Modules are independent, so their LLM calls run concurrently,
+        # bounded to stay within provider rate limits
+        total_modules = len(detected_modules)
+        semaphore = asyncio.Semaphore(self.settings.unified_analysis_concurrency)
+        completed_modules = 0
+        min_module_chars = self.settings.unified_analysis_min_module_chars
+        page_index = _PageIndex(pages)
+        # One timestamp for the whole run instead of one per module
+        extracted_at = datetime.now(timezone.utc)
+
+        async def process_module(i: int, mod_data: dict[str, Any]) -> AnalyzedModule:
+            nonlocal completed_modules
+            module_title = mod_data.get("title", f"Module {i + 1}")
             start_page = mod_data.get("start_page", 1)
             end_page = mod_data.get("end_page", total_pages)
             difficulty = mod_data.get("difficulty_level", "intermediate")
-            difficulty_levels.add(difficulty)
 
             # Get module text
             module_pages = list(range(start_page, end_page + 1))
-            module_text = self._get_pages_text(pages, start_page, end_page)
+            module_text = page_index.text(start_page, end_page, marked=True)
 
             # Extract vocabulary, summary, and grammar points with retries
             vocabulary: list[VocabularyWord] = []
             summary = ""
             grammar_points: list[str] = []
-            for attempt in range(max_retries):
-                try:
-                    vocab_data = await self._phase2_extract_vocabulary(
-                        module_title=mod_data.get("title", f"Module {i + 1}"),
-                        start_page=start_page,
-                        end_page=end_page,
-                        topics=mod_data.get("topics", []),
-                        difficulty_level=difficulty,
-                        module_text=module_text,
+            async with semaphore:
+                # Progress reflects completed modules, not start order
+                module_progress = ChunkedProgress(
+                    phase="extracting_vocabulary",
+                    current_module=i + 1,
+                    total_modules=total_modules,
+                    module_title=module_title,
+                    overall_percent=20 + int((completed_modules / total_modules) * 70),
+                )
+
+                if detailed_progress_callback:
+                    detailed_progress_callback(module_progress)
+                if progress_callback:
+                    progress_callback(module_progress.overall_percent, 100)
+
+                # Modules finished by an interrupted run are not extracted again
+                module_state = state_dir / f"module_{i + 1}.json" if state_dir else None
+                saved = self._read_state(module_state) if module_state else None
+                if saved is not None:
+                    vocabulary = self._parse_vocabulary(saved)
+                    summary = saved.get("summary", "")
+                    grammar_points = saved.get("grammar_points", [])
+
+                # Dividers, index pages and blank chapters have no vocabulary
+                # worth a Phase 2 call
+                module_chars = page_index.content_chars(start_page, end_page)
+                attempts = max_retries if saved is None else 0
+                if attempts and module_chars < min_module_chars:
+                    logger.info(
+                        "Skipping vocabulary extraction for module %d (%d chars)",
+                        i + 1,
+                        module_chars,
                     )
-                    vocabulary = self._parse_vocabulary(vocab_data)
-                    summary = vocab_data.get("summary", "")
-                    grammar_points = vocab_data.get("grammar_points", [])
-                    break
-                except Exception as e:
-                    module_progress.retry_count = attempt + 1
-                    if detailed_progress_callback:
-                        detailed_progress_callback(module_progress)
-
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            "Vocabulary extraction failed for module %d (attempt %d/%d): %s",
-                            i + 1,
-                            attempt + 1,
-                            max_retries,
-                            e,
-                        )
-                    else:
-                        logger.error(
-                            "Vocabulary extraction failed for module %d after %d attempts: %s",
-                            i + 1,
-                            max_retries,
-                            e,
+                    attempts = 0
+
+                for attempt in range(attempts):
+                    try:
+                        vocab_data = await self._phase2_extract_vocabulary(
+                            module_title=module_title,
+                            start_page=start_page,
+                            end_page=end_page,
+                            topics=mod_data.get("topics", []),
+                            difficulty_level=difficulty,
+                            module_text=module_text,
                         )
-                        # Continue with empty vocabulary for this module
-
-            all_vocabulary.extend(vocabulary)
+                        vocabulary = self._parse_vocabulary(vocab_data)
+                        summary = vocab_data.get("summary", "")
+                        grammar_points = vocab_data.get("grammar_points", [])
+                        if module_state:
+                            self._write_state(module_state, vocab_data)
+                        break
+                    except Exception as e:
+                        module_progress.retry_count = attempt + 1
+                        if detailed_progress_callback:
+                            detailed_progress_callback(module_progress)
+
+                        if attempt < max_retries - 1:
+                            logger.warning(
+                                "Vocabulary extraction failed for module %d (attempt %d/%d): %s",
+                                i + 1,
+                                attempt + 1,
+                                max_retries,
+                                e,
+                            )
+                        else:
+                            logger.error(
+                                "Vocabulary extraction failed for module %d after %d attempts: %s",
+                                i + 1,
+                                max_retries,
+                                e,
+                            )
+                            # Continue with empty vocabulary for this module
+
+            completed_modules += 1
 
             # Build module
             module = AnalyzedModule(
                 module_id=i + 1,
-                title=mod_data.get("title", f"Module {i + 1}"),
+                title=module_title,
                 start_page=start_page,
                 end_page=end_page,
                 pages=module_pages,
@@ -457,16 +727,28 @@ class UnifiedAnalysisService:
                 language=primary_language,
                 summary=summary,
                 vocabulary=vocabulary,
+                extracted_at=extracted_at,
             )
-            modules.append(module)
 
             logger.info(
                 "Module %d/%d complete: %s - %d vocabulary words",
                 i + 1,
-                len(detected_modules),
+                total_modules,
                 module.title,
                 len(vocabulary),
             )
+            return module
+
+        # gather keeps the results in module order
+        modules = list(
+            await asyncio.gather(
+                *(
+                    process_module(i, mod_data)
+                    for i, mod_data in enumerate(detected_modules)
+                )
+            )
+        )
+        difficulty_levels = {module.difficulty_level for module in modules}
 
         # Build final result
         result = UnifiedAnalysisResult(
@@ -480,9 +762,13 @@ class UnifiedAnalysisService:
             difficulty_range=sorted(difficulty_levels),
             method="chunked_ai",
             processing_time_seconds=time.time() - start_time,
-            llm_model=self.llm_service.primary_provider.default_model,
+            llm_model=self._chunked_model_label(),
         )
 
+        # The run finished, so a later analysis should start fresh
+        if state_dir:
+            shutil.rmtree(state_dir, ignore_errors=True)
+
         if progress_callback:
             progress_callback(100, 100)
         if detailed_progress_callback:
@@ -504,17 +790,123 @@ class UnifiedAnalysisService:
 
         return result
 
+    def _analysis_state_dir(
+        self, publisher_id: str, book_id: str, text_content: str
+    ) -> Path | None:
+        """
+        Directory holding resumable state for one chunked analysis.
+
+        The directory name includes a hash of the prepared text, so state
+        saved for an earlier extraction of the book is never reused.
+
+        Returns:
+            State directory, or None when resumable state is disabled.
+        """
+        if not self.settings.unified_analysis_state_dir:
+            return None
+        digest = hashlib.sha256(text_content.encode("utf-8")).hexdigest()[:16]
+        return (
+            Path(self.settings.unified_analysis_state_dir)
+            / publisher_id
+            / book_id
+            / digest
+        )
+
+    def _prune_analysis_state(self, state_dir: Path) -> None:
+        """
+        Remove saved state that no run will resume.
+
+        Runs that keep failing leave their state behind, and a book whose
+        text was extracted again gets a new directory. State for other
+        extractions of the same book is removed, as is any state not touched
+        within unified_analysis_state_max_age_hours.
+        """
+        root = Path(self.settings.unified_analysis_state_dir)
+        cutoff = time.time() - self.settings.unified_analysis_state_max_age_hours * 3600
+        for path in root.glob("*/*/*"):
+            if path == state_dir or not path.is_dir():
+                continue
+            try:
+                stale = path.parent == state_dir.parent or path.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if stale:
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _read_state(path: Path) -> dict[str, Any] | None:
+        """Load a saved state file, or None if it is missing or unreadable."""
+        try:
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_state(path: Path, data: dict[str, Any]) -> None:
+        """Save a state file atomically; failures only cost resumability."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to save analysis state %s: %s", path, e)
+
+    def _chunked_model_label(self) -> str:
+        """Describe the models used by a chunked analysis for the result."""
+        default_model = self.llm_service.primary_provider.default_model
+        phase1_model = self.settings.unified_analysis_phase1_model or default_model
+        phase2_model = self.settings.unified_analysis_phase2_model or default_model
+        if phase1_model == phase2_model:
+            return phase1_model
+        return f"phase1={phase1_model}, phase2={phase2_model}"
+
+    def _response_cache_key(self, prompt: str, model: str | None = None) -> str:
+        """Build the cache key for an LLM prompt sent to the given model."""
+        raw = (
+            f"{self.settings.llm_primary_provider}|"
+            f"{model or self.settings.llm_default_model}|{prompt}"
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get_cached_response(self, key: str) -> dict[str, Any] | None:
+        """Return a cached parsed response, or None on a miss."""
+        raw = self._response_cache.get(key)
+        if raw is None:
+            return None
+        self._response_cache.move_to_end(key)
+        return json.loads(raw)
+
+    def _cache_response(self, key: str, data: dict[str, Any]) -> None:
+        """Store a parsed response, evicting the least recently used."""
+        max_entries = self.settings.unified_analysis_cache_size
+        if max_entries <= 0:
+            return
+        self._response_cache[key] = json.dumps(data, ensure_ascii=False)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > max_entries:
+            self._response_cache.popitem(last=False)
+
     async def _phase1_detect_modules(
         self,
         text_content: str,
-        total_pages: int,
+        last_page: int,
         max_retries: int = 3,
+        first_page: int = 1,
     ) -> dict[str, Any]:
-        """Phase 1: Detect all modules in the book."""
+        """Phase 1: Detect all modules in pages first_page..last_page."""
         prompt = PHASE1_DETECT_MODULES_PROMPT.format(
             text_content=text_content,
-            total_pages=total_pages,
+            total_pages=last_page - first_page + 1,
+            first_page=first_page,
+            last_page=last_page,
         )
+        model = self.settings.unified_analysis_phase1_model or None
+        cache_key = self._response_cache_key(prompt, model)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Phase 1 served from cache")
+            return cached
 
         for attempt in range(max_retries):
             try:
@@ -527,9 +919,13 @@ class UnifiedAnalysisService:
                     ),
                     temperature=0.2,
                     max_tokens=4000,
+                    model=model,
+                    json_mode=True,
                 )
 
-                return self._parse_json_response(response)
+                data = self._parse_json_response(response)
+                self._cache_response(cache_key, data)
+                return data
 
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -544,6 +940,51 @@ class UnifiedAnalysisService:
 
         return {"modules": []}
 
+    async def _phase1_detect_modules_windowed(
+        self,
+        pages: dict[int, str],
+        total_pages: int,
+        max_retries: int = 3,
+    ) -> dict[str, Any]:
+        """
+        Phase 1 for long books: detect modules per page window, then merge.
+
+        Each window gets the whole text budget, so long books keep more text
+        per page, and the window calls run concurrently.
+        """
+        page_numbers = sorted(pages)
+        windows = _page_windows(page_numbers[0], page_numbers[-1])
+        semaphore = asyncio.Semaphore(self.settings.unified_analysis_concurrency)
+        logger.info("Phase 1 split into %d page windows", len(windows))
+
+        async def detect(start_page: int, end_page: int) -> dict[str, Any]:
+            lo = bisect_left(page_numbers, start_page)
+            hi = bisect_right(page_numbers, end_page)
+            window_text = self._prepare_text_content(
+                {p: pages[p] for p in page_numbers[lo:hi]}
+            )
+            async with semaphore:
+                data = await self._phase1_detect_modules(
+                    text_content=window_text,
+                    first_page=start_page,
+                    last_page=end_page,
+                    max_retries=max_retries,
+                )
+            # The window only saw its own pages, so anything the model
+            # reports beyond them is a guess
+            data["modules"] = _clamp_modules(
+                data.get("modules", []), start_page, end_page
+            )
+            return data
+
+        results = await asyncio.gather(*(detect(*w) for w in windows))
+        languages = Counter(r["language"] for r in results if r.get("language"))
+        return {
+            "language": languages.most_common(1)[0][0] if languages else "en",
+            "total_pages": total_pages,
+            "modules": _merge_window_modules([r.get("modules", []) for r in results]),
+        }
+
     async def _phase2_extract_vocabulary(
         self,
         module_title: str,
@@ -562,6 +1003,12 @@ class UnifiedAnalysisService:
             difficulty_level=difficulty_level,
             module_text=module_text[:50000],  # Limit text size
         )
+        model = self.settings.unified_analysis_phase2_model or None
+        cache_key = self._response_cache_key(prompt, model)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Phase 2 for '%s' served from cache", module_title)
+            return cached
 
         response = await self.llm_service.simple_completion(
             prompt=prompt,
@@ -572,15 +1019,28 @@ class UnifiedAnalysisService:
             ),
             temperature=0.3,
             max_tokens=4000,
+            model=model,
+            json_mode=True,
         )
 
-        return self._parse_json_response(response)
+        data = self._parse_json_response(response)
+        self._cache_response(cache_key, data)
+        return data
 
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response, handling various formats."""
         response = response.strip()
 
-        # Try to find JSON object in response
+        # Fast path: bare JSON, as JSON mode and the prompts ask for
+        try:
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+
+        # Try to find JSON object in response (drops code fences and prose)
         json_start = response.find("{")
         json_end = response.rfind("}")
 
@@ -588,134 +1048,109 @@ class UnifiedAnalysisService:
             json_str = response[json_start : json_end + 1]
         else:
             # Fallback: remove markdown code blocks
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            json_str = response.strip()
+            json_str = _CODE_FENCE_RE.sub("", response).strip()
 
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to parse JSON response: %s", e)
-            logger.debug("Response was: %s", response[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response was: %s", response[:500])
             raise ValueError(f"Invalid JSON response: {e}") from e
 
-    def _get_pages_text(
-        self,
-        pages: dict[int, str],
-        start_page: int,
-        end_page: int,
-    ) -> str:
-        """Get concatenated text for a page range."""
-        text_parts = []
-        for page_num in range(start_page, end_page + 1):
-            if page_num in pages:
-                text_parts.append(f"--- Page {page_num} ---\n{pages[page_num]}")
-        return "\n\n".join(text_parts)
-
     def _parse_vocabulary(self, vocab_data: dict[str, Any]) -> list[VocabularyWord]:
-        """Parse vocabulary from response data."""
-        vocabulary: list[VocabularyWord] = []
-        for v in vocab_data.get("vocabulary", []):
-            word = VocabularyWord(
-                word=v.get("word", ""),
-                definition=v.get("definition", ""),
-                translation=v.get("translation", ""),
-                part_of_speech=v.get("part_of_speech", ""),
-                example_sentence=v.get("example_sentence", ""),
-                difficulty=v.get("difficulty", "intermediate"),
-                phonetic=v.get("phonetic", ""),
+        """Parse vocabulary from response data, skipping entries without a word."""
+        # One comprehension with positional arguments; words are parsed by
+        # the thousand for long books
+        return [
+            VocabularyWord(
+                word,
+                v.get("definition", ""),
+                v.get("translation", ""),
+                v.get("part_of_speech", ""),
+                v.get("example_sentence", ""),
+                v.get("difficulty", "intermediate"),
+                v.get("phonetic", ""),
             )
-            if word.word:
-                vocabulary.append(word)
-        return vocabulary
+            for v in vocab_data.get("vocabulary", [])
+            if (word := v.get("word"))
+        ]
 
     def _prepare_text_content(
         self,
         pages: dict[int, str],
         max_chars_per_page: int = 1200,
-        max_total_chars: int = 80000,
+        max_total_tokens: int = 20000,
     ) -> str:
         """
         Prepare text content with page markers for LLM.
 
         Uses smart summarization for very long books while ensuring
-        ALL pages are represented.
+        ALL pages are represented: each page is truncated to a share of the
+        token budget proportional to its compressed size.
         """
-        parts = []
-        total_chars = 0
-        total_pages = max(pages.keys()) if pages else 0
-
-        # First pass: calculate if we need to truncate
-        full_content_size = sum(len(pages.get(p, "")) for p in pages)
+        # Single pass: strip and size every non-empty page
+        entries = [
+            (page_num, stripped)
+            for page_num, text in sorted(pages.items())
+            if (stripped := text.strip())
+        ]
+        tokens = [_estimate_tokens(text) for _, text in entries]
+        full_tokens = sum(tokens)
+
+        # Extracted PDF/OCR text carries padding and running headers that cost
+        # tokens without helping module detection; drop them before truncating
+        if full_tokens > max_total_tokens:
+            compacted = _drop_running_lines(
+                {p: _compact_whitespace(text) for p, text in entries}
+            )
+            entries = [(p, text) for p, text in compacted.items() if text]
+            tokens = [_estimate_tokens(text) for _, text in entries]
+            compacted_tokens = sum(tokens)
+            logger.info(
+                "Compacted page text from ~%d to ~%d tokens",
+                full_tokens,
+                compacted_tokens,
+            )
+            full_tokens = compacted_tokens
 
         # If content fits, include everything
-        if full_content_size <= max_total_chars:
-            for page_num in sorted(pages.keys()):
-                text = pages.get(page_num, "").strip()
-                if not text:
-                    continue
-                page_marker = f"\n--- Page {page_num} ---\n"
-                parts.append(page_marker + text)
-            return "".join(parts)
-
-        # Otherwise, use smart truncation per page
-        chars_per_page = (
-            max_total_chars // total_pages if total_pages > 0 else max_chars_per_page
-        )
-        chars_per_page = max(200, min(chars_per_page, max_chars_per_page))
-
-        for page_num in sorted(pages.keys()):
-            text = pages.get(page_num, "").strip()
-            if not text:
-                continue
+        if full_tokens <= max_total_tokens:
+            return "".join(
+                f"\n--- Page {page_num} ---\n{text}" for page_num, text in entries
+            )
 
-            # Truncate long pages but ensure ALL pages are included
-            if len(text) > chars_per_page:
-                text = text[:chars_per_page] + "..."
+        # Otherwise, share the budget between pages by information density.
+        # Compressed size is a cheap entropy proxy, so dense lesson pages get
+        # more room than sparse contents pages or filler.
+        weights = [len(zlib.compress(text.encode("utf-8"), 1)) for _, text in entries]
+        total_weight = sum(weights) or 1
 
-            page_marker = f"\n--- Page {page_num} ---\n"
-            page_content = page_marker + text
-            parts.append(page_content)
-            total_chars += len(page_content)
+        # Truncate long pages but ensure ALL pages are included
+        parts = []
+        total_tokens = 0
+        for (page_num, text), page_tokens, weight in zip(
+            entries, tokens, weights, strict=True
+        ):
+            # Convert the page's token share to characters at its own ratio
+            budget = max(50, max_total_tokens * weight // total_weight)
+            budget = min(budget * len(text) // (page_tokens or 1), max_chars_per_page)
+            if len(text) > budget:
+                text = text[:budget] + "..."
+                page_tokens = _estimate_tokens(text)
+            parts.append(f"\n--- Page {page_num} ---\n{text}")
+            total_tokens += page_tokens
 
         # Add note about page count
-        if total_chars > max_total_chars:
+        if total_tokens > max_total_tokens:
             logger.warning(
-                "Text content exceeds limit (%d > %d), some pages truncated",
-                total_chars,
-                max_total_chars,
+                "Text content exceeds limit (~%d > %d tokens), some pages truncated",
+                total_tokens,
+                max_total_tokens,
             )
 
         return "".join(parts)
 
-    def _parse_response(self, response: str) -> dict[str, Any]:
-        """Parse LLM JSON response."""
-        response = response.strip()
-
-        # Remove markdown code blocks if present
-        if response.startswith("```"):
-            lines = response.split("\n")
-            # Find end of code block
-            end_idx = len(lines)
-            for i in range(len(lines) - 1, 0, -1):
-                if lines[i].strip() == "```":
-                    end_idx = i
-                    break
-            response = "\n".join(lines[1:end_idx])
-            response = response.strip()
-
-        try:
-            data = json.loads(response)
-            return data
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse LLM response as JSON: %s", e)
-            logger.debug("Response was: %s", response[:500])
-            raise ValueError(f"Invalid JSON response from LLM: {e}") from e
-
     def _build_result(
         self,
         book_id: str,
@@ -732,6 +1167,8 @@ class UnifiedAnalysisService:
 
         modules: list[AnalyzedModule] = []
         difficulty_levels: set[str] = set()
+        extracted_at = datetime.now(timezone.utc)
+        page_index = _PageIndex(pages)
 
         for i, mod_data in enumerate(modules_data):
             start_page = mod_data.get("start_page", 1)
@@ -739,26 +1176,9 @@ class UnifiedAnalysisService:
 
             # Collect pages and text for this module
             module_pages = list(range(start_page, end_page + 1))
-            text_parts = []
-            for page_num in module_pages:
-                if page_num in pages:
-                    text_parts.append(pages[page_num])
-            text = "\n\n".join(text_parts)
+            text = page_index.text(start_page, end_page)
 
-            # Parse vocabulary
-            vocabulary: list[VocabularyWord] = []
-            for vocab_data in mod_data.get("vocabulary", []):
-                word = VocabularyWord(
-                    word=vocab_data.get("word", ""),
-                    definition=vocab_data.get("definition", ""),
-                    translation=vocab_data.get("translation", ""),
-                    part_of_speech=vocab_data.get("part_of_speech", ""),
-                    example_sentence=vocab_data.get("example_sentence", ""),
-                    difficulty=vocab_data.get("difficulty", "intermediate"),
-                    phonetic=vocab_data.get("phonetic", ""),
-                )
-                if word.word:  # Only add if word is not empty
-                    vocabulary.append(word)
+            vocabulary = self._parse_vocabulary(mod_data)
 
             difficulty = mod_data.get("difficulty_level", "intermediate")
             difficulty_levels.add(difficulty)
@@ -776,6 +1196,7 @@ class UnifiedAnalysisService:
                 language=primary_language,
                 summary=mod_data.get("summary", ""),
                 vocabulary=vocabulary,
+                extracted_at=extracted_at,
             )
             modules.append(module)
 
@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 import io
-import json
 import logging
+import tarfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from app.core.config import get_settings
-from app.services.unified_analysis.models import UnifiedAnalysisResult
+from app.services.unified_analysis.models import (
+    AnalyzedModule,
+    UnifiedAnalysisResult,
+    UnifiedAnalysisStorageError,
+    VocabularyWord,
+)
 
 if TYPE_CHECKING:
     from app.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# vocabulary.json "id" encodings. Audio generation keys files and lookups on
+# the "word_{n}" strings, so "int" and "none" only suit books without audio.
+_VOCAB_ID_FORMATS: dict[str, Callable[[int], Any] | None] = {
+    "string": "word_{}".format,
+    "int": int,
+    "none": None,
+}
+
 
 class UnifiedAnalysisStorage:
     """Storage service for saving unified analysis results to MinIO."""
@@ -23,8 +42,9 @@ class UnifiedAnalysisStorage:
         """Initialize storage service."""
         self.settings = settings or get_settings()
 
-    def _get_minio_client(self):
-        """Get MinIO client."""
+    @cached_property
+    def _client(self):
+        """MinIO client, created once so its connection pool is reused."""
         from app.services.minio import get_minio_client
 
         return get_minio_client(self.settings)
@@ -38,94 +58,206 @@ class UnifiedAnalysisStorage:
 
         Saves:
         - modules/{module_id}.json for each module (compatible with existing format)
-        - vocabulary.json (aggregated vocabulary)
+        - vocabulary.json (aggregated vocabulary), unless disabled; the module
+          metadata then carries a vocabulary_index pointing at module files
         - analysis_metadata.json (processing info)
+        - modules.tar bundling every module file, when enabled, so consumers
+          can fetch all modules in one request
 
         Args:
             result: UnifiedAnalysisResult to save.
 
         Returns:
-            Dict with saved file paths and counts.
+            Dict with saved file paths and counts; "failed" lists optional
+            uploads (the bundle) that failed.
+
+        Raises:
+            UnifiedAnalysisStorageError: If a module, metadata or vocabulary
+                file failed to upload, so the job fails and is retried.
         """
-        client = self._get_minio_client()
+        client = self._client
         bucket = self.settings.minio_publishers_bucket
         base_path = f"{result.publisher_id}/books/{result.book_name}/ai-data"
+        vocab_path = f"{base_path}/vocabulary.json"
+        modules_meta_path = f"{base_path}/modules/metadata.json"
+        bundle_path = f"{base_path}/modules.tar"
 
-        saved_modules = []
-        saved_vocab_count = 0
-
-        # Save each module
+        # Results are read by services, not people, so they are stored
+        # compact unless indentation is switched on for debugging
+        pretty = self.settings.unified_analysis_pretty_json
+        option = orjson.OPT_INDENT_2 if pretty else None
+        module_paths: dict[int, str] = {}
+        uploads: dict[str, Callable[[], bytes]] = {}
         for module in result.modules:
-            module_path = f"{base_path}/modules/module_{module.module_id}.json"
-            module_data = module.to_dict()
+            path = f"{base_path}/modules/module_{module.module_id}.json"
+            module_paths[module.module_id] = path
+            uploads[path] = partial(module.to_json, pretty)
+
+        modules_meta = self._build_modules_metadata(result)
+        # Audio generation reads vocabulary.json, so it is only skipped when
+        # switched off; readers then gather words from the listed modules
+        write_vocab = self.settings.unified_analysis_write_vocabulary
+        if write_vocab:
+            vocab_data = self._build_vocabulary(
+                result, self.settings.unified_analysis_vocab_id_format
+            )
+            # orjson writes UTF-8 bytes directly, without an intermediate str
+            uploads[vocab_path] = lambda: orjson.dumps(vocab_data, option=option)
+        else:
+            modules_meta["vocabulary_index"] = [
+                {
+                    "module_id": m.module_id,
+                    "count": len(m.vocabulary),
+                    "path": module_paths[m.module_id],
+                }
+                for m in result.modules
+            ]
+        uploads[modules_meta_path] = lambda: orjson.dumps(modules_meta, option=option)
+        content_types = dict.fromkeys(uploads, "application/json")
+
+        # Module files are small, so per-request overhead dominates reading
+        # them one by one; the bundle lets consumers fetch them all at once
+        bundle = self.settings.unified_analysis_module_bundle and bool(result.modules)
+        if bundle:
+            uploads[bundle_path] = partial(
+                self._build_module_bundle, result.modules, pretty
+            )
+            content_types[bundle_path] = "application/x-tar"
 
-            try:
-                content = json.dumps(module_data, indent=2, ensure_ascii=False)
-                content_bytes = content.encode("utf-8")
-                client.put_object(
+        # Uploads are independent round trips to MinIO, so they run on a
+        # thread pool sharing the client (its connection pool is thread-safe)
+        failed: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.settings.minio_upload_concurrency)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._put_object,
+                    client,
                     bucket,
-                    module_path,
-                    data=io.BytesIO(content_bytes),
-                    length=len(content_bytes),
-                    content_type="application/json",
-                )
-                saved_modules.append(module_path)
-                saved_vocab_count += len(module.vocabulary)
-                logger.debug("Saved module %d to %s", module.module_id, module_path)
-            except Exception as e:
-                logger.error("Failed to save module %d: %s", module.module_id, e)
-
-        # Save aggregated vocabulary.json (compatible with existing format)
-        vocab_path = f"{base_path}/vocabulary.json"
+                    path,
+                    serialize,
+                    content_types[path],
+                ): path
+                for path, serialize in uploads.items()
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    future.result()
+                    logger.debug("Saved %s", path)
+                except Exception as e:
+                    failed.add(path)
+                    logger.error("Failed to save %s: %s", path, e)
 
-        # Build vocabulary words with unique IDs
-        vocab_words = []
-        word_counter = 0
+        # Readers fall back to the module files when the bundle is missing;
+        # anything else missing would leave the book half-analyzed
+        required = sorted(failed - {bundle_path})
+        if required:
+            raise UnifiedAnalysisStorageError(result.book_id, required)
+
+        if write_vocab:
+            logger.info(
+                "Saved vocabulary.json with %d words", vocab_data["total_words"]
+            )
+        logger.info("Saved modules metadata.json")
+
+        return {
+            "modules": list(module_paths.values()),
+            "vocabulary": vocab_path if write_vocab else None,
+            "modules_metadata": modules_meta_path,
+            "bundle": bundle_path if bundle and bundle_path not in failed else None,
+            "module_count": len(module_paths),
+            # Counted like vocabulary.json, so words repeated across modules
+            # are only counted once
+            "vocabulary_count": len(result.all_vocabulary),
+            "failed": sorted(failed),
+        }
+
+    @staticmethod
+    def _put_object(
+        client: Any,
+        bucket: str,
+        path: str,
+        serialize: Callable[[], bytes],
+        content_type: str,
+    ) -> None:
+        """Serialize a document and upload it."""
+        content_bytes = serialize()
+        client.put_object(
+            bucket,
+            path,
+            data=io.BytesIO(content_bytes),
+            length=len(content_bytes),
+            content_type=content_type,
+        )
+
+    @staticmethod
+    def _build_module_bundle(modules: list[AnalyzedModule], pretty: bool) -> bytes:
+        """Build an uncompressed tar holding modules/module_{id}.json files."""
+        buf = io.BytesIO()
+        mtime = int(time.time())
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            for module in modules:
+                content_bytes = module.to_json(pretty)
+                info = tarfile.TarInfo(f"modules/module_{module.module_id}.json")
+                info.size = len(content_bytes)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(content_bytes))
+        return buf.getvalue()
+
+    @staticmethod
+    def _build_vocabulary(
+        result: UnifiedAnalysisResult, id_format: str = "string"
+    ) -> dict[str, Any]:
+        """
+        Build vocabulary.json (compatible with existing format).
+
+        Args:
+            result: UnifiedAnalysisResult to aggregate.
+            id_format: "string" for "word_{n}" IDs, "int" for bare sequence
+                numbers, or "none" to omit IDs (array position identifies
+                the word). Unknown values fall back to "string".
+        """
+        # Words repeated in later modules keep their first occurrence
+        # (case-insensitive)
+        first_seen: dict[str, tuple[AnalyzedModule, VocabularyWord]] = {}
         for module in result.modules:
             for v in module.vocabulary:
-                word_counter += 1
-                vocab_words.append(
-                    {
-                        "id": f"word_{word_counter}",
-                        "word": v.word,
-                        "definition": v.definition,
-                        "translation": v.translation,
-                        "part_of_speech": v.part_of_speech,
-                        "example": v.example_sentence,
-                        "level": v.difficulty,
-                        "phonetic": v.phonetic,
-                        "module_id": module.module_id,
-                        "module_title": module.title,
-                    }
-                )
-
-        vocab_data = {
+                first_seen.setdefault(v.word.casefold(), (module, v))
+
+        # Build vocabulary words with unique IDs
+        make_id = _VOCAB_ID_FORMATS.get(id_format, _VOCAB_ID_FORMATS["string"])
+        vocab_words = [
+            {
+                **({"id": make_id(i)} if make_id else {}),
+                "word": v.word,
+                "definition": v.definition,
+                "translation": v.translation,
+                "part_of_speech": v.part_of_speech,
+                "example": v.example_sentence,
+                "level": v.difficulty,
+                "phonetic": v.phonetic,
+                "module_id": module.module_id,
+                "module_title": module.title,
+            }
+            for i, (module, v) in enumerate(first_seen.values(), start=1)
+        ]
+
+        return {
             "book_id": result.book_id,
             "publisher_id": result.publisher_id,
             "book_name": result.book_name,
             "language": result.primary_language,
             "translation_language": result.translation_language,
-            "total_words": result.total_vocabulary,
+            "total_words": len(vocab_words),
             "words": vocab_words,
         }
 
-        try:
-            content = json.dumps(vocab_data, indent=2, ensure_ascii=False)
-            content_bytes = content.encode("utf-8")
-            client.put_object(
-                bucket,
-                vocab_path,
-                data=io.BytesIO(content_bytes),
-                length=len(content_bytes),
-                content_type="application/json",
-            )
-            logger.info("Saved vocabulary.json with %d words", result.total_vocabulary)
-        except Exception as e:
-            logger.error("Failed to save vocabulary.json: %s", e)
-
-        # Save modules metadata (compatible with existing format)
-        modules_meta_path = f"{base_path}/modules/metadata.json"
-        modules_meta = {
+    @staticmethod
+    def _build_modules_metadata(result: UnifiedAnalysisResult) -> dict[str, Any]:
+        """Build modules/metadata.json (compatible with existing format)."""
+        return {
             "book_id": result.book_id,
             "publisher_id": result.publisher_id,
             "book_name": result.book_name,
@@ -151,28 +283,6 @@ class UnifiedAnalysisStorage:
             ],
         }
 
-        try:
-            content = json.dumps(modules_meta, indent=2, ensure_ascii=False)
-            content_bytes = content.encode("utf-8")
-            client.put_object(
-                bucket,
-                modules_meta_path,
-                data=io.BytesIO(content_bytes),
-                length=len(content_bytes),
-                content_type="application/json",
-            )
-            logger.info("Saved modules metadata.json")
-        except Exception as e:
-            logger.error("Failed to save modules metadata: %s", e)
-
-        return {
-            "modules": saved_modules,
-            "vocabulary": vocab_path,
-            "modules_metadata": modules_meta_path,
-            "module_count": len(saved_modules),
-            "vocabulary_count": saved_vocab_count,
-        }
-
 
 # Singleton instance
 _unified_storage: UnifiedAnalysisStorage | None = None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -118,20 +120,18 @@ class DuplicateVocabularyError(VocabularyExtractionError):
 # =============================================================================
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=16384)
 def _slugify(text: str) -> str:
     """Create a URL-safe slug from text."""
-    import re
-
-    # Convert to lowercase
-    slug = text.lower()
-    # Replace spaces and special chars with underscores
-    slug = re.sub(r"[^a-z0-9]+", "_", slug)
-    # Remove leading/trailing underscores
-    slug = slug.strip("_")
-    return slug
+    # Lowercase, replace spaces and special chars with underscores,
+    # then remove leading/trailing underscores
+    return _SLUG_RE.sub("_", text.lower()).strip("_")
 
 
-@dataclass
+@dataclass(slots=True)
 class VocabularyWord:
     """A single vocabulary word with all metadata."""
 
@@ -183,7 +183,7 @@ class VocabularyWord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleVocabularyResult:
     """Result of vocabulary extraction for a single module."""
 
@@ -216,7 +216,7 @@ class ModuleVocabularyResult:
         return [w.id for w in self.words]
 
 
-@dataclass
+@dataclass(slots=True)
 class BookVocabularyResult:
     """Result of vocabulary extraction for an entire book."""
 
@@ -240,8 +240,8 @@ class BookVocabularyResult:
         if not self.module_results:
             return
 
-        self.success_count = sum(1 for r in self.module_results if r.success)
-        self.failure_count = sum(1 for r in self.module_results if not r.success)
+        self.success_count = sum(r.success for r in self.module_results)
+        self.failure_count = len(self.module_results) - self.success_count
 
     @property
     def total_words(self) -> int:
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable
 
+import orjson
+
 from app.core.config import get_settings
 from app.services.llm import LLMProviderError, get_llm_service
 from app.services.vocabulary_extraction.models import (
@@ -15,6 +20,7 @@ from app.services.vocabulary_extraction.models import (
     InvalidLLMResponseError,
     ModuleVocabularyResult,
     NoModulesFoundError,
+    PartOfSpeech,
     VocabularyWord,
 )
 from app.services.vocabulary_extraction.prompts import (
@@ -29,6 +35,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Accepted LLM values, built once instead of per word; anything else
+# (including "unknown") is stored as ""
+_VALID_LEVELS = frozenset({"A1", "A2", "B1", "B2", "C1", "C2"})
+_VALID_POS = frozenset(p.value for p in PartOfSpeech if p is not PartOfSpeech.UNKNOWN)
+
+# Response parsing helpers, built once for every parsed LLM response
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+_JSON_DECODER = json.JSONDecoder()
+
 
 class VocabularyExtractionService:
     """
@@ -56,6 +72,11 @@ class VocabularyExtractionService:
         """
         self.settings = settings or get_settings()
         self._llm_service = llm_service
+        # Raw LLM responses keyed by request hash. Only responses that parsed
+        # are stored, so a malformed answer is retried on the next run.
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @property
     def llm_service(self) -> LLMService:
@@ -64,6 +85,68 @@ class VocabularyExtractionService:
             self._llm_service = get_llm_service()
         return self._llm_service
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Get response cache hit/miss counters and current size."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._response_cache),
+        }
+
+    def _response_cache_key(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> str:
+        """Build the cache key for an LLM request."""
+        raw = (
+            f"{self.settings.llm_primary_provider}|"
+            f"{self.settings.llm_default_model}|{temperature}|{max_tokens}|"
+            f"{SYSTEM_PROMPT}|{prompt}"
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def _cached_completion(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> tuple[str, str | None]:
+        """
+        Run an LLM completion, serving repeated requests from the cache.
+
+        Args:
+            prompt: User prompt.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens to generate.
+
+        Returns:
+            Tuple of (response text, cache key). The key is None when caching
+            is disabled; pass it to _cache_response once the response parsed.
+        """
+        key = None
+        if self.settings.vocabulary_cache_size > 0:
+            key = self._response_cache_key(prompt, temperature, max_tokens)
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached, key
+            self._cache_misses += 1
+
+        response = await self.llm_service.simple_completion(
+            prompt=prompt,
+            system_prompt=SYSTEM_PROMPT,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response, key
+
+    def _cache_response(self, key: str | None, response: str) -> None:
+        """Store a parsed response, evicting the least recently used."""
+        if key is None:
+            return
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.settings.vocabulary_cache_size:
+            self._response_cache.popitem(last=False)
+
     def _parse_json_array_response(
         self, response: str, module_id: int, book_id: str
     ) -> list[dict[str, Any]]:
@@ -85,25 +168,23 @@ class VocabularyExtractionService:
         cleaned = response.strip()
 
         # Remove markdown code blocks like ```json ... ``` or ``` ... ```
-        cleaned = re.sub(r"^```(?:json)?\s*\n?", "", cleaned)
-        cleaned = re.sub(r"\n?```\s*$", "", cleaned)
+        cleaned = _FENCE_OPEN_RE.sub("", cleaned)
+        cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
         cleaned = cleaned.strip()
 
         # Try direct parse first (cleanest case)
         try:
-            result = json.loads(cleaned)
+            result = orjson.loads(cleaned)
             if isinstance(result, list):
                 return result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
-        # Try to extract JSON array from response
-        json_match = re.search(r"\[[\s\S]*?\](?=\s*$|\s*```)", cleaned)
-        if not json_match:
-            # Try more aggressive match
-            json_match = re.search(r"\[[\s\S]*\]", cleaned)
-
-        if not json_match:
+        # Decode the array that starts at the first "[". raw_decode stops at
+        # its matching "]", so surrounding prose and brackets inside string
+        # values need no regex scan or substring copy.
+        start = cleaned.find("[")
+        if start == -1:
             raise InvalidLLMResponseError(
                 book_id=book_id,
                 module_id=module_id,
@@ -111,16 +192,8 @@ class VocabularyExtractionService:
                 parse_error="No JSON array found in response",
             )
 
-        json_str = json_match.group(0)
         try:
-            result = json.loads(json_str)
-            if not isinstance(result, list):
-                raise InvalidLLMResponseError(
-                    book_id=book_id,
-                    module_id=module_id,
-                    response=response[:500],
-                    parse_error="Response is not a JSON array",
-                )
+            result, _ = _JSON_DECODER.raw_decode(cleaned, start)
             return result
         except json.JSONDecodeError as e:
             raise InvalidLLMResponseError(
@@ -161,24 +234,12 @@ class VocabularyExtractionService:
 
             # Validate difficulty level
             level = str(item.get("level", "")).upper()
-            if level not in ["A1", "A2", "B1", "B2", "C1", "C2"]:
+            if level not in _VALID_LEVELS:
                 level = ""
 
             # Validate part of speech
             pos = str(item.get("part_of_speech", "")).lower()
-            valid_pos = [
-                "noun",
-                "verb",
-                "adjective",
-                "adverb",
-                "pronoun",
-                "preposition",
-                "conjunction",
-                "interjection",
-                "article",
-                "determiner",
-            ]
-            if pos not in valid_pos:
+            if pos not in _VALID_POS:
                 pos = ""
 
             vocab_word = VocabularyWord(
@@ -282,11 +343,8 @@ class VocabularyExtractionService:
         tokens_used = 0
 
         try:
-            response = await self.llm_service.simple_completion(
-                prompt=prompt,
-                system_prompt=SYSTEM_PROMPT,
-                temperature=temperature,
-                max_tokens=2048,
+            response, cache_key = await self._cached_completion(
+                prompt, temperature, max_tokens=2048
             )
             provider_name = (
                 self.llm_service.primary_provider.provider_name
@@ -296,6 +354,7 @@ class VocabularyExtractionService:
 
             # Parse response
             parsed = self._parse_json_array_response(response, module_id, book_id)
+            self._cache_response(cache_key, response)
             words = self._extract_vocabulary_words(
                 parsed, module_id, max_words, min_word_length
             )
@@ -328,14 +387,12 @@ class VocabularyExtractionService:
                     max_words=max_words // 2,
                     max_length=max_text // 2,
                 )
-                response = await self.llm_service.simple_completion(
-                    prompt=simple_prompt,
-                    system_prompt=SYSTEM_PROMPT,
-                    temperature=temperature,
-                    max_tokens=1024,
+                response, cache_key = await self._cached_completion(
+                    simple_prompt, temperature, max_tokens=1024
                 )
 
                 parsed = self._parse_json_array_response(response, module_id, book_id)
+                self._cache_response(cache_key, response)
                 words = self._extract_vocabulary_words(
                     parsed, module_id, max_words, min_word_length
                 )
@@ -434,29 +491,39 @@ class VocabularyExtractionService:
             len(modules),
         )
 
-        module_results: list[ModuleVocabularyResult] = []
-        all_words: list[VocabularyWord] = []
+        # Modules are independent, so their LLM calls run concurrently,
+        # bounded to stay within provider rate limits
         total = len(modules)
+        semaphore = asyncio.Semaphore(max(1, self.settings.vocabulary_concurrency))
+        completed = 0
 
-        for i, module_data in enumerate(modules):
+        async def process_module(
+            i: int, module_data: dict[str, Any]
+        ) -> ModuleVocabularyResult:
+            nonlocal completed
             module_id = module_data.get("module_id", i + 1)
-            module_title = module_data.get("title", f"Module {module_id}")
-            module_text = module_data.get("text", "")
-            difficulty = module_data.get("difficulty", "B1")
-
-            result = await self.extract_module_vocabulary(
-                module_id=module_id,
-                module_title=module_title,
-                module_text=module_text,
-                book_id=book_id,
-                difficulty=difficulty,
-                language=language,
-            )
-            module_results.append(result)
-            all_words.extend(result.words)
+            async with semaphore:
+                result = await self.extract_module_vocabulary(
+                    module_id=module_id,
+                    module_title=module_data.get("title", f"Module {module_id}"),
+                    module_text=module_data.get("text", ""),
+                    book_id=book_id,
+                    difficulty=module_data.get("difficulty", "B1"),
+                    language=language,
+                )
 
+            # Progress reflects completed modules, not start order
+            completed += 1
             if progress_callback:
-                progress_callback(i + 1, total)
+                progress_callback(completed, total)
+            return result
+
+        # gather keeps module order, so deduplication still favours the
+        # earliest module
+        module_results = await asyncio.gather(
+            *(process_module(i, m) for i, m in enumerate(modules))
+        )
+        all_words = [word for result in module_results for word in result.words]
 
         # Deduplicate vocabulary across all modules
         deduplicated_words = self._deduplicate_vocabulary(all_words)
@@ -468,7 +535,7 @@ class VocabularyExtractionService:
             language=language,
             translation_language=translation_language,
             words=deduplicated_words,
-            module_results=module_results,
+            module_results=list(module_results),
             extracted_at=datetime.now(timezone.utc),
         )
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from minio.error import S3Error
 
 from app.core.config import get_settings
@@ -46,6 +48,21 @@ class VocabularyStorage:
         """
         self.settings = settings or get_settings()
 
+    @property
+    def _io_workers(self) -> int:
+        """Get the number of MinIO requests to run in parallel."""
+        return max(1, self.settings.minio_upload_concurrency)
+
+    @staticmethod
+    def _get_json(client: Any, bucket: str, path: str) -> dict[str, Any]:
+        """Download an object and decode it as JSON."""
+        response = client.get_object(bucket, path)
+        try:
+            return orjson.loads(response.read())
+        finally:
+            response.close()
+            response.release_conn()
+
     def _build_ai_data_path(
         self,
         publisher_id: str,
@@ -118,11 +135,7 @@ class VocabularyStorage:
         path = self._build_vocabulary_path(publisher_id, book_id, book_name)
 
         try:
-            response = client.get_object(bucket, path)
-            data = response.read()
-            response.close()
-            response.release_conn()
-            return json.loads(data.decode("utf-8"))
+            return self._get_json(client, bucket, path)
         except S3Error as e:
             if e.code == "NoSuchKey":
                 return None
@@ -153,8 +166,8 @@ class VocabularyStorage:
         # Use the vocabulary.json format
         vocabulary_data = book_result.to_dict()
 
-        json_str = json.dumps(vocabulary_data, indent=2, ensure_ascii=False)
-        json_bytes = json_str.encode("utf-8")
+        # orjson encodes the dict tree to UTF-8 in C, without an intermediate str
+        json_bytes = orjson.dumps(vocabulary_data, option=orjson.OPT_INDENT_2)
         data = BytesIO(json_bytes)
 
         try:
@@ -200,11 +213,7 @@ class VocabularyStorage:
         path = self._build_module_path(publisher_id, book_id, book_name, module_id)
 
         try:
-            response = client.get_object(bucket, path)
-            data = response.read()
-            response.close()
-            response.release_conn()
-            return json.loads(data.decode("utf-8"))
+            return self._get_json(client, bucket, path)
         except S3Error as e:
             if e.code == "NoSuchKey":
                 return None
@@ -233,24 +242,23 @@ class VocabularyStorage:
         prefix = (
             self._build_ai_data_path(publisher_id, book_id, book_name, "modules") + "/"
         )
-        modules: list[dict[str, Any]] = []
 
         try:
             objects = client.list_objects(bucket, prefix=prefix, recursive=False)
-
-            for obj in objects:
+            names = [
+                obj.object_name
+                for obj in objects
                 # Skip metadata files
-                if "metadata" in obj.object_name:
-                    continue
-                if not obj.object_name.endswith(".json"):
-                    continue
-
-                # Load module
-                response = client.get_object(bucket, obj.object_name)
-                data = response.read()
-                response.close()
-                response.release_conn()
-                modules.append(json.loads(data.decode("utf-8")))
+                if "metadata" not in obj.object_name
+                and obj.object_name.endswith(".json")
+            ]
+
+            # Each module is a separate round trip, so they are downloaded in
+            # parallel on the shared client (its connection pool is thread-safe)
+            with ThreadPoolExecutor(max_workers=self._io_workers) as executor:
+                modules = list(
+                    executor.map(partial(self._get_json, client, bucket), names)
+                )
 
         except S3Error as e:
             logger.error("Failed to list modules: %s", e)
@@ -303,8 +311,7 @@ class VocabularyStorage:
         existing["vocabulary_extracted_at"] = module_result.extracted_at.isoformat()
 
         # Save updated module
-        json_str = json.dumps(existing, indent=2, ensure_ascii=False)
-        json_bytes = json_str.encode("utf-8")
+        json_bytes = orjson.dumps(existing, option=orjson.OPT_INDENT_2)
         data = BytesIO(json_bytes)
 
         try:
@@ -348,6 +355,7 @@ class VocabularyStorage:
             book_result.book_id,
         )
 
+        to_update: list[ModuleVocabularyResult] = []
         for module_result in book_result.module_results:
             if not module_result.success:
                 logger.debug(
@@ -356,14 +364,28 @@ class VocabularyStorage:
                 )
                 failed_count += 1
                 continue
+            to_update.append(module_result)
+
+        # Each update is a MinIO read and write, so modules are updated in
+        # parallel; results are still collected in module order
+        with ThreadPoolExecutor(max_workers=self._io_workers) as executor:
+            futures = [
+                (
+                    module_result,
+                    executor.submit(
+                        self.update_module_vocabulary_ids,
+                        publisher_id=book_result.publisher_id,
+                        book_id=book_result.book_id,
+                        book_name=book_result.book_name,
+                        module_result=module_result,
+                    ),
+                )
+                for module_result in to_update
+            ]
 
+        for module_result, future in futures:
             try:
-                path = self.update_module_vocabulary_ids(
-                    publisher_id=book_result.publisher_id,
-                    book_id=book_result.book_id,
-                    book_name=book_result.book_name,
-                    module_result=module_result,
-                )
+                path = future.result()
                 if path:
                     updated_paths.append(path)
                 else:
@@ -411,8 +433,7 @@ class VocabularyStorage:
 
         metadata = book_result.to_metadata_dict()
 
-        json_str = json.dumps(metadata, indent=2, ensure_ascii=False)
-        json_bytes = json_str.encode("utf-8")
+        json_bytes = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
         data = BytesIO(json_bytes)
 
         try:
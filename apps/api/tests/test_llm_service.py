@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from app.services.llm.base import (
@@ -223,6 +224,17 @@ class TestDeepSeekProvider:
         # Total: $0.42
         assert cost == pytest.approx(0.42, rel=0.01)
 
+    def test_json_mode_sets_response_format(self, deepseek_provider):
+        """Test that JSON mode asks DeepSeek for a JSON object."""
+        request = LLMRequest.from_prompt("Hello", json_mode=True)
+        payload = deepseek_provider._build_payload(request, "deepseek-chat")
+        assert payload["response_format"] == {"type": "json_object"}
+
+        plain = deepseek_provider._build_payload(
+            LLMRequest.from_prompt("Hello"), "deepseek-chat"
+        )
+        assert "response_format" not in plain
+
     @pytest.mark.asyncio
     async def test_auth_error(self, deepseek_provider):
         """Test authentication error handling."""
@@ -249,6 +261,55 @@ class TestDeepSeekProvider:
                 await deepseek_provider.complete(LLMRequest.from_prompt("test"))
             assert exc_info.value.retry_after == 30.0
 
+    @pytest.mark.asyncio
+    async def test_stream_complete_parses_sse(self, deepseek_provider):
+        """Test that streamed SSE deltas are yielded in order."""
+        body = (
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+        real_client = httpx.AsyncClient
+
+        with patch(
+            "app.services.llm.deepseek.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            chunks = [
+                chunk
+                async for chunk in deepseek_provider.stream_complete(
+                    LLMRequest.from_prompt("Hello")
+                )
+            ]
+
+        assert chunks == ["Hel", "lo"]
+
+    @pytest.mark.asyncio
+    async def test_stream_complete_malformed_chunk(self, deepseek_provider):
+        """Test that a truncated SSE chunk raises a provider error."""
+        body = (
+            "data:\n\n"
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+            'data: {"choices": [{"delta": {"cont\n\n'
+        )
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+        real_client = httpx.AsyncClient
+
+        chunks = []
+        with patch(
+            "app.services.llm.deepseek.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            with pytest.raises(LLMProviderError, match="Malformed stream chunk"):
+                async for chunk in deepseek_provider.stream_complete(
+                    LLMRequest.from_prompt("Hello")
+                ):
+                    chunks.append(chunk)
+
+        assert chunks == ["Hel"]
+
 
 # =============================================================================
 # Gemini Provider Tests
@@ -318,6 +379,35 @@ class TestGeminiProvider:
         # Total: $0.375
         assert cost == pytest.approx(0.375, rel=0.01)
 
+    @pytest.mark.asyncio
+    async def test_stream_complete_malformed_chunk(self, gemini_provider):
+        """Test that an unexpected SSE chunk shape raises a provider error."""
+        body = (
+            'data: {"candidates": [{"content": {"parts": [{"text": "Hi"}]}}]}\n\n'
+            'data: {"candidates": ["oops"]}\n\n'
+        )
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+        real_client = httpx.AsyncClient
+
+        chunks = []
+        with patch(
+            "app.services.llm.gemini.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            with pytest.raises(LLMProviderError, match="Malformed stream chunk"):
+                async for chunk in gemini_provider.stream_complete(
+                    LLMRequest.from_prompt("Hello")
+                ):
+                    chunks.append(chunk)
+
+        assert chunks == ["Hi"]
+
+    def test_json_mode_sets_response_mime_type(self, gemini_provider):
+        """Test that JSON mode asks Gemini for an application/json response."""
+        request = LLMRequest.from_prompt("Hello", json_mode=True)
+        _, payload = gemini_provider._build_payload(request)
+        assert payload["generationConfig"]["responseMimeType"] == "application/json"
+
 
 # =============================================================================
 # LLM Service Tests
@@ -378,6 +468,36 @@ class TestLLMService:
         assert response.content == "Hello from fallback"
         assert response.provider == "gemini"
 
+    @pytest.mark.asyncio
+    async def test_fallback_drops_primary_model_override(self, mock_settings):
+        """Test that a model override is not sent to the fallback provider."""
+        mock_primary = AsyncMock(spec=DeepSeekProvider)
+        mock_primary.provider_name = "deepseek"
+        mock_primary.complete.side_effect = LLMProviderError(
+            "API Error", provider="deepseek"
+        )
+
+        mock_fallback = AsyncMock(spec=GeminiProvider)
+        mock_fallback.provider_name = "gemini"
+        mock_fallback.complete.return_value = LLMResponse(
+            content="Hello from fallback",
+            usage=LLMUsage(prompt_tokens=10, completion_tokens=5),
+            model="gemini-1.5-flash",
+            provider="gemini",
+        )
+
+        service = LLMService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        with patch("app.services.llm.service.asyncio.sleep", new_callable=AsyncMock):
+            await service.simple_completion("test", model="deepseek-reasoner")
+
+        assert mock_primary.complete.call_args.args[0].model == "deepseek-reasoner"
+        assert mock_fallback.complete.call_args.args[0].model is None
+
     @pytest.mark.asyncio
     async def test_both_providers_fail(self, mock_settings):
         """Test error when both providers fail."""
@@ -460,6 +580,90 @@ class TestLLMService:
         result = await service.simple_completion("Hello")
         assert result == "Simple response"
 
+    @pytest.mark.asyncio
+    async def test_stream_completion_forwards_model(self, mock_settings):
+        """Test that streaming passes the requested model to the provider."""
+        requests = []
+
+        async def stream(request):
+            requests.append(request)
+            yield "Hi"
+
+        mock_primary = MagicMock(spec=DeepSeekProvider)
+        mock_primary.provider_name = "deepseek"
+        mock_primary.stream_complete.side_effect = stream
+
+        service = LLMService(settings=mock_settings, primary_provider=mock_primary)
+
+        chunks = [
+            chunk
+            async for chunk in service.stream_completion(
+                "Hello", model="deepseek-reasoner"
+            )
+        ]
+
+        assert chunks == ["Hi"]
+        assert requests[0].model == "deepseek-reasoner"
+
+    @pytest.mark.asyncio
+    async def test_stream_completion_falls_back_before_first_chunk(self, mock_settings):
+        """Test that streaming falls back when the primary fails up front."""
+        mock_settings.llm_max_retries = 0
+
+        async def failing_stream(request):
+            raise LLMProviderError("API Error", provider="deepseek")
+            yield  # pragma: no cover
+
+        async def fallback_stream(request):
+            yield "Hello "
+            yield "from fallback"
+
+        mock_primary = MagicMock(spec=DeepSeekProvider)
+        mock_primary.provider_name = "deepseek"
+        mock_primary.stream_complete.side_effect = failing_stream
+
+        mock_fallback = MagicMock(spec=GeminiProvider)
+        mock_fallback.provider_name = "gemini"
+        mock_fallback.stream_complete.side_effect = fallback_stream
+
+        service = LLMService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        chunks = [chunk async for chunk in service.stream_completion("Hello")]
+        assert "".join(chunks) == "Hello from fallback"
+
+    @pytest.mark.asyncio
+    async def test_stream_completion_does_not_fall_back_after_text(self, mock_settings):
+        """Test that a stream failing mid-way is not restarted elsewhere."""
+
+        async def broken_stream(request):
+            yield "partial"
+            raise LLMProviderError("Dropped", provider="deepseek")
+
+        mock_primary = MagicMock(spec=DeepSeekProvider)
+        mock_primary.provider_name = "deepseek"
+        mock_primary.stream_complete.side_effect = broken_stream
+
+        mock_fallback = MagicMock(spec=GeminiProvider)
+        mock_fallback.provider_name = "gemini"
+
+        service = LLMService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        chunks = []
+        with pytest.raises(LLMProviderError, match="Dropped"):
+            async for chunk in service.stream_completion("Hello"):
+                chunks.append(chunk)
+
+        assert chunks == ["partial"]
+        mock_fallback.stream_complete.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_vision_uses_gemini(self, mock_settings):
         """Test that vision requests use Gemini provider."""
@@ -491,6 +695,25 @@ class TestLLMService:
         assert service.primary_provider is None
         assert service.fallback_provider is None
 
+    @pytest.mark.asyncio
+    async def test_providers_share_http_client(self, mock_settings):
+        """Test that providers reuse the service's HTTP client until aclose."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            service = LLMService(settings=mock_settings)
+            deepseek = service.get_provider("deepseek")
+            gemini = service.get_provider("gemini")
+            assert deepseek._get_client() is mock_client
+            assert gemini._get_client() is mock_client
+            mock_client_class.assert_called_once()
+
+            await service.aclose()
+
+            mock_client.aclose.assert_awaited_once()
+            assert service._providers == {}
+
 
 # =============================================================================
 # Exception Tests
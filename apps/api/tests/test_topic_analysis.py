@@ -237,6 +237,28 @@ class TestBookAnalysisResult:
         assert d["publisher_id"] == "pub-1"
         assert d["module_count"] == 0
 
+    def test_to_metadata_dict_excludes_modules(self):
+        """Test metadata dictionary omits per-module results."""
+        result = BookAnalysisResult(
+            book_id="book-123",
+            publisher_id="pub-1",
+            book_name="Test",
+            module_results=[
+                ModuleAnalysisResult(
+                    module_id=1,
+                    module_title="Unit 1",
+                    topic_result=TopicResult(topics=["greetings"]),
+                    success=True,
+                ),
+            ],
+        )
+        d = result.to_metadata_dict()
+        assert "modules" not in d
+        assert d["module_count"] == 1
+        assert d["success_count"] == 1
+        full = result.to_dict()
+        assert {k: v for k, v in full.items() if k != "modules"} == d
+
 
 class TestExceptions:
     """Tests for exception classes."""
@@ -795,6 +817,9 @@ class TestTopicStorage:
         """Create mock settings."""
         settings = MagicMock()
         settings.minio_publishers_bucket = "publishers"
+        settings.topic_analysis_cache_modules = False
+        settings.topic_analysis_cache_max_entries = 256
+        settings.topic_analysis_cache_ttl_seconds = 60
         return settings
 
     @pytest.fixture
@@ -943,6 +968,90 @@ class TestTopicStorage:
         assert result[0]["module_id"] == 1
         assert result[1]["module_id"] == 2
 
+    @patch("app.services.topic_analysis.storage.get_minio_client")
+    def test_client_is_reused_across_calls(self, mock_get_client, storage):
+        """Test that one MinIO client is created and reused."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({"module_id": 1}).encode()
+        mock_client.get_object.return_value = mock_response
+
+        storage.get_module("pub-1", "book-123", "TestBook", 1)
+        storage.get_module("pub-1", "book-123", "TestBook", 2)
+
+        mock_get_client.assert_called_once()
+        assert mock_client.get_object.call_count == 2
+
+    @patch("app.services.topic_analysis.storage.get_minio_client")
+    def test_get_module_cache_serves_repeat_reads(
+        self, mock_get_client, storage, mock_settings
+    ):
+        """Test that cached modules skip the MinIO round-trip."""
+        mock_settings.topic_analysis_cache_modules = True
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {"module_id": 1, "topics": []}
+        ).encode()
+        mock_client.get_object.return_value = mock_response
+
+        first = storage.get_module("pub-1", "book-123", "TestBook", 1)
+        first["topics"] = ["mutated"]
+        second = storage.get_module("pub-1", "book-123", "TestBook", 1)
+
+        assert mock_client.get_object.call_count == 1
+        assert second["topics"] == []
+
+    @patch("app.services.topic_analysis.storage.get_minio_client")
+    def test_get_module_cache_refreshed_by_update(
+        self, mock_get_client, storage, mock_settings
+    ):
+        """Test that a successful update refreshes the cached module."""
+        mock_settings.topic_analysis_cache_modules = True
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {"module_id": 1, "topics": []}
+        ).encode()
+        mock_client.get_object.return_value = mock_response
+
+        module_result = ModuleAnalysisResult(
+            module_id=1,
+            module_title="Test",
+            topic_result=TopicResult(topics=["greetings"]),
+            success=True,
+        )
+        storage.update_module_with_topics(
+            "pub-1", "book-123", "TestBook", module_result
+        )
+        cached = storage.get_module("pub-1", "book-123", "TestBook", 1)
+
+        assert mock_client.get_object.call_count == 1
+        assert cached["topics"] == ["greetings"]
+
+    @patch("app.services.topic_analysis.storage.get_minio_client")
+    def test_get_module_cache_expires(self, mock_get_client, storage, mock_settings):
+        """Test that expired cache entries are fetched again."""
+        mock_settings.topic_analysis_cache_modules = True
+        mock_settings.topic_analysis_cache_ttl_seconds = 0
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps({"module_id": 1}).encode()
+        mock_client.get_object.return_value = mock_response
+
+        with patch(
+            "app.services.topic_analysis.storage.time.monotonic",
+            side_effect=[100.0, 101.0, 101.0],
+        ):
+            storage.get_module("pub-1", "book-123", "TestBook", 1)
+            storage.get_module("pub-1", "book-123", "TestBook", 1)
+
+        assert mock_client.get_object.call_count == 2
+
 
 # =============================================================================
 # Test Enums
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,6 +21,12 @@ from app.services.tts.base import (
     get_default_voice,
 )
 from app.services.tts.azure import AzureTTSProvider
+from app.services.tts.concurrency import (
+    BackpressureController,
+    CreditSemaphore,
+    current_batch_admission,
+    run_batch,
+)
 from app.services.tts.edge import EdgeTTSProvider
 from app.services.tts.service import TTSService
 
@@ -43,6 +50,15 @@ def mock_settings():
     settings.tts_timeout_seconds = 30
     settings.tts_max_retries = 3
     settings.tts_batch_concurrency = 5
+    settings.tts_retry_initial_backoff_seconds = 0.01
+    settings.tts_retry_max_backoff_seconds = 0.05
+    settings.tts_retry_backoff_multiplier = 2.0
+    settings.tts_retry_jitter = True
+    settings.tts_cache_size = 0
+    settings.tts_circuit_breaker_threshold = 0
+    settings.tts_circuit_breaker_cooldown_seconds = 30.0
+    settings.azure_tts_credits_per_period = 0
+    settings.azure_tts_period_seconds = 60.0
     return settings
 
 
@@ -115,6 +131,10 @@ class TestTTSRequest:
         assert request_slow.speed == 0.5
         assert request_fast.speed == 2.0
 
+    def test_nan_speed_rejected(self):
+        with pytest.raises(ValueError, match="Speed must be between"):
+            TTSRequest(text="Hello", speed=float("nan"))
+
 
 class TestTTSResponse:
     """Tests for TTSResponse model."""
@@ -200,6 +220,43 @@ class TestEdgeTTSProvider:
             assert response.provider == "edge"
             assert response.character_count == 5
 
+    @pytest.mark.asyncio
+    async def test_synthesize_joins_audio_chunks(self, edge_provider):
+        """Test that streamed audio chunks are concatenated in order."""
+
+        async def mock_stream():
+            yield {"type": "audio", "data": b"abc"}
+            yield {"type": "WordBoundary", "offset": 0}
+            yield {"type": "audio", "data": b"def"}
+
+        mock_communicate = MagicMock()
+        mock_communicate.stream = mock_stream
+
+        with patch("edge_tts.Communicate", return_value=mock_communicate):
+            request = TTSRequest(text="Hello", language="en")
+            response = await edge_provider.synthesize(request)
+
+        assert response.audio_data == b"abcdef"
+        assert response.character_count == 5
+
+    @pytest.mark.asyncio
+    async def test_synthesize_stream_yields_audio_chunks(self, edge_provider):
+        """Test that streaming yields audio chunks without buffering."""
+
+        async def mock_stream():
+            yield {"type": "audio", "data": b"abc"}
+            yield {"type": "WordBoundary", "offset": 0}
+            yield {"type": "audio", "data": b"def"}
+
+        mock_communicate = MagicMock()
+        mock_communicate.stream = mock_stream
+
+        with patch("edge_tts.Communicate", return_value=mock_communicate):
+            request = TTSRequest(text="Hello", language="en")
+            chunks = [c async for c in edge_provider.synthesize_stream(request)]
+
+        assert chunks == [b"abc", b"def"]
+
     @pytest.mark.asyncio
     async def test_synthesize_error_handling(self, edge_provider):
         """Test error handling in synthesis."""
@@ -235,6 +292,36 @@ class TestEdgeTTSProvider:
             assert result.failure_count == 0
             assert len(result.results) == 2
 
+    @pytest.mark.asyncio
+    async def test_batch_rate_limited_items_fail(self, edge_provider):
+        """Test that rate-limited batch items are reported as failures."""
+
+        async def mock_synthesize(request):
+            raise TTSRateLimitError(provider="edge")
+
+        with patch.object(edge_provider, "synthesize", mock_synthesize):
+            items = [TTSBatchItem(text=f"Item {i}", language="en") for i in range(3)]
+            result = await edge_provider.synthesize_batch(items, concurrency=3)
+
+            assert result.success_count == 0
+            assert result.failure_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_ordered_by_index(self, edge_provider):
+        """Test that batch errors are reported in item order."""
+
+        async def mock_synthesize(request):
+            # Later items fail first
+            await asyncio.sleep(0.01 * (3 - int(request.text)))
+            raise TTSProviderError(f"Failed {request.text}", provider="edge")
+
+        with patch.object(edge_provider, "synthesize", mock_synthesize):
+            items = [TTSBatchItem(text=str(i), language="en") for i in range(3)]
+            result = await edge_provider.synthesize_batch(items, concurrency=3)
+
+        assert [index for index, _ in result.errors] == [0, 1, 2]
+        assert result.errors[0][1] == "[edge] Failed 0"
+
     def test_get_voice_with_override(self, edge_provider):
         """Test voice selection with override."""
         voice = edge_provider.get_voice("en", "custom-voice")
@@ -246,6 +333,142 @@ class TestEdgeTTSProvider:
         assert voice == "tr-TR-EmelNeural"
 
 
+# =============================================================================
+# Backpressure Controller Tests
+# =============================================================================
+
+
+class TestBackpressureController:
+    """Tests for the adaptive concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Test that no more than the limit run at once."""
+        controller = BackpressureController(2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.active)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    async def test_shrink_and_grow_are_bounded(self):
+        """Test that the limit stays within min and max."""
+        controller = BackpressureController(2)
+
+        controller.shrink()
+        controller.shrink()
+        assert controller.limit == 1
+
+        await controller.grow()
+        await controller.grow()
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_release_grows_after_cooldown(self):
+        """Test that the limit recovers once the cooling period has passed."""
+        controller = BackpressureController(3, cooldown_seconds=5.0)
+
+        with patch("app.services.tts.concurrency.time.monotonic", return_value=100.0):
+            await controller.acquire()
+            controller.shrink()
+            await controller.release()
+        assert controller.limit == 2
+
+        with patch("app.services.tts.concurrency.time.monotonic", return_value=106.0):
+            await controller.acquire()
+            await controller.release()
+        assert controller.limit == 3
+
+
+class TestCreditSemaphore:
+    """Tests for the per-character credit limiter."""
+
+    @pytest.mark.asyncio
+    async def test_spends_credits_within_capacity(self):
+        """Test that requests within capacity do not wait."""
+        credits = CreditSemaphore(capacity=100, period_seconds=60.0)
+
+        await credits.acquire(40)
+        await credits.acquire(60)
+
+        assert credits.used == 100
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refund_when_exhausted(self):
+        """Test that an over-budget request waits until credits are refunded."""
+        credits = CreditSemaphore(capacity=100, period_seconds=0.05)
+
+        await credits.acquire(80)
+        with patch(
+            "app.services.tts.concurrency.asyncio.sleep", wraps=asyncio.sleep
+        ) as mock_sleep:
+            await credits.acquire(50)
+
+        assert mock_sleep.await_count >= 1
+        assert credits.used == 50
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_capped_at_capacity(self):
+        """Test that a request larger than capacity can still run alone."""
+        credits = CreditSemaphore(capacity=10, period_seconds=60.0)
+
+        await credits.acquire(500)
+
+        assert credits.used == 10
+
+
+class TestRunBatch:
+    """Tests for the shared batch admission loop."""
+
+    @pytest.mark.asyncio
+    async def test_results_and_errors_in_item_order(self, mock_audio_data):
+        """Test that each item gets its own result or error."""
+        seen_admission = []
+
+        async def synthesize(text: str) -> TTSResponse:
+            seen_admission.append(current_batch_admission.get())
+            if text == "bad":
+                raise TTSProviderError("Failed", provider="edge")
+            return TTSResponse(audio_data=text.encode(), provider="edge")
+
+        controller = BackpressureController(2)
+        result = await run_batch(["a", "bad", "c"], synthesize, controller, "[Test]")
+
+        assert [r.audio_data if r else None for r in result.results] == [
+            b"a",
+            None,
+            b"c",
+        ]
+        assert result.errors == [(1, "[edge] Failed")]
+        assert (result.success_count, result.failure_count) == (2, 1)
+        assert seen_admission == [controller] * 3
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("shrink", "expected_limit"), [(True, 2), (False, 4)])
+    async def test_rate_limit_shrinks_unless_disabled(self, shrink, expected_limit):
+        """Test that rate-limited items shrink the limit only when asked to."""
+
+        async def synthesize(text: str) -> TTSResponse:
+            raise TTSRateLimitError(provider="azure")
+
+        controller = BackpressureController(4, cooldown_seconds=60.0)
+        result = await run_batch(
+            ["a", "b"], synthesize, controller, "[Test]", shrink_on_rate_limit=shrink
+        )
+
+        assert result.failure_count == 2
+        assert controller.limit == expected_limit
+
+
 # =============================================================================
 # Azure TTS Provider Tests
 # =============================================================================
@@ -268,12 +491,29 @@ class TestAzureTTSProvider:
         assert "&amp;" in ssml
         assert "&apos;" in ssml
 
+    def test_output_format_mapping(self, azure_provider):
+        """Test requested audio formats map to Azure output formats."""
+
+        def output_format(audio_format):
+            headers = azure_provider._get_headers("token", audio_format)
+            return headers["X-Microsoft-OutputFormat"]
+
+        assert output_format("mp3") == "audio-24khz-48kbitrate-mono-mp3"
+        assert output_format("WAV") == "riff-24khz-16bit-mono-pcm"
+        assert output_format("ogg") == "ogg-24khz-16bit-mono-opus"
+        assert output_format("flac") == "audio-24khz-48kbitrate-mono-mp3"
+
+    def test_ssml_escapes_each_char_once(self, azure_provider):
+        """Test already-escaped text is escaped exactly once."""
+        ssml = azure_provider._get_ssml('&lt; "quoted"', "voice", 1.0)
+        assert "&amp;lt; &quot;quoted&quot;" in ssml
+
     @pytest.mark.asyncio
     async def test_synthesize_success(self, azure_provider, mock_audio_data):
         """Test successful synthesis."""
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock token response
             mock_token_response = MagicMock()
@@ -300,7 +540,7 @@ class TestAzureTTSProvider:
         """Test authentication error handling."""
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             mock_response = MagicMock()
             mock_response.status_code = 401
@@ -311,12 +551,118 @@ class TestAzureTTSProvider:
             with pytest.raises(TTSAuthError):
                 await azure_provider.synthesize(request)
 
+    @pytest.mark.asyncio
+    async def test_rejected_token_refreshed_once(self, azure_provider, mock_audio_data):
+        """Test that a 401 on synthesis refreshes the token and retries once."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+
+            mock_unauthorized = MagicMock()
+            mock_unauthorized.status_code = 401
+            mock_unauthorized.text = "Unauthorized"
+
+            mock_tts_response = MagicMock()
+            mock_tts_response.status_code = 200
+            mock_tts_response.content = mock_audio_data
+
+            mock_client.post = AsyncMock(
+                side_effect=[
+                    mock_token_response,
+                    mock_unauthorized,
+                    mock_token_response,
+                    mock_tts_response,
+                ]
+            )
+
+            request = TTSRequest(text="Hello", language="en")
+            response = await azure_provider.synthesize(request)
+
+            assert response.audio_data == mock_audio_data
+            assert mock_client.post.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_stream_rejected_token_refreshed_once(self, azure_provider):
+        """Test that a 401 on streaming refreshes the token and retries once."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            first_token = MagicMock()
+            first_token.status_code = 200
+            first_token.text = "old-token"
+            second_token = MagicMock()
+            second_token.status_code = 200
+            second_token.text = "new-token"
+            mock_client.post = AsyncMock(side_effect=[first_token, second_token])
+
+            async def aiter_bytes(chunk_size):
+                yield b"ab"
+
+            mock_unauthorized = MagicMock()
+            mock_unauthorized.status_code = 401
+            mock_unauthorized.aread = AsyncMock()
+            mock_stream_response = MagicMock()
+            mock_stream_response.status_code = 200
+            mock_stream_response.aiter_bytes = aiter_bytes
+
+            contexts = []
+            for response in (mock_unauthorized, mock_stream_response):
+                stream_context = MagicMock()
+                stream_context.__aenter__ = AsyncMock(return_value=response)
+                stream_context.__aexit__ = AsyncMock(return_value=False)
+                contexts.append(stream_context)
+            mock_client.stream = MagicMock(side_effect=contexts)
+
+            request = TTSRequest(text="Hello", language="en")
+            chunks = [c async for c in azure_provider.synthesize_stream(request)]
+
+            assert chunks == [b"ab"]
+            assert mock_client.post.call_count == 2
+            headers = [
+                c.kwargs["headers"]["Authorization"]
+                for c in mock_client.stream.call_args_list
+            ]
+            assert headers == ["Bearer old-token", "Bearer new-token"]
+
+    @pytest.mark.asyncio
+    async def test_stream_auth_error_drops_token(self, azure_provider):
+        """Test that a second 401 on streaming raises and drops the token."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+            mock_client.post = AsyncMock(return_value=mock_token_response)
+
+            mock_unauthorized = MagicMock()
+            mock_unauthorized.status_code = 401
+            mock_unauthorized.aread = AsyncMock()
+            stream_context = MagicMock()
+            stream_context.__aenter__ = AsyncMock(return_value=mock_unauthorized)
+            stream_context.__aexit__ = AsyncMock(return_value=False)
+            mock_client.stream = MagicMock(return_value=stream_context)
+
+            request = TTSRequest(text="Hello", language="en")
+            with pytest.raises(TTSAuthError):
+                async for _ in azure_provider.synthesize_stream(request):
+                    pass
+
+            assert mock_client.stream.call_count == 2
+            assert azure_provider._token is None
+
     @pytest.mark.asyncio
     async def test_rate_limit_error(self, azure_provider):
         """Test rate limit error handling."""
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             # Mock token response (success)
             mock_token_response = MagicMock()
@@ -330,13 +676,160 @@ class TestAzureTTSProvider:
             mock_tts_response.headers = {"Retry-After": "30"}
 
             mock_client.post = AsyncMock(
-                side_effect=[mock_token_response, mock_tts_response]
+                side_effect=[mock_token_response] + [mock_tts_response] * 4
             )
 
             request = TTSRequest(text="Hello", language="en")
-            with pytest.raises(TTSRateLimitError) as exc_info:
-                await azure_provider.synthesize(request)
+            with patch(
+                "app.services.tts.azure.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep:
+                with pytest.raises(TTSRateLimitError) as exc_info:
+                    await azure_provider.synthesize(request)
             assert exc_info.value.retry_after == 30.0
+            # Retried max_retries times, waiting Retry-After each time
+            assert mock_sleep.await_count == 3
+            mock_sleep.assert_awaited_with(30.0)
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error_then_succeeds(
+        self, azure_provider, mock_audio_data
+    ):
+        """Test that a transient 5xx response is retried."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+
+            mock_error_response = MagicMock()
+            mock_error_response.status_code = 503
+            mock_error_response.text = "Service unavailable"
+
+            mock_tts_response = MagicMock()
+            mock_tts_response.status_code = 200
+            mock_tts_response.content = mock_audio_data
+
+            mock_client.post = AsyncMock(
+                side_effect=[
+                    mock_token_response,
+                    mock_error_response,
+                    mock_tts_response,
+                ]
+            )
+
+            request = TTSRequest(text="Hello", language="en")
+            with patch(
+                "app.services.tts.azure.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep:
+                response = await azure_provider.synthesize(request)
+
+            assert response.audio_data == mock_audio_data
+            assert mock_sleep.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_requests(self, azure_provider, mock_audio_data):
+        """Test that one HTTP client is shared by consecutive requests."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+
+            mock_tts_response = MagicMock()
+            mock_tts_response.status_code = 200
+            mock_tts_response.content = mock_audio_data
+
+            mock_client.post = AsyncMock(
+                side_effect=[mock_token_response, mock_tts_response, mock_tts_response]
+            )
+
+            request = TTSRequest(text="Hello", language="en")
+            await azure_provider.synthesize(request)
+            await azure_provider.synthesize(request)
+
+            mock_client_class.assert_called_once()
+            assert mock_client_class.call_args.kwargs["http2"] is True
+
+            await azure_provider.aclose()
+            mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_synthesize_stream(self, azure_provider):
+        """Test streaming synthesis yields response chunks."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+            mock_client.post = AsyncMock(return_value=mock_token_response)
+
+            async def aiter_bytes(chunk_size):
+                yield b"ab"
+                yield b"cd"
+
+            mock_stream_response = MagicMock()
+            mock_stream_response.status_code = 200
+            mock_stream_response.aiter_bytes = aiter_bytes
+
+            stream_context = MagicMock()
+            stream_context.__aenter__ = AsyncMock(return_value=mock_stream_response)
+            stream_context.__aexit__ = AsyncMock(return_value=False)
+            mock_client.stream = MagicMock(return_value=stream_context)
+
+            request = TTSRequest(text="Hello", language="en")
+            chunks = [c async for c in azure_provider.synthesize_stream(request)]
+
+            assert chunks == [b"ab", b"cd"]
+            assert mock_client.stream.call_args.args[0] == "POST"
+
+    @pytest.mark.asyncio
+    async def test_token_cached_until_near_expiry(
+        self, azure_provider, mock_audio_data
+    ):
+        """Test that the access token is fetched once and refreshed near expiry."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+
+            mock_tts_response = MagicMock()
+            mock_tts_response.status_code = 200
+            mock_tts_response.content = mock_audio_data
+
+            mock_client.post = AsyncMock(
+                side_effect=[
+                    mock_token_response,
+                    mock_tts_response,
+                    mock_tts_response,
+                    mock_token_response,
+                    mock_tts_response,
+                ]
+            )
+
+            request = TTSRequest(text="Hello", language="en")
+            with patch("app.services.tts.azure.time.monotonic", return_value=1000.0):
+                await azure_provider.synthesize(request)
+                await azure_provider.synthesize(request)
+            # Token was issued at t=1000 and is refreshed inside the margin
+            with patch("app.services.tts.azure.time.monotonic", return_value=1520.0):
+                await azure_provider.synthesize(request)
+
+            token_calls = [
+                c
+                for c in mock_client.post.call_args_list
+                if c.args[0] == azure_provider._token_endpoint
+            ]
+            assert len(token_calls) == 2
+            assert mock_client.post.call_count == 5
 
 
 # =============================================================================
@@ -396,6 +889,170 @@ class TestTTSService:
         assert response.audio_data == mock_audio_data
         assert response.provider == "azure"
 
+    @pytest.mark.asyncio
+    async def test_cache_serves_repeated_requests(self, mock_settings, mock_audio_data):
+        """Test that identical requests hit the provider only once."""
+        mock_settings.tts_cache_size = 8
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="edge"
+        )
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+
+        first = await service.synthesize(TTSRequest(text="Hello"))
+        second = await service.synthesize(TTSRequest(text="Hello"))
+        await service.synthesize(TTSRequest(text="Hello", speed=1.5))
+
+        assert first is second
+        assert mock_primary.synthesize.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_coalesces_concurrent_requests(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test that concurrent identical requests share one upstream call."""
+        mock_settings.tts_cache_size = 8
+        calls = 0
+
+        async def slow_synthesize(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return TTSResponse(audio_data=mock_audio_data, provider="edge")
+
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = slow_synthesize
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+
+        responses = await asyncio.gather(
+            *(service.synthesize(TTSRequest(text="Hello")) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(r.audio_data == mock_audio_data for r in responses)
+        assert service._inflight == {}
+
+    def test_cache_key_normalizes_unicode_and_whitespace(self):
+        """Test that whitespace and composition variants share a cache key."""
+        key = TTSService._cache_key(TTSRequest(text="café au lait"), None)
+        variants = ["cafe\u0301 au lait", " café\u00a0 au lait\n"]
+
+        for text in variants:
+            assert TTSService._cache_key(TTSRequest(text=text), None) == key
+        assert TTSService._cache_key(TTSRequest(text="Café au lait"), None) != key
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test that the cache is bounded by tts_cache_size."""
+        mock_settings.tts_cache_size = 2
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="edge"
+        )
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+
+        await service.synthesize(TTSRequest(text="one"))
+        await service.synthesize(TTSRequest(text="two"))
+        await service.synthesize(TTSRequest(text="one"))
+        await service.synthesize(TTSRequest(text="three"))
+        assert mock_primary.synthesize.await_count == 3
+
+        # "two" was least recently used and has been evicted
+        await service.synthesize(TTSRequest(text="two"))
+        assert mock_primary.synthesize.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_before_first_chunk(self, mock_settings):
+        """Test streaming falls back when the primary fails before any audio."""
+
+        async def failing_stream(request):
+            raise TTSProviderError("Connection failed", provider="edge")
+            yield b""
+
+        async def fallback_stream(request):
+            yield b"chunk1"
+            yield b"chunk2"
+
+        mock_primary = MagicMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize_stream = failing_stream
+
+        mock_fallback = MagicMock(spec=AzureTTSProvider)
+        mock_fallback.provider_name = "azure"
+        mock_fallback.synthesize_stream = fallback_stream
+
+        service = TTSService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        chunks = [c async for c in service.synthesize_stream(TTSRequest(text="Hi"))]
+        assert chunks == [b"chunk1", b"chunk2"]
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_before_first_chunk(self, mock_settings):
+        """Test that a provider is retried while no audio has been sent."""
+        attempts = 0
+
+        async def flaky_stream(request):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise TTSProviderError("Handshake failed", provider="edge")
+            yield b"chunk1"
+
+        mock_primary = MagicMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize_stream = flaky_stream
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+
+        chunks = [
+            c
+            async for c in service.synthesize_stream(
+                TTSRequest(text="Hi"), use_fallback=False
+            )
+        ]
+        assert chunks == [b"chunk1"]
+        assert attempts == 2
+        assert service._stream_admission.active == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_does_not_fall_back_after_audio_sent(self, mock_settings):
+        """Test a mid-stream failure is raised instead of restarting."""
+
+        async def partial_stream(request):
+            yield b"chunk1"
+            raise TTSProviderError("Stream dropped", provider="edge")
+
+        mock_primary = MagicMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize_stream = partial_stream
+
+        mock_fallback = MagicMock(spec=AzureTTSProvider)
+        mock_fallback.provider_name = "azure"
+
+        service = TTSService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        chunks = []
+        with pytest.raises(TTSProviderError, match="Stream dropped"):
+            async for chunk in service.synthesize_stream(TTSRequest(text="Hi")):
+                chunks.append(chunk)
+        assert chunks == [b"chunk1"]
+
     @pytest.mark.asyncio
     async def test_both_providers_fail(self, mock_settings):
         """Test error when both providers fail."""
@@ -420,6 +1077,47 @@ class TestTTSService:
         with pytest.raises(TTSProviderError, match="Fallback failed"):
             await service.synthesize(TTSRequest(text="Hello"))
 
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_skips_failing_primary(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test that a tripped primary is skipped until its cooldown passes."""
+        mock_settings.tts_max_retries = 0
+        mock_settings.tts_circuit_breaker_threshold = 2
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = TTSProviderError(
+            "Primary failed", provider="edge"
+        )
+
+        mock_fallback = AsyncMock(spec=AzureTTSProvider)
+        mock_fallback.provider_name = "azure"
+        mock_fallback.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="azure"
+        )
+
+        service = TTSService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+
+        for _ in range(4):
+            response = await service.synthesize(TTSRequest(text="Hello"))
+            assert response.provider == "azure"
+        assert mock_primary.synthesize.await_count == 2
+
+        # After the cooldown one probe reaches the primary again
+        service._breakers["edge"].opened_at -= 30.0
+        mock_primary.synthesize.side_effect = None
+        mock_primary.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="edge"
+        )
+        response = await service.synthesize(TTSRequest(text="Hello"))
+
+        assert response.provider == "edge"
+        assert service._breakers["edge"].opened_at is None
+
     @pytest.mark.asyncio
     async def test_no_fallback_mode(self, mock_settings):
         """Test disabling fallback."""
@@ -536,6 +1234,149 @@ class TestTTSService:
             assert result.failure_count == 1
             assert len(result.errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_identical_items(self, mock_settings, mock_audio_data):
+        """Test that identical batch items share one provider call."""
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="edge"
+        )
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+        items = [
+            TTSBatchItem(text="Hello", language="en"),
+            TTSBatchItem(text="World", language="en"),
+            TTSBatchItem(text="Hello", language="en"),
+            TTSBatchItem(text="Hello", language="tr"),
+        ]
+        result = await service.synthesize_batch(items)
+
+        assert mock_primary.synthesize.await_count == 3
+        assert result.success_count == 4
+        assert result.results[0] is result.results[2]
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupe_reports_error_for_each_item(self, mock_settings):
+        """Test that a failed shared item is reported at every index."""
+        mock_settings.tts_max_retries = 0
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = TTSProviderError(
+            "Failed", provider="edge"
+        )
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+        items = [TTSBatchItem(text="Hello"), TTSBatchItem(text="Hello")]
+        result = await service.synthesize_batch(items, use_fallback=False)
+
+        assert mock_primary.synthesize.await_count == 1
+        assert [index for index, _ in result.errors] == [0, 1]
+        assert result.failure_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_rate_limit_throttles_admission(self, mock_settings):
+        """Test that rate limits during a batch shrink its concurrency."""
+        mock_settings.tts_max_retries = 0
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = TTSRateLimitError(provider="edge")
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+        items = [TTSBatchItem(text=f"Item {i}") for i in range(3)]
+
+        with patch.object(
+            BackpressureController, "shrink", autospec=True
+        ) as mock_shrink:
+            result = await service.synthesize_batch(items, use_fallback=False)
+
+        assert result.failure_count == 3
+        assert mock_shrink.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_spawns_tasks_only_for_admitted_items(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test that a batch never has more tasks alive than its concurrency."""
+        peak_tasks = 0
+
+        async def synthesize(request):
+            nonlocal peak_tasks
+            # Exclude the test task itself
+            peak_tasks = max(peak_tasks, len(asyncio.all_tasks()) - 1)
+            await asyncio.sleep(0)
+            return TTSResponse(audio_data=mock_audio_data, provider="edge")
+
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = synthesize
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+        items = [TTSBatchItem(text=f"Item {i}") for i in range(10)]
+        result = await service.synthesize_batch(items, concurrency=2)
+
+        assert result.success_count == 10
+        assert peak_tasks == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_invalid_item_fails_without_synthesis(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test that an item rejected by TTSRequest is reported, not synthesized."""
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="edge"
+        )
+
+        service = TTSService(settings=mock_settings, primary_provider=mock_primary)
+        items = [TTSBatchItem(text="Hello"), TTSBatchItem(text="")]
+        result = await service.synthesize_batch(items)
+
+        assert result.success_count == 1
+        assert result.errors == [(1, "Text cannot be empty")]
+        mock_primary.synthesize.assert_awaited_once()
+
+    def test_backoff_delay_grows_with_jitter_and_cap(self, mock_settings):
+        """Test exponential backoff stays within its jitter band and cap."""
+        mock_settings.tts_retry_initial_backoff_seconds = 1.0
+        mock_settings.tts_retry_max_backoff_seconds = 16.0
+        service = TTSService(settings=mock_settings)
+
+        for attempt, step in [(0, 1.0), (2, 4.0), (10, 16.0)]:
+            delay = service._backoff_delay(attempt)
+            assert step / 2 <= delay <= step
+
+        mock_settings.tts_retry_jitter = False
+        assert service._backoff_delay(3) == 8.0
+
+    @pytest.mark.asyncio
+    async def test_warmup_calls_each_provider_and_swallows_errors(
+        self, mock_settings, mock_audio_data
+    ):
+        """Test warmup touches primary and fallback, ignoring failures."""
+        mock_primary = AsyncMock(spec=EdgeTTSProvider)
+        mock_primary.provider_name = "edge"
+        mock_primary.synthesize.side_effect = TTSProviderError(
+            "Offline", provider="edge"
+        )
+
+        mock_fallback = AsyncMock(spec=AzureTTSProvider)
+        mock_fallback.provider_name = "azure"
+        mock_fallback.synthesize.return_value = TTSResponse(
+            audio_data=mock_audio_data, provider="azure"
+        )
+
+        service = TTSService(
+            settings=mock_settings,
+            primary_provider=mock_primary,
+            fallback_provider=mock_fallback,
+        )
+        await service.warmup()
+
+        mock_primary.synthesize.assert_awaited_once()
+        mock_fallback.synthesize.assert_awaited_once()
+
     def test_no_azure_key_returns_none(self, mock_settings):
         """Test that Azure provider returns None when not configured."""
         mock_settings.azure_tts_key = ""
@@ -549,6 +1390,77 @@ class TestTTSService:
         assert provider is not None
         assert provider.provider_name == "edge"
 
+    def test_resolve_providers_memoized_until_names_change(self, mock_settings):
+        """Test that the provider pair is resolved once per configuration."""
+        mock_settings.tts_fallback_provider = "edge"
+        service = TTSService(settings=mock_settings)
+
+        with patch.object(
+            service, "get_provider", wraps=service.get_provider
+        ) as get_provider:
+            primary, fallback = service._resolve_providers()
+            assert primary.provider_name == "edge"
+            assert fallback is None  # Same provider as primary
+            service._resolve_providers()
+            assert get_provider.call_count == 2
+
+            mock_settings.tts_fallback_provider = "azure"
+            _, fallback = service._resolve_providers()
+            assert fallback.provider_name == "azure"
+            assert get_provider.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_azure_uses_shared_http_client(self, mock_settings):
+        """Test that Azure gets the service's HTTP client, closed by aclose."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            service = TTSService(settings=mock_settings)
+            provider = service.get_provider("azure")
+            assert provider._get_client() is mock_client
+
+            await service.aclose()
+
+            mock_client.aclose.assert_awaited_once()
+            assert service._providers == {}
+
+    @pytest.mark.asyncio
+    async def test_azure_rate_limit_retried_by_service_only(self, mock_settings):
+        """Test that a throttled Azure item is not retried at both layers."""
+        mock_settings.tts_primary_provider = "azure"
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_token_response = MagicMock()
+            mock_token_response.status_code = 200
+            mock_token_response.text = "test-token"
+            mock_throttled = MagicMock()
+            mock_throttled.status_code = 429
+            mock_throttled.text = "Rate limited"
+            mock_throttled.headers = {}
+
+            async def post(url, **kwargs):
+                if "issueToken" in url:
+                    return mock_token_response
+                return mock_throttled
+
+            mock_client.post = AsyncMock(side_effect=post)
+
+            service = TTSService(settings=mock_settings)
+            with pytest.raises(TTSRateLimitError):
+                await service.synthesize(
+                    TTSRequest(text="Hello", language="en"), use_fallback=False
+                )
+
+            synthesis_posts = [
+                c
+                for c in mock_client.post.call_args_list
+                if "issueToken" not in c.args[0]
+            ]
+            assert len(synthesis_posts) == mock_settings.tts_max_retries + 1
+
 
 # =============================================================================
 # Exception Tests
@@ -0,0 +1,810 @@
+"""Tests for the unified analysis service."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import tarfile
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+from itertools import pairwise
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.unified_analysis.models import (
+    AnalyzedModule,
+    UnifiedAnalysisResult,
+    UnifiedAnalysisStorageError,
+    VocabularyWord,
+)
+from app.services.unified_analysis.service import (
+    PHASE1_WINDOW_OVERLAP,
+    PHASE1_WINDOW_PAGES,
+    UnifiedAnalysisService,
+    _clamp_modules,
+    _drop_running_lines,
+    _estimate_tokens,
+    _merge_window_modules,
+    _page_windows,
+    _same_module,
+)
+from app.services.unified_analysis.storage import UnifiedAnalysisStorage
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings."""
+    settings = MagicMock()
+    settings.unified_analysis_concurrency = 5
+    settings.unified_analysis_cache_size = 0
+    settings.unified_analysis_state_dir = ""
+    settings.unified_analysis_state_max_age_hours = 48
+    settings.unified_analysis_phase1_model = ""
+    settings.unified_analysis_phase2_model = ""
+    settings.unified_analysis_min_module_chars = 0
+    settings.llm_primary_provider = "deepseek"
+    settings.llm_default_model = "deepseek-chat"
+    return settings
+
+
+@pytest.fixture
+def mock_llm_service():
+    """Create mock LLM service."""
+    llm_service = MagicMock()
+    llm_service.simple_completion = AsyncMock()
+    llm_service.primary_provider.default_model = "deepseek-chat"
+    return llm_service
+
+
+@pytest.fixture
+def service(mock_settings, mock_llm_service):
+    """Create service with mocked dependencies."""
+    return UnifiedAnalysisService(
+        settings=mock_settings,
+        llm_service=mock_llm_service,
+    )
+
+
+@pytest.fixture
+def storage_settings():
+    """Create mock settings for result storage."""
+    settings = MagicMock()
+    settings.minio_publishers_bucket = "publishers"
+    settings.minio_upload_concurrency = 4
+    settings.unified_analysis_pretty_json = False
+    settings.unified_analysis_module_bundle = True
+    settings.unified_analysis_vocab_id_format = "string"
+    settings.unified_analysis_write_vocabulary = True
+    return settings
+
+
+@pytest.fixture
+def analysis_result():
+    """Create a result whose modules share some vocabulary."""
+
+    def word(text: str) -> VocabularyWord:
+        return VocabularyWord(word=text, definition=f"{text} def", translation="tr")
+
+    return UnifiedAnalysisResult(
+        book_id="book-1",
+        publisher_id="pub-1",
+        book_name="Book",
+        total_pages=20,
+        modules=[
+            AnalyzedModule(
+                module_id=1,
+                title="Unit 1",
+                start_page=1,
+                end_page=10,
+                vocabulary=[word("apple"), word("book")],
+            ),
+            AnalyzedModule(
+                module_id=2,
+                title="Unit 2",
+                start_page=11,
+                end_page=20,
+                vocabulary=[word("Apple"), word("chair")],
+            ),
+        ],
+    )
+
+
+def make_storage(settings, put_object=None):
+    """Create storage with a mock client recording uploaded bytes."""
+    uploaded: dict[str, bytes] = {}
+
+    def record(bucket, path, data, length, content_type):
+        uploaded[path] = data.read()
+
+    client = MagicMock()
+    client.put_object.side_effect = put_object or record
+    storage = UnifiedAnalysisStorage(settings=settings)
+    storage.__dict__["_client"] = client
+    return storage, uploaded
+
+
+# =============================================================================
+# Test Models
+# =============================================================================
+
+
+class TestAnalyzedModule:
+    """Tests for module serialization."""
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_to_json_matches_to_dict(self, pretty):
+        """Test that to_json decodes to to_dict(), non-ASCII text included."""
+        module = AnalyzedModule(
+            module_id=3,
+            title="Ünite 3: Çarşı",
+            start_page=5,
+            end_page=6,
+            pages=[5, 6],
+            text="Öğrenciler pazara gider. 日本語",
+            topics=["Alışveriş"],
+            summary="Şehirde alışveriş",
+            vocabulary=[
+                VocabularyWord(
+                    word="market",
+                    definition="a place to buy food",
+                    translation="çarşı",
+                    example_sentence="We go to the market — every Sunday.",
+                )
+            ],
+            extracted_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        )
+
+        content = module.to_json(pretty)
+
+        assert json.loads(content) == module.to_dict()
+        assert "çarşı".encode() in content  # Raw UTF-8, not ASCII escapes
+
+
+# =============================================================================
+# Test Text Preparation
+# =============================================================================
+
+
+class TestEstimateTokens:
+    """Tests for the token estimate."""
+
+    def test_ascii_is_four_chars_per_token(self):
+        """Test that ASCII text costs about a token per four characters."""
+        assert _estimate_tokens("a" * 400) == 100
+
+    def test_non_ascii_is_one_token_per_char(self):
+        """Test that CJK characters cost a token each."""
+        assert _estimate_tokens("日本語" * 10) == 30
+        assert _estimate_tokens("abcd" + "日本") == 3
+
+
+class TestDropRunningLines:
+    """Tests for removing running headers and footers."""
+
+    def test_removes_lines_on_most_pages(self):
+        """Test that headers and footers repeated on most pages are removed."""
+        pages = {
+            n: f"ENGLISH PLUS 3\nUnit {n} reading\nOxford University Press"
+            for n in range(1, 7)
+        }
+
+        result = _drop_running_lines(pages)
+
+        assert result == {n: f"Unit {n} reading" for n in range(1, 7)}
+
+    def test_keeps_lines_on_few_pages(self):
+        """Test that a heading repeated on a few pages is kept."""
+        pages = {n: f"Page text {n}" for n in range(1, 9)}
+        pages[2] = pages[3] = "Unit 1: Animals\nMore text"
+
+        assert _drop_running_lines(pages) == pages
+
+    def test_short_books_keep_everything(self):
+        """Test that two pages are too few to call a line running."""
+        pages = {1: "Header\nOne", 2: "Header\nTwo"}
+
+        assert _drop_running_lines(pages) == pages
+
+
+class TestPrepareTextContent:
+    """Tests for preparing page text for Phase 1."""
+
+    def test_fitting_content_kept_with_page_markers(self, service):
+        """Test that content within budget is kept whole, blank pages skipped."""
+        pages = {2: "  Second page  ", 1: "First page", 3: "   "}
+
+        text = service._prepare_text_content(pages)
+
+        assert text == "\n--- Page 1 ---\nFirst page\n--- Page 2 ---\nSecond page"
+
+    def test_running_headers_removed_when_over_budget(self, service):
+        """Test that compaction drops running headers before truncating."""
+        pages = {
+            n: f"ENGLISH   PLUS 3\n\nLesson {n} about topic {n}\nPage {n} footer"
+            for n in range(1, 11)
+        }
+
+        text = service._prepare_text_content(pages, max_total_tokens=100)
+
+        assert "ENGLISH" not in text
+        assert "Lesson 7 about topic 7" in text
+        assert text.count("--- Page ") == 10
+
+    def test_truncation_keeps_every_page(self, service):
+        """Test that truncation shortens pages but keeps all of them."""
+        pages = {n: " ".join(f"word{n}x{i}" for i in range(300)) for n in range(1, 41)}
+
+        text = service._prepare_text_content(pages, max_total_tokens=2000)
+
+        for n in range(1, 41):
+            assert f"--- Page {n} ---\nword{n}x0" in text
+        assert "..." in text
+        assert _estimate_tokens(text) < _estimate_tokens(" ".join(pages.values()))
+
+
+# =============================================================================
+# Test Phase 1 Windows
+# =============================================================================
+
+
+class TestPageWindows:
+    """Tests for splitting long books into Phase 1 windows."""
+
+    def test_short_range_is_one_window(self):
+        """Test that a range within one window is not split."""
+        assert _page_windows(1, 50) == [(1, 50)]
+
+    def test_windows_overlap_and_cover_range(self):
+        """Test that windows overlap and end at the last page."""
+        windows = _page_windows(1, 300)
+
+        assert windows[0] == (1, PHASE1_WINDOW_PAGES)
+        assert windows[-1][1] == 300
+        for (_, prev_end), (start, _) in pairwise(windows):
+            assert prev_end - start + 1 == PHASE1_WINDOW_OVERLAP
+
+    def test_windows_start_at_first_page(self):
+        """Test that windows follow the book's own page numbering."""
+        assert _page_windows(5, 130)[0][0] == 5
+
+
+class TestSameModule:
+    """Tests for matching modules seen by adjacent windows."""
+
+    def test_unit_numbers_decide(self):
+        """Test that different unit numbers are different modules."""
+        assert not _same_module({"title": "Unit 10"}, {"title": "Unit 11"})
+        assert _same_module({"title": "Unit 3"}, {"title": "UNIT 3: Food"})
+
+    def test_similar_titles_without_numbers(self):
+        """Test title similarity when there are no numbers."""
+        assert _same_module({"title": "Animals"}, {"title": "animals"})
+        assert not _same_module({"title": "Animals"}, {"title": "Weather"})
+
+
+class TestMergeWindowModules:
+    """Tests for merging modules detected in overlapping windows."""
+
+    def test_same_module_merged_to_widest_range(self):
+        """Test that a module cut at a window edge is merged."""
+        merged = _merge_window_modules(
+            [
+                [{"title": "Unit 1", "start_page": 1, "end_page": 100}],
+                [{"title": "Unit 1", "start_page": 90, "end_page": 130}],
+            ]
+        )
+
+        assert len(merged) == 1
+        assert (merged[0]["start_page"], merged[0]["end_page"]) == (1, 130)
+
+    def test_overlap_between_modules_ends_earlier_one(self):
+        """Test that the earlier module ends where the next one starts."""
+        merged = _merge_window_modules(
+            [
+                [{"title": "Unit 1", "start_page": 1, "end_page": 110}],
+                [{"title": "Unit 2", "start_page": 101, "end_page": 200}],
+            ]
+        )
+
+        assert [(m["start_page"], m["end_page"]) for m in merged] == [
+            (1, 100),
+            (101, 200),
+        ]
+        assert [m["module_number"] for m in merged] == [1, 2]
+
+    def test_nested_module_splits_instead_of_dropping(self):
+        """Test that a nested module with another title is kept."""
+        merged = _merge_window_modules(
+            [
+                [{"title": "Unit 5", "start_page": 100, "end_page": 250}],
+                [{"title": "Unit 6", "start_page": 130, "end_page": 250}],
+            ]
+        )
+
+        assert [(m["title"], m["start_page"], m["end_page"]) for m in merged] == [
+            ("Unit 5", 100, 129),
+            ("Unit 6", 130, 250),
+        ]
+
+    def test_later_modules_trim_split_module(self):
+        """Test that modules after a split keep their own ranges."""
+        merged = _merge_window_modules(
+            [
+                [{"title": "Unit 5", "start_page": 100, "end_page": 250}],
+                [
+                    {"title": "Unit 6", "start_page": 130, "end_page": 180},
+                    {"title": "Unit 7", "start_page": 181, "end_page": 250},
+                ],
+            ]
+        )
+
+        assert [(m["start_page"], m["end_page"]) for m in merged] == [
+            (100, 129),
+            (130, 180),
+            (181, 250),
+        ]
+
+
+class TestClampModules:
+    """Tests for clamping window modules to the window's pages."""
+
+    def test_clamps_to_window(self):
+        """Test that page numbers beyond the window are clamped."""
+        clamped = _clamp_modules(
+            [{"title": "Unit 5", "start_page": 90, "end_page": 250}], 101, 220
+        )
+
+        assert (clamped[0]["start_page"], clamped[0]["end_page"]) == (101, 220)
+
+    def test_drops_modules_outside_window(self):
+        """Test that modules entirely outside the window are dropped."""
+        assert _clamp_modules([{"start_page": 230, "end_page": 250}], 101, 220) == []
+
+
+class TestWindowedPhase1:
+    """Tests for Phase 1 over page windows."""
+
+    @pytest.mark.asyncio
+    async def test_window_prompts_use_window_range(self, service, mock_llm_service):
+        """Test that each window sees its own range and results are clamped."""
+        prompt_ranges = []
+
+        async def fake_completion(prompt: str, **kwargs) -> str:
+            first, last = map(
+                int, re.search(r"Cover ALL pages from (\d+) to (\d+)", prompt).groups()
+            )
+            prompt_ranges.append((first, last))
+            # The model claims the module runs to the end of the book
+            module = {"title": f"Unit {first}", "start_page": first, "end_page": 250}
+            return json.dumps({"language": "en", "modules": [module]})
+
+        mock_llm_service.simple_completion.side_effect = fake_completion
+        pages = {page: f"Page {page} text about topic {page}" for page in range(1, 251)}
+
+        result = await service._phase1_detect_modules_windowed(pages, total_pages=250)
+
+        assert sorted(prompt_ranges) == _page_windows(1, 250)
+        assert [(m["start_page"], m["end_page"]) for m in result["modules"]] == [
+            (1, 100),
+            (101, 200),
+            (201, 250),
+        ]
+
+
+# =============================================================================
+# Test Response Cache
+# =============================================================================
+
+
+class TestResponseCache:
+    """Tests for caching parsed Phase 1 and Phase 2 responses."""
+
+    @pytest.fixture
+    def cached_service(self, service, mock_settings, mock_llm_service):
+        """Service with the response cache switched on."""
+        mock_settings.unified_analysis_cache_size = 8
+        mock_llm_service.simple_completion.side_effect = self.complete
+        return service
+
+    @staticmethod
+    async def complete(prompt: str, **kwargs) -> str:
+        if "Cover ALL pages" in prompt:
+            module = {"title": "Unit 1", "start_page": 1, "end_page": 4}
+            return json.dumps({"language": "en", "modules": [module]})
+        word = {"word": "apple", "definition": "a fruit", "translation": "elma"}
+        return json.dumps({"summary": "Fruit", "vocabulary": [word]})
+
+    @staticmethod
+    def phase2(service, module_text: str):
+        return service._phase2_extract_vocabulary(
+            module_title="Unit 1",
+            start_page=1,
+            end_page=4,
+            topics=["Food"],
+            difficulty_level="beginner",
+            module_text=module_text,
+        )
+
+    @pytest.mark.asyncio
+    async def test_phase1_hit_and_miss(self, cached_service, mock_llm_service):
+        """Test that Phase 1 only calls the LLM for text it has not seen."""
+        first = await cached_service._phase1_detect_modules("Book text", 4)
+        second = await cached_service._phase1_detect_modules("Book text", 4)
+        await cached_service._phase1_detect_modules("Other text", 4)
+
+        assert second == first
+        assert mock_llm_service.simple_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_phase2_hit_and_miss(self, cached_service, mock_llm_service):
+        """Test that Phase 2 only calls the LLM for modules it has not seen."""
+        first = await self.phase2(cached_service, "Apples are fruit")
+        second = await self.phase2(cached_service, "Apples are fruit")
+        await self.phase2(cached_service, "Pears are fruit")
+
+        assert second == first
+        assert mock_llm_service.simple_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_model_is_part_of_key(
+        self, cached_service, mock_settings, mock_llm_service
+    ):
+        """Test that switching the Phase 2 model misses the cache."""
+        await self.phase2(cached_service, "Apples are fruit")
+        mock_settings.unified_analysis_phase2_model = "deepseek-reasoner"
+        await self.phase2(cached_service, "Apples are fruit")
+
+        assert mock_llm_service.simple_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mutating_result_leaves_cache_intact(self, cached_service):
+        """Test that callers get copies, not the cached entry."""
+        first = await cached_service._phase1_detect_modules("Book text", 4)
+        first["modules"][0]["end_page"] = 99
+        first["modules"].append({"title": "Unit 2"})
+
+        hit = await cached_service._phase1_detect_modules("Book text", 4)
+        hit["modules"].clear()
+
+        again = await cached_service._phase1_detect_modules("Book text", 4)
+        assert again["modules"] == [{"title": "Unit 1", "start_page": 1, "end_page": 4}]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_calls_llm(self, service, mock_llm_service):
+        """Test that a cache size of 0 stores nothing."""
+        mock_llm_service.simple_completion.side_effect = self.complete
+
+        await self.phase2(service, "Apples are fruit")
+        await self.phase2(service, "Apples are fruit")
+
+        assert mock_llm_service.simple_completion.await_count == 2
+        assert not service._response_cache
+
+
+class FakeChunkedLLM:
+    """LLM stand-in for chunked analysis that can stall one module."""
+
+    def __init__(
+        self,
+        module_count: int,
+        pages_per_module: int,
+        delays: dict[str, float] | None = None,
+    ) -> None:
+        self.module_count = module_count
+        self.pages_per_module = pages_per_module
+        self.delays = delays or {}
+        self.phase1_calls = 0
+        self.phase2_titles: list[str] = []
+        self.phase2_finished: list[str] = []
+        self.stall_title: str | None = None
+        self.stalled = asyncio.Event()
+
+    async def complete(self, prompt: str, **kwargs) -> str:
+        if "Cover ALL pages" in prompt:
+            self.phase1_calls += 1
+            modules = [
+                {
+                    "title": f"Unit {n}",
+                    "start_page": (n - 1) * self.pages_per_module + 1,
+                    "end_page": n * self.pages_per_module,
+                }
+                for n in range(1, self.module_count + 1)
+            ]
+            return json.dumps({"language": "en", "modules": modules})
+
+        title = re.search(r"- Title: (.+)", prompt).group(1)
+        self.phase2_titles.append(title)
+        if title == self.stall_title:
+            self.stalled.set()
+            await asyncio.Event().wait()  # Until the run is cancelled
+        await asyncio.sleep(self.delays.get(title, 0))
+        self.phase2_finished.append(title)
+        word = {"word": f"word{title[-1]}", "definition": "d", "translation": "t"}
+        return json.dumps({"summary": title, "vocabulary": [word]})
+
+
+class TestChunkedResume:
+    """Tests for resuming an interrupted chunked analysis."""
+
+    @pytest.fixture
+    def chunked_service(self, service, mock_settings, mock_llm_service, tmp_path):
+        """Service saving resumable state, processing one module at a time."""
+        mock_settings.unified_analysis_state_dir = str(tmp_path)
+        mock_settings.unified_analysis_concurrency = 1
+        fake_llm = FakeChunkedLLM(module_count=4, pages_per_module=3)
+        mock_llm_service.simple_completion.side_effect = fake_llm.complete
+        service.fake_llm = fake_llm
+        return service
+
+    @staticmethod
+    def analyze(service, resume: bool = True):
+        pages = {page: f"Page {page} reading text" for page in range(1, 13)}
+        return service.analyze_book_chunked(
+            book_id="book-1",
+            publisher_id="pub-1",
+            book_name="Book",
+            pages=pages,
+            resume=resume,
+        )
+
+    async def interrupt_at(self, service, title: str) -> None:
+        """Start a run and cancel it once it reaches the given module."""
+        service.fake_llm.stall_title = title
+        task = asyncio.create_task(self.analyze(service))
+        await asyncio.wait_for(service.fake_llm.stalled.wait(), 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        service.fake_llm.stall_title = None
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_finished_modules(self, chunked_service, tmp_path):
+        """Test that a resumed run only extracts unfinished modules."""
+        fake_llm = chunked_service.fake_llm
+        await self.interrupt_at(chunked_service, "Unit 3")
+        fake_llm.phase2_titles.clear()
+
+        result = await self.analyze(chunked_service)
+
+        assert fake_llm.phase1_calls == 1
+        assert fake_llm.phase2_titles == ["Unit 3", "Unit 4"]
+        assert [m.module_id for m in result.modules] == [1, 2, 3, 4]
+        assert [m.summary for m in result.modules] == [
+            "Unit 1",
+            "Unit 2",
+            "Unit 3",
+            "Unit 4",
+        ]
+        assert len({m.extracted_at for m in result.modules}) == 1
+        assert [(m.start_page, m.end_page) for m in result.modules][-1] == (10, 12)
+        assert result.modules[1].text.startswith("--- Page 4 ---")
+        # A finished run leaves no state behind
+        assert not list(tmp_path.glob("*/*/*"))
+
+    @pytest.mark.asyncio
+    async def test_no_resume_discards_saved_state(self, chunked_service):
+        """Test that resume=False starts over but still saves progress."""
+        fake_llm = chunked_service.fake_llm
+        await self.interrupt_at(chunked_service, "Unit 3")
+        fake_llm.phase2_titles.clear()
+
+        # The fresh run is interrupted too; its own progress is still saved
+        fake_llm.stalled.clear()
+        fake_llm.stall_title = "Unit 2"
+        task = asyncio.create_task(self.analyze(chunked_service, resume=False))
+        await asyncio.wait_for(fake_llm.stalled.wait(), 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        fake_llm.stall_title = None
+
+        assert fake_llm.phase1_calls == 2
+        assert fake_llm.phase2_titles == ["Unit 1", "Unit 2"]
+
+        fake_llm.phase2_titles.clear()
+        await self.analyze(chunked_service)
+
+        assert fake_llm.phase1_calls == 2
+        assert fake_llm.phase2_titles == ["Unit 2", "Unit 3", "Unit 4"]
+
+    @pytest.mark.asyncio
+    async def test_stale_state_pruned(self, chunked_service, tmp_path):
+        """Test that state no run will resume is removed."""
+        old_text = tmp_path / "pub-1" / "book-1" / "0123456789abcdef"
+        abandoned = tmp_path / "pub-2" / "book-2" / "fedcba9876543210"
+        recent = tmp_path / "pub-3" / "book-3" / "aaaaaaaaaaaaaaaa"
+        for path in (old_text, abandoned, recent):
+            path.mkdir(parents=True)
+        week_ago = time.time() - 7 * 24 * 3600
+        os.utime(abandoned, (week_ago, week_ago))
+
+        await self.analyze(chunked_service)
+
+        assert not old_text.exists()
+        assert not abandoned.exists()
+        assert recent.exists()
+
+
+class TestChunkedAnalysis:
+    """Tests for Phase 2 of the chunked analysis."""
+
+    @pytest.mark.asyncio
+    async def test_short_module_skips_phase2(
+        self, service, mock_settings, mock_llm_service
+    ):
+        """Test that a module below min_module_chars makes no Phase 2 call."""
+        mock_settings.unified_analysis_min_module_chars = 100
+        fake_llm = FakeChunkedLLM(module_count=3, pages_per_module=3)
+        mock_llm_service.simple_completion.side_effect = fake_llm.complete
+        pages = {page: f"Page {page} " + "reading text " * 5 for page in range(1, 10)}
+        pages.update({4: "Unit 2", 5: "", 6: "4"})  # A divider between units
+
+        result = await service.analyze_book_chunked(
+            book_id="book-1", publisher_id="pub-1", book_name="Book", pages=pages
+        )
+
+        assert fake_llm.phase2_titles == ["Unit 1", "Unit 3"]
+        skipped = result.modules[1]
+        assert (skipped.module_id, skipped.title) == (2, "Unit 2")
+        assert (skipped.start_page, skipped.end_page) == (4, 6)
+        assert skipped.vocabulary == []
+        assert skipped.summary == ""
+
+    @pytest.mark.asyncio
+    async def test_modules_keep_order_when_finishing_out_of_order(
+        self, service, mock_settings, mock_llm_service
+    ):
+        """Test module order and progress when later modules finish first."""
+        mock_settings.unified_analysis_concurrency = 2
+        fake_llm = FakeChunkedLLM(
+            module_count=4,
+            pages_per_module=3,
+            delays={"Unit 1": 0.05, "Unit 2": 0.01},
+        )
+        mock_llm_service.simple_completion.side_effect = fake_llm.complete
+        pages = {page: f"Page {page} reading text" for page in range(1, 13)}
+        percents: list[int] = []
+
+        result = await service.analyze_book_chunked(
+            book_id="book-1",
+            publisher_id="pub-1",
+            book_name="Book",
+            pages=pages,
+            detailed_progress_callback=lambda p: percents.append(p.overall_percent),
+        )
+
+        # Unit 1 is still running when Units 2-4 are done
+        assert fake_llm.phase2_finished == ["Unit 2", "Unit 3", "Unit 4", "Unit 1"]
+        assert [m.module_id for m in result.modules] == [1, 2, 3, 4]
+        assert [m.summary for m in result.modules] == [
+            "Unit 1",
+            "Unit 2",
+            "Unit 3",
+            "Unit 4",
+        ]
+        # Modules 3 and 4 start after 1 and 2 modules have completed
+        assert percents == [5, 20, 20, 37, 55, 100]
+
+
+# =============================================================================
+# Test Storage
+# =============================================================================
+
+
+class TestSaveAll:
+    """Tests for saving unified analysis results."""
+
+    def test_vocabulary_counts_agree(self, storage_settings, analysis_result):
+        """Test that every reported vocabulary count skips repeated words."""
+        storage, uploaded = make_storage(storage_settings)
+
+        saved = storage.save_all(analysis_result)
+
+        vocab = json.loads(uploaded[saved["vocabulary"]])
+        assert analysis_result.total_vocabulary == 3
+        assert vocab["total_words"] == 3
+        assert saved["vocabulary_count"] == 3
+
+    def test_failed_module_upload_raises(self, storage_settings, analysis_result):
+        """Test that a failed module upload fails the save so the job retries."""
+
+        def put_object(bucket, path, data, length, content_type):
+            if path.endswith("module_2.json"):
+                raise OSError("connection reset")
+
+        storage, _ = make_storage(storage_settings, put_object)
+
+        with pytest.raises(UnifiedAnalysisStorageError) as exc_info:
+            storage.save_all(analysis_result)
+
+        assert [p.rsplit("/", 1)[-1] for p in exc_info.value.failed] == [
+            "module_2.json"
+        ]
+
+    def test_failed_bundle_upload_is_reported(self, storage_settings, analysis_result):
+        """Test that the optional bundle failing does not fail the save."""
+
+        def put_object(bucket, path, data, length, content_type):
+            if path.endswith("modules.tar"):
+                raise OSError("connection reset")
+
+        storage, _ = make_storage(storage_settings, put_object)
+
+        saved = storage.save_all(analysis_result)
+
+        assert saved["bundle"] is None
+        assert saved["module_count"] == 2
+        assert [p.rsplit("/", 1)[-1] for p in saved["failed"]] == ["modules.tar"]
+
+    def test_bundle_matches_module_uploads(self, storage_settings, analysis_result):
+        """Test that modules.tar holds the same bytes as the module files."""
+        storage, uploaded = make_storage(storage_settings)
+
+        saved = storage.save_all(analysis_result)
+
+        with tarfile.open(fileobj=BytesIO(uploaded[saved["bundle"]])) as tar:
+            bundled = {member.name: tar.extractfile(member).read() for member in tar}
+        assert sorted(bundled) == ["modules/module_1.json", "modules/module_2.json"]
+        for path in saved["modules"]:
+            name = "modules/" + path.rsplit("/", 1)[-1]
+            assert bundled[name] == uploaded[path]
+
+    def test_vocabulary_index_without_vocabulary_file(
+        self, storage_settings, analysis_result
+    ):
+        """Test that modules metadata points at module files instead."""
+        storage_settings.unified_analysis_write_vocabulary = False
+        storage, uploaded = make_storage(storage_settings)
+
+        saved = storage.save_all(analysis_result)
+
+        assert saved["vocabulary"] is None
+        assert not any(path.endswith("vocabulary.json") for path in uploaded)
+        metadata = json.loads(uploaded[saved["modules_metadata"]])
+        assert metadata["vocabulary_index"] == [
+            {"module_id": 1, "count": 2, "path": saved["modules"][0]},
+            {"module_id": 2, "count": 2, "path": saved["modules"][1]},
+        ]
+
+    @pytest.mark.parametrize(
+        ("id_format", "expected_ids"),
+        [
+            ("string", ["word_1", "word_2", "word_3"]),
+            ("int", [1, 2, 3]),
+            ("none", None),
+            ("uuid", ["word_1", "word_2", "word_3"]),  # Unknown falls back
+        ],
+    )
+    def test_vocabulary_id_formats(
+        self, storage_settings, analysis_result, id_format, expected_ids
+    ):
+        """Test the id written to vocabulary.json for each format."""
+        storage_settings.unified_analysis_vocab_id_format = id_format
+        storage, uploaded = make_storage(storage_settings)
+
+        saved = storage.save_all(analysis_result)
+
+        words = json.loads(uploaded[saved["vocabulary"]])["words"]
+        assert [w["word"] for w in words] == ["apple", "book", "chair"]
+        if expected_ids is None:
+            assert all("id" not in w for w in words)
+        else:
+            assert [w["id"] for w in words] == expected_ids
+
+    def test_pretty_and_compact_output_match(self, storage_settings, analysis_result):
+        """Test that pretty JSON only changes whitespace."""
+        storage, compact = make_storage(storage_settings)
+        storage.save_all(analysis_result)
+        storage_settings.unified_analysis_pretty_json = True
+        storage, pretty = make_storage(storage_settings)
+        storage.save_all(analysis_result)
+
+        json_paths = [path for path in compact if path.endswith(".json")]
+        assert json_paths
+        for path in json_paths:
+            assert pretty[path] != compact[path]
+            assert json.loads(pretty[path]) == json.loads(compact[path])
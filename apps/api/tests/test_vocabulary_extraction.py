@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -324,6 +325,17 @@ class TestPrompts:
         assert "A1" in prompt
         assert "20" in prompt
 
+    def test_build_vocabulary_extraction_prompt_module_title(self):
+        """Test that the module title is optional and used for topic context."""
+        prompt = build_vocabulary_extraction_prompt(
+            module_text="Animals live on the farm.",
+            module_title="Farm Animals",
+        )
+        assert 'topic "Farm Animals"' in prompt
+
+        untitled = build_vocabulary_extraction_prompt(module_text="Some text.")
+        assert "MODULE TITLE: Unknown" in untitled
+
     def test_build_vocabulary_extraction_prompt_truncation(self):
         """Test prompt truncation for long text."""
         long_text = "x" * 10000
@@ -368,6 +380,8 @@ class TestVocabularyExtractionService:
         settings.vocabulary_min_word_length = 3
         settings.vocabulary_temperature = 0.3
         settings.vocabulary_max_text_length = 8000
+        settings.vocabulary_cache_size = 0
+        settings.vocabulary_concurrency = 5
         return settings
 
     @pytest.fixture
@@ -432,6 +446,34 @@ class TestVocabularyExtractionService:
         assert result.words[0].translation == "güzel"
         assert result.words[1].word == "learn"
 
+    @pytest.mark.asyncio
+    async def test_extract_module_vocabulary_cached(
+        self, service, mock_settings, mock_llm_service
+    ):
+        """Test that a repeated module is served from the response cache."""
+        mock_settings.vocabulary_cache_size = 8
+        mock_llm_service.simple_completion.return_value = json.dumps(
+            [{"word": "garden", "translation": "bahçe"}]
+        )
+        module_text = """
+        The garden is full of flowers in spring.
+        We plant new flowers in the garden every year.
+        """
+
+        results = [
+            await service.extract_module_vocabulary(
+                module_id=1,
+                module_title="Unit 1",
+                module_text=module_text,
+                book_id="book-123",
+            )
+            for _ in range(2)
+        ]
+
+        mock_llm_service.simple_completion.assert_awaited_once()
+        assert [w.word for w in results[1].words] == ["garden"]
+        assert service.cache_stats == {"hits": 1, "misses": 1, "size": 1}
+
     @pytest.mark.asyncio
     async def test_extract_module_vocabulary_insufficient_text(self, service):
         """Test handling of insufficient text."""
@@ -494,6 +536,17 @@ class TestVocabularyExtractionService:
         assert result.success is True
         assert len(result.words) == 1
 
+    def test_parse_json_array_with_surrounding_text(self, service):
+        """Test that the array is decoded despite prose and brackets."""
+        response = (
+            'Here you go: [{"word": "bracket ]", "translation": "x"}]\n'
+            "Let me know if you need more [examples]."
+        )
+
+        parsed = service._parse_json_array_response(response, 1, "book-123")
+
+        assert parsed == [{"word": "bracket ]", "translation": "x"}]
+
     @pytest.mark.asyncio
     async def test_extract_module_vocabulary_llm_error(self, service, mock_llm_service):
         """Test handling of LLM provider error."""
@@ -694,6 +747,41 @@ class TestVocabularyExtractionService:
         assert progress_calls[0] == (1, 2)
         assert progress_calls[1] == (2, 2)
 
+    @pytest.mark.asyncio
+    async def test_extract_book_vocabulary_concurrent(
+        self, service, mock_settings, mock_llm_service
+    ):
+        """Test that modules run concurrently up to the limit, in order."""
+        mock_settings.vocabulary_concurrency = 2
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_completion(prompt: str, **kwargs) -> str:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            word = "alpha" if "Unit 1" in prompt else "beta"
+            return json.dumps([{"word": word, "translation": "test"}])
+
+        mock_llm_service.simple_completion.side_effect = fake_completion
+        modules = [
+            {"module_id": i, "title": f"Unit {i}", "text": "x" * 100}
+            for i in range(1, 5)
+        ]
+
+        result = await service.extract_book_vocabulary(
+            book_id="book-123",
+            publisher_id="pub-456",
+            book_name="Test Book",
+            modules=modules,
+        )
+
+        assert max_in_flight == 2
+        assert [r.module_id for r in result.module_results] == [1, 2, 3, 4]
+        assert [w.word for w in result.words] == ["alpha", "beta"]
+
     def test_deduplicate_vocabulary(self, service):
         """Test deduplication of vocabulary words."""
         words = [
@@ -729,6 +817,7 @@ class TestVocabularyStorage:
         """Create mock settings."""
         settings = MagicMock()
         settings.minio_publishers_bucket = "publishers"
+        settings.minio_upload_concurrency = 4
         return settings
 
     @pytest.fixture